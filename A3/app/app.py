@@ -1,112 +1,459 @@
 import os
-import sqlite3
 import datetime
-
-from azure.core.credentials import AzureKeyCredential
-from azure.ai.textanalytics import TextAnalyticsClient
+import heapq
+import re
+import time
 
 from flask import (
     Flask,
+    Response,
+    g,
+    jsonify,
     redirect,
     render_template,
     request,
     send_from_directory,
+    stream_with_context,
     url_for,
 )
 
 from flask_htmx import HTMX
 from flask_htmx import make_response
 
+import assets
+import metrics
+import profiling
+from compression import CompressionMiddleware
+from database import GroupCommitWriter, pool
+from events import KEEPALIVE as EVENTS_KEEPALIVE
+from events import Broadcaster, format_event
+from jobs import SentimentQueue, SentimentWorker, total_depth
+from retention import RETENTION_DAYS, Retention, RetentionWorker
+from sentiment import Sentiment, SentimentCache, analyze_documents
+from sentiment import breaker as sentiment_breaker
+from sentiment import warm_up as warm_up_sentiment
+from storage import CachedStorage, SQLiteStorage, open_storage
+
+PAGE_SIZE = int(os.environ.get("PAGE_SIZE", 50))
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = int(os.environ.get("STREAM_BATCH_SIZE", 500))
+SENTIMENT_LIMIT = int(os.environ.get("SENTIMENT_LIMIT", 10))
+# How often the index page asks /messages for new rows when it is served by
+# threaded gunicorn workers, where an /events stream would hold a thread.
+MESSAGES_POLL_INTERVAL = int(os.environ.get("MESSAGES_POLL_INTERVAL", 5))
+# Search ranks the newest SEARCH_WINDOW matches by relevance. A term found in
+# more than SEARCH_RANK_LIMIT messages makes bm25 itself expensive and says
+# little about relevance, so such searches list matches newest first instead.
+SEARCH_WINDOW = int(os.environ.get("SEARCH_WINDOW", 1000))
+SEARCH_RANK_LIMIT = int(os.environ.get("SEARCH_RANK_LIMIT", 20000))
+SEARCH_TERM = re.compile(r"(\w+)(\*?)")
+# Deeper pages make every shard read offset + limit rows; nobody scrolls there.
+MAX_SEARCH_OFFSET = 100000
+# /stats periods: bucket width and the key format of message_rollup.bucket.
+STATS_PERIODS = {
+    "hour": (datetime.timedelta(hours=1), "%Y-%m-%d %H"),
+    "day": (datetime.timedelta(days=1), "%Y-%m-%d"),
+}
+STATS_BUCKETS = {"hour": 24, "day": 30}
+ROLLUP_COLUMNS = ("messages", "analyzed", "positive", "neutral", "negative")
+MAX_STATS_BUCKETS = 366
+# Batch /hello inserts into shared transactions. Only pays off when a worker
+# serves requests concurrently (e.g. gunicorn --threads).
+GROUP_COMMIT = os.environ.get("GROUP_COMMIT", "0") == "1"
+# Message storage backend, see storage.py: sqlite, memory or sharded:N.
+STORAGE = os.environ.get("STORAGE", "sqlite")
+# Newest messages kept in each worker for /sentiment and the first pages of
+# /messages; 0 turns the cache off.
+RECENT_CACHE_SIZE = int(os.environ.get("RECENT_CACHE_SIZE", 200))
+
 app = Flask(__name__)
+app.wsgi_app = CompressionMiddleware(app.wsgi_app)
 htmx = HTMX(app)
+static_assets = assets.init_app(app)
+profiling.init_app(app)
+# Compiled once; every fragment response is a single macro call.
+fragments = app.jinja_env.get_template("fragments.html").module
 
 
 def get_db_connection():
-    conn = sqlite3.connect("database.db")
-    conn.row_factory = sqlite3.Row
-    return conn
+    return pool.get()
+
+
+def data_version():
+    return storage.version()
+
+
+def not_modified(etag):
+    """
+    A 304 response if the client already holds `etag`, otherwise None.
+    Checked before any rows are read.
+    """
+    if request.if_none_match.contains_weak(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag, weak=True)
+        return resp
+    return None
+
+
+def set_validator(resp, etag):
+    # no-cache: browsers and CDNs may store the fragment but must revalidate.
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+message_writer = GroupCommitWriter(
+    get_db_connection,
+    max_batch=int(os.environ.get("GROUP_COMMIT_SIZE", 64)),
+    max_delay=float(os.environ.get("GROUP_COMMIT_DELAY_MS", 2)) / 1000,
+)
+storage = open_storage(
+    STORAGE, SQLiteStorage(get_db_connection, message_writer if GROUP_COMMIT else None)
+)
+if RECENT_CACHE_SIZE and storage.databases:
+    storage = CachedStorage(storage, RECENT_CACHE_SIZE)
+sentiment_cache = SentimentCache(get_db_connection)
+broadcaster = Broadcaster(storage, fragments.row)
+# Each database file has its own sentiment queue and retention lease, but
+# one thread per process works through all of them.
+sentiment_queues = [SentimentQueue(connect) for connect in storage.databases]
+sentiment_worker = SentimentWorker(
+    sentiment_queues, lambda texts: sentiment_cache.analyze(texts, analyze_documents)
+)
+queue_collector = metrics.QueueCollector(lambda: total_depth(sentiment_queues))
+retention_worker = None
+if RETENTION_DAYS and storage.databases:
+    retention_worker = RetentionWorker(
+        [Retention(connect, RETENTION_DAYS) for connect in storage.databases]
+    )
+
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    pool.release()
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    metrics.REQUESTS_IN_FLIGHT.inc()
+
+
+@app.after_request
+def record_request(resp):
+    # Label by URL rule, not path, to keep the number of series bounded.
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.REQUEST_LATENCY.labels(request.method, route, resp.status_code).observe(
+        time.perf_counter() - g.request_start
+    )
+    return resp
+
+
+@app.teardown_request
+def end_request(exception):
+    # With stream_with_context this runs once the body has been streamed.
+    if "request_start" in g:
+        metrics.REQUESTS_IN_FLIGHT.dec()
 
 
 @app.route("/")
 def index():
-    return render_template("index.html")
+    return render_template(
+        "index.html", live_events=False, poll_interval=MESSAGES_POLL_INTERVAL
+    )
+
+
+def fetch_messages_page(before, limit):
+    """
+    A page of messages that carries on into message_archive once the hot
+    table is exhausted. Returns (messages, has_more, endpoint of the next page).
+    """
+    messages, has_more = storage.page(before, limit)
+    if has_more:
+        return messages, True, "message"
+    cold_before = messages[-1]["id"] if messages else before
+    archived, has_more = storage.page(cold_before, limit - len(messages), "message_archive")
+    return messages + archived, has_more, "archive"
+
+
+def fetch_newer(after, limit):
+    """Up to `limit` messages newer than `after`, newest first."""
+    return storage.since(after, limit)[::-1]
+
+
+def fetch_sentiments(limit):
+    """(text, Sentiment or None while pending) for the latest `limit` messages."""
+    results = []
+    for row in storage.recent(limit):
+        sentiment = None
+        if row["sentiment"] is not None:
+            sentiment = Sentiment(
+                row["sentiment"], row["positive"], row["neutral"], row["negative"]
+            )
+        results.append((row["text"], sentiment))
+    return results
+
+
+def search_terms(q):
+    """
+    FTS5 phrases for the words in `q`, quoted so user input is never parsed
+    as query syntax. `word*` and the last word (search as you type) match as
+    prefixes if they are at least two characters long, the shortest prefix
+    the index covers.
+    """
+    words = SEARCH_TERM.findall(q)
+    terms = []
+    for i, (word, star) in enumerate(words):
+        prefix = (star or i == len(words) - 1) and len(word) >= 2
+        terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return terms
+
+
+def is_common(conn, term):
+    row = conn.execute(
+        "SELECT COUNT(*) FROM"
+        " (SELECT rowid FROM message_fts WHERE message_fts MATCH ? LIMIT ?)",
+        (term, SEARCH_RANK_LIMIT + 1),
+    ).fetchone()
+    return row[0] > SEARCH_RANK_LIMIT
+
+
+def search_database(conn, query, ranked, offset, limit):
+    """
+    Matches in one database. Ranked, the newest SEARCH_WINDOW matches come
+    first by bm25 rank; the older ones follow newest first, with no rank.
+    """
+    if not ranked:
+        return conn.execute(
+            "SELECT m.* FROM message_fts f JOIN message m ON m.id = f.rowid"
+            " WHERE message_fts MATCH ? ORDER BY f.rowid DESC LIMIT ? OFFSET ?",
+            (query, limit, offset),
+        ).fetchall()
+
+    rows = conn.execute(
+        "SELECT m.*, hit.rank AS rank FROM (SELECT rowid, rank FROM message_fts"
+        "  WHERE message_fts MATCH ? ORDER BY rowid DESC LIMIT ?) hit"
+        " JOIN message m ON m.id = hit.rowid"
+        " ORDER BY hit.rank, hit.rowid DESC LIMIT ? OFFSET ?",
+        (query, SEARCH_WINDOW, limit, offset),
+    ).fetchall()
+    if len(rows) == limit:
+        return rows
+    count, oldest = conn.execute(
+        "SELECT COUNT(*), MIN(rowid) FROM (SELECT rowid FROM message_fts"
+        " WHERE message_fts MATCH ? ORDER BY rowid DESC LIMIT ?)",
+        (query, SEARCH_WINDOW),
+    ).fetchone()
+    if count < SEARCH_WINDOW:
+        return rows
+    return rows + conn.execute(
+        "SELECT m.*, NULL AS rank FROM message_fts f JOIN message m ON m.id = f.rowid"
+        " WHERE message_fts MATCH ? AND f.rowid < ? ORDER BY f.rowid DESC LIMIT ? OFFSET ?",
+        (query, oldest, limit - len(rows), max(0, offset - count)),
+    ).fetchall()
+
+
+def search_order(row):
+    # Ranked rows first, then the unranked older ones (see search_database).
+    return (row["rank"] is None, row["rank"] or 0, -row["id"])
+
+
+def search_messages(databases, terms, offset, limit):
+    """Up to `limit` matches from `offset` on, and whether more follow."""
+    query = " ".join(terms)
+    conns = [connect() for connect in databases]
+    ranked = not any(is_common(conn, term) for conn in conns for term in terms)
+    if len(conns) == 1:
+        messages = search_database(conns[0], query, ranked, offset, limit + 1)
+    else:
+        # Shards each return everything up to the end of the page; the page
+        # is cut from the merged results.
+        results = [search_database(conn, query, ranked, 0, offset + limit + 1) for conn in conns]
+        if ranked:
+            merged = heapq.merge(*results, key=search_order)
+        else:
+            merged = heapq.merge(*results, key=lambda row: row["id"], reverse=True)
+        messages = list(merged)[offset : offset + limit + 1]
+    return messages[:limit], len(messages) > limit
+
+
+def stats_buckets(period, end, count):
+    """Keys of the `count` buckets up to and including the one holding `end`."""
+    step, key = STATS_PERIODS[period]
+    return [(end - step * i).strftime(key) for i in reversed(range(count))]
+
+
+def fetch_stats(databases, period, buckets):
+    """
+    Message counts and average sentiment scores per bucket, read from
+    message_rollup with one primary key range scan per database. Buckets
+    without messages are filled with zeros; averages are None where nothing
+    was analyzed yet.
+    """
+    totals = {}
+    for connect in databases:
+        for row in connect().execute(
+            "SELECT * FROM message_rollup WHERE period = ? AND bucket BETWEEN ? AND ?",
+            (period, buckets[0], buckets[-1]),
+        ):
+            total = totals.setdefault(row["bucket"], dict.fromkeys(ROLLUP_COLUMNS, 0))
+            for column in ROLLUP_COLUMNS:
+                total[column] += row[column]
+    stats = []
+    for bucket in buckets:
+        total = totals.get(bucket) or dict.fromkeys(ROLLUP_COLUMNS, 0)
+        analyzed = total["analyzed"]
+        stats.append(
+            {
+                "bucket": bucket,
+                "messages": total["messages"],
+                "analyzed": analyzed,
+                **{
+                    score: round(total[score] / analyzed, 4) if analyzed else None
+                    for score in ("positive", "neutral", "negative")
+                },
+            }
+        )
+    return stats
 
 
 @app.route("/messages", methods=["GET"])
 def message():
-    conn = get_db_connection()
-    messages = conn.execute("SELECT * FROM message").fetchall()
-    conn.close()
-
-    tmpl = """
-    <tr>
-        <td>{}</td>
-        <td>{}</td>
-        <td>{}</td>
-    </tr>
-    """
-    body = [tmpl.format(m["person"], m["text"], m["created"]) for m in messages]
-    resp = "".join(body)
+    # Keyset pagination, newest first: each page ends with a row that fetches
+    # the next one once it scrolls into view. ?after= returns the rows newer
+    # than the top one instead, for the index page to poll.
+    before = request.args.get("before", type=int)
+    after = request.args.get("after", type=int)
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    etag = f"messages-{data_version()}"
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    if request.args.get("stream", type=int):
+        return set_validator(stream_messages(before), etag)
+
+    if after is not None:
+        resp = fragments.rows(fetch_newer(after, limit))
+        return set_validator(make_response(resp, push_url=False), etag)
+
+    messages, has_more, endpoint = fetch_messages_page(before, limit)
+
+    next_url = None
+    if has_more:
+        next_url = url_for(endpoint, before=messages[-1]["id"], limit=limit)
+    resp = fragments.rows(messages, next_url)
+
+    return set_validator(make_response(resp, push_url=False), etag)
+
+
+@app.route("/archive", methods=["GET"])
+def archive():
+    # Messages moved out of the hot table by retention.py, same paging as
+    # /messages. Reached by scrolling past the oldest hot message.
+    before = request.args.get("before", type=int)
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    etag = f"archive-{data_version()}"
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    messages, has_more = storage.page(before, limit, "message_archive")
+    next_url = None
+    if has_more:
+        next_url = url_for("archive", before=messages[-1]["id"], limit=limit)
+    resp = fragments.rows(messages, next_url)
+
+    return set_validator(make_response(resp, push_url=False), etag)
+
 
+@app.route("/search", methods=["GET"])
+def search():
+    q = request.args.get("q", "")
+    offset = max(0, request.args.get("offset", 0, type=int))
+    if offset > MAX_SEARCH_OFFSET:
+        return f"offset above {MAX_SEARCH_OFFSET}", 400
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    terms = search_terms(q)
+    if not terms:
+        return make_response(fragments.rows([], id_prefix="search-"), push_url=False)
+
+    etag = f"search-{data_version()}"
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    messages, has_more = search_messages(storage.databases, terms, offset, limit)
+    next_url = None
+    if has_more:
+        next_url = url_for("search", q=q, offset=offset + limit, limit=limit)
+    resp = fragments.rows(messages, next_url, id_prefix="search-")
+
+    return set_validator(make_response(resp, push_url=False), etag)
+
+
+@app.route("/stats", methods=["GET"])
+def stats():
+    # Activity and mood over time, from the rollups maintained by triggers on
+    # message, so the cost depends on the number of buckets, not messages.
+    period = request.args.get("period", "hour")
+    if period not in STATS_PERIODS:
+        return f"unknown period {period!r}", 400
+    count = request.args.get("limit", STATS_BUCKETS[period], type=int)
+    count = max(1, min(count, MAX_STATS_BUCKETS))
+    end = request.args.get("end", type=datetime.datetime.fromisoformat)
+    try:
+        buckets = stats_buckets(period, end or datetime.datetime.now(), count)
+    except OverflowError:
+        return "end too close to the start of the calendar", 400
+
+    # The newest bucket is part of the tag: without `end`, the window moves.
+    kind = "html" if htmx else "json"
+    etag = f"stats-{kind}-{data_version()}-{buckets[-1]}"
+    resp = not_modified(etag)
+    if resp is None:
+        results = fetch_stats(storage.databases, period, buckets)
+        if htmx:
+            resp = make_response(fragments.stats_chart(results), push_url=False)
+        else:
+            resp = jsonify(period=period, buckets=results)
+        set_validator(resp, etag)
+
+    # htmx gets table rows and everyone else JSON from the same URL.
+    resp.vary.add("HX-Request")
+    return resp
+
+
+def stream_messages(before=None):
+    # Export mode: walk the whole table in batches and send each one as soon
+    # as it is rendered, so memory stays flat however many rows match.
+    def generate():
+        for rows in storage.scan(before, STREAM_BATCH_SIZE):
+            yield fragments.rows(rows)
+
+    resp = Response(stream_with_context(generate()), mimetype="text/html")
     return make_response(resp, push_url=False)
 
 
 @app.route("/sentiment", methods=["GET"])
 def sentiment():
-    endpoint = os.environ["AZ_ENDPOINT"]
-    key = os.environ["AZ_KEY"]
+    # Sentiment is filled in by the background worker after /hello, so this
+    # is a plain read; messages still in the queue show up as pending.
+    etag = f"sentiment-{data_version()}"
+    cached = not_modified(etag)
+    if cached:
+        return cached
 
-    if endpoint and key:
-        client = TextAnalyticsClient(
-            endpoint=endpoint, credential=AzureKeyCredential(key)
-        )
+    results = fetch_sentiments(SENTIMENT_LIMIT)
+    resp = fragments.sentiment_modal(results)
 
-        conn = get_db_connection()
-        query = conn.execute("SELECT text FROM message LIMIT 10").fetchall()
-        conn.close()
-
-        messages = [m["text"] for m in query]
-        result = client.analyze_sentiment(messages)
-        docs = [doc for doc in result if not doc.is_error]
-
-        sentiments = ""
-        for idx, doc in enumerate(docs):
-            m = f'<div class="col-md-6"><i>{messages[idx]}</i></div>'
-            score = max(dict(doc.confidence_scores).values())
-            s = f'<div class="col-md-6"><b>{doc.sentiment.capitalize()} with {score} certainty</b></div>'
-            info = "".join([m, s])
-
-            sentiments = "".join([sentiments, '<div class="row">'])
-            sentiments = "".join([sentiments, info])
-            sentiments = "".join([sentiments, "</div>"])
-
-        tmpl = """
-        <div id="modal-backdrop" class="modal-backdrop fade show" style="display:block;"></div>
-        <div id="modal" class="modal fade show" tabindex="-1" style="display:block;">
-            <div class="modal-dialog modal-lg modal-dialog-centered modal-dialog-scrollable">
-            <div class="modal-content">
-                <div class="modal-header">
-                    <h5 class="modal-title">Sentiment analysis</h5>
-                </div>
-                <div class="modal-body">
-                    <div class="container-fluid">
-                        {}
-                    </div>
-                </div>
-                <div class="modal-footer">
-                    <button type="button" class="btn btn-secondary" onclick="closeModal()">Close</button>
-                </div>
-            </div>
-            </div>
-        </div>
-        """
-        resp = tmpl.format(sentiments)
-
-        return make_response(resp, push_url=False)
-
-    else:
-        print("error")
-        return None
+    return set_validator(make_response(resp, push_url=False), etag)
 
 
 @app.route("/hello", methods=["POST"])
@@ -118,20 +465,12 @@ def hello():
     if name and message:
         print(f"Request for hello page received with name={name} and message={message}")
 
-        conn = get_db_connection()
-        conn.execute(
-            f"INSERT INTO message (person, text, created) VALUES ('{name}', '{message}', '{timestamp}')"
-        )
-        conn.commit()
-        conn.close()
+        message_id = storage.append(name, message, timestamp)
+        broadcaster.notify()
 
-        resp = f"""
-        <tr>
-            <td>{name}</td>
-            <td>{message}</td>
-            <td>{timestamp}</td>
-        </tr>
-        """
+        resp = fragments.row(
+            {"id": message_id, "person": name, "text": message, "created": timestamp}
+        )
 
         return make_response(resp, push_url=False)
     else:
@@ -139,5 +478,88 @@ def hello():
         return None
 
 
+@app.route("/events", methods=["GET"])
+def events():
+    # Server-sent events: rows newer than the client's last seen id, first
+    # from the database, then as the shared broadcaster picks them up.
+    last_id = request.headers.get("Last-Event-ID", type=int)
+    if last_id is None:
+        last_id = request.args.get("after", type=int)
+
+    subscription = broadcaster.subscribe()
+    if last_id is None:
+        last_id = broadcaster.last_id()
+    backlog = broadcaster.since(last_id)
+
+    def generate():
+        cursor = last_id
+        try:
+            messages = backlog
+            # A client that was away for long is more than one batch behind;
+            # read on from the database until it has caught up.
+            while len(messages) == broadcaster.batch_size:
+                for message_id, html in messages:
+                    cursor = message_id
+                    yield format_event(message_id, html)
+                messages = broadcaster.since(cursor)
+            while messages is not None:
+                if not messages:
+                    yield ": keep-alive\n\n"
+                for message_id, html in messages:
+                    if message_id > cursor:
+                        cursor = message_id
+                        yield format_event(message_id, html)
+                messages = subscription.get(timeout=EVENTS_KEEPALIVE)
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    resp = Response(generate(), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+
+def queue_status():
+    """Jobs per state, and the circuit breaker state of this worker."""
+    return dict(total_depth(sentiment_queues), circuit=sentiment_breaker.state)
+
+
+@app.route("/queue", methods=["GET"])
+def queue_depth():
+    return queue_status()
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    body, content_type = metrics.render(queue_collector)
+    return Response(body, content_type=content_type)
+
+
+def warm_up():
+    """
+    Do the one-off work of a worker's first request ahead of it: open (and
+    if needed migrate) the database, compile the page template and connect
+    to TextAnalytics. gunicorn.conf.py calls this after every fork.
+    """
+    data_version()
+    app.jinja_env.get_template("index.html")
+    warm_up_sentiment()
+
+
+def start_sentiment_worker():
+    """Start this process's background worker if TextAnalytics is configured."""
+    if os.environ.get("AZ_ENDPOINT") and os.environ.get("AZ_KEY"):
+        if sentiment_queues and not sentiment_worker.is_alive():
+            sentiment_worker.start()
+
+
+def start_retention_worker():
+    """Start this process's retention thread if RETENTION_DAYS is set."""
+    if retention_worker and not retention_worker.is_alive():
+        retention_worker.start()
+
+
 if __name__ == "__main__":
+    start_sentiment_worker()
+    start_retention_worker()
     app.run()
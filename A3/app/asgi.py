@@ -0,0 +1,384 @@
+"""
+Async serving mode: the routes of app.py on an ASGI server, e.g.
+
+    uvicorn asgi:app --port 8000
+    gunicorn -w 3 -k uvicorn.workers.UvicornWorker asgi:app
+
+Database calls run on a thread pool (each thread keeps its pooled connection),
+so the event loop never waits on SQLite. TextAnalytics is called through the
+async client, so in-flight analyses cost no threads at all.
+"""
+import asyncio
+import contextlib
+import datetime
+import os
+import time
+from urllib.parse import parse_qs, urlencode
+
+from flask import render_template
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+from werkzeug.http import parse_etags
+
+import app as wsgi
+import assets
+import metrics
+import sentiment
+from compression import ASGICompressionMiddleware
+from database import pool
+from events import AsyncSubscription, format_event
+from jobs import SentimentWorker
+
+HTMX_HEADERS = {"HX-Push-Url": "false"}
+
+# The index page is static; render it once. Here it follows /events instead
+# of polling: an open stream is just a coroutine.
+with wsgi.app.test_request_context():
+    INDEX = render_template("index.html", live_events=True)
+
+
+def run(fn, *args):
+    return asyncio.to_thread(fn, *args)
+
+
+async def not_modified(request, etag):
+    if parse_etags(request.headers.get("if-none-match")).contains_weak(etag):
+        return Response(status_code=304, headers={"ETag": f'W/"{etag}"'})
+    return None
+
+
+def flag(request, name):
+    """Read like request.args.get(name, type=int) in app.py: 0 or junk is off."""
+    try:
+        return bool(int(request.query_params.get(name, 0)))
+    except ValueError:
+        return False
+
+
+def fragment(body, etag=None):
+    headers = dict(HTMX_HEADERS)
+    if etag:
+        headers["ETag"] = f'W/"{etag}"'
+        headers["Cache-Control"] = "no-cache"
+    return HTMLResponse(str(body), headers=headers)
+
+
+async def index(request):
+    return HTMLResponse(INDEX)
+
+
+async def messages(request):
+    try:
+        before = request.query_params.get("before")
+        before = None if before is None else int(before)
+        after = request.query_params.get("after")
+        after = None if after is None else int(after)
+        limit = int(request.query_params.get("limit", wsgi.PAGE_SIZE))
+    except ValueError:
+        return Response(status_code=400)
+    limit = max(1, min(limit, wsgi.MAX_PAGE_SIZE))
+
+    etag = f"messages-{await run(wsgi.data_version)}"
+    cached = await not_modified(request, etag)
+    if cached:
+        return cached
+
+    if flag(request, "stream"):
+        return StreamingResponse(
+            stream_messages(before),
+            media_type="text/html",
+            headers={**HTMX_HEADERS, "ETag": f'W/"{etag}"', "Cache-Control": "no-cache"},
+        )
+
+    if after is not None:
+        rows = await run(wsgi.fetch_newer, after, limit)
+        return fragment(wsgi.fragments.rows(rows), etag)
+
+    rows, has_more, endpoint = await run(
+        lambda: wsgi.fetch_messages_page(before, limit)
+    )
+    next_url = None
+    if has_more:
+        path = "/messages" if endpoint == "message" else "/archive"
+        next_url = f"{path}?before={rows[-1]['id']}&limit={limit}"
+    return fragment(wsgi.fragments.rows(rows, next_url), etag)
+
+
+async def archive(request):
+    try:
+        before = request.query_params.get("before")
+        before = None if before is None else int(before)
+        after = request.query_params.get("after")
+        after = None if after is None else int(after)
+        limit = int(request.query_params.get("limit", wsgi.PAGE_SIZE))
+    except ValueError:
+        return Response(status_code=400)
+    limit = max(1, min(limit, wsgi.MAX_PAGE_SIZE))
+
+    etag = f"archive-{await run(wsgi.data_version)}"
+    cached = await not_modified(request, etag)
+    if cached:
+        return cached
+
+    rows, has_more = await run(
+        lambda: wsgi.storage.page(before, limit, "message_archive")
+    )
+    next_url = None
+    if has_more:
+        next_url = f"/archive?before={rows[-1]['id']}&limit={limit}"
+    return fragment(wsgi.fragments.rows(rows, next_url), etag)
+
+
+async def search(request):
+    q = request.query_params.get("q", "")
+    try:
+        offset = max(0, int(request.query_params.get("offset", 0)))
+        limit = int(request.query_params.get("limit", wsgi.PAGE_SIZE))
+    except ValueError:
+        return Response(status_code=400)
+    if offset > wsgi.MAX_SEARCH_OFFSET:
+        return Response(f"offset above {wsgi.MAX_SEARCH_OFFSET}", status_code=400)
+    limit = max(1, min(limit, wsgi.MAX_PAGE_SIZE))
+
+    terms = wsgi.search_terms(q)
+    if not terms:
+        return fragment(wsgi.fragments.rows([], id_prefix="search-"))
+
+    etag = f"search-{await run(wsgi.data_version)}"
+    cached = await not_modified(request, etag)
+    if cached:
+        return cached
+
+    rows, has_more = await run(
+        lambda: wsgi.search_messages(wsgi.storage.databases, terms, offset, limit)
+    )
+    next_url = None
+    if has_more:
+        next_url = "/search?" + urlencode({"q": q, "offset": offset + limit, "limit": limit})
+    return fragment(wsgi.fragments.rows(rows, next_url, id_prefix="search-"), etag)
+
+
+async def asset(request):
+    found = wsgi.static_assets.resolve(
+        request.path_params["path"], request.headers.get("accept-encoding")
+    )
+    if found is None:
+        return Response(status_code=404)
+    path, content_type, encoding = found
+    headers = {"Cache-Control": assets.CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path, media_type=content_type, headers=headers)
+
+
+async def stats(request):
+    period = request.query_params.get("period", "hour")
+    if period not in wsgi.STATS_PERIODS:
+        return Response(f"unknown period {period!r}", status_code=400)
+    try:
+        count = int(request.query_params.get("limit", wsgi.STATS_BUCKETS[period]))
+        end = request.query_params.get("end")
+        end = datetime.datetime.fromisoformat(end) if end else datetime.datetime.now()
+    except ValueError:
+        return Response(status_code=400)
+    count = max(1, min(count, wsgi.MAX_STATS_BUCKETS))
+    try:
+        buckets = wsgi.stats_buckets(period, end, count)
+    except OverflowError:
+        return Response("end too close to the start of the calendar", status_code=400)
+
+    htmx = "hx-request" in request.headers
+    kind = "html" if htmx else "json"
+    etag = f"stats-{kind}-{await run(wsgi.data_version)}-{buckets[-1]}"
+    resp = await not_modified(request, etag)
+    if resp is None:
+        results = await run(lambda: wsgi.fetch_stats(wsgi.storage.databases, period, buckets))
+        if htmx:
+            resp = fragment(wsgi.fragments.stats_chart(results), etag)
+        else:
+            resp = JSONResponse(
+                {"period": period, "buckets": results},
+                headers={"ETag": f'W/"{etag}"', "Cache-Control": "no-cache"},
+            )
+    # htmx gets table rows and everyone else JSON from the same URL.
+    resp.headers["Vary"] = "HX-Request"
+    return resp
+
+
+async def stream_messages(before):
+    # Keyset batches rather than one long-lived cursor: consecutive batches
+    # may run on different pool threads.
+    while True:
+        rows, has_more = await run(
+            lambda: wsgi.storage.page(before, wsgi.STREAM_BATCH_SIZE)
+        )
+        if rows:
+            yield str(wsgi.fragments.rows(rows))
+        if not has_more:
+            break
+        before = rows[-1]["id"]
+
+
+async def sentiment_modal(request):
+    etag = f"sentiment-{await run(wsgi.data_version)}"
+    cached = await not_modified(request, etag)
+    if cached:
+        return cached
+
+    results = await run(wsgi.fetch_sentiments, wsgi.SENTIMENT_LIMIT)
+    return fragment(wsgi.fragments.sentiment_modal(results), etag)
+
+
+async def hello(request):
+    form = parse_qs((await request.body()).decode())
+    name = form.get("name", [None])[0]
+    message = form.get("message", [None])[0]
+    timestamp = str(datetime.datetime.now())
+
+    if not (name and message):
+        return Response(status_code=400)
+
+    message_id = await run(wsgi.storage.append, name, message, timestamp)
+    wsgi.broadcaster.notify()
+    row = {"id": message_id, "person": name, "text": message, "created": timestamp}
+    return fragment(wsgi.fragments.row(row))
+
+
+async def events(request):
+    last_id = request.headers.get("last-event-id") or request.query_params.get("after")
+    last_id = int(last_id) if last_id and last_id.isdigit() else None
+
+    subscription = AsyncSubscription(asyncio.get_running_loop())
+    await run(wsgi.broadcaster.subscribe, subscription)
+    if last_id is None:
+        last_id = await run(wsgi.broadcaster.last_id)
+    backlog = await run(wsgi.broadcaster.since, last_id)
+
+    async def generate():
+        cursor = last_id
+        try:
+            messages = backlog
+            # Catch up from the database first, however far behind (see app.py).
+            while len(messages) == wsgi.broadcaster.batch_size:
+                for message_id, html in messages:
+                    cursor = message_id
+                    yield format_event(message_id, html)
+                messages = await run(wsgi.broadcaster.since, cursor)
+            while messages is not None:
+                if not messages:
+                    yield ": keep-alive\n\n"
+                for message_id, html in messages:
+                    if message_id > cursor:
+                        cursor = message_id
+                        yield format_event(message_id, html)
+                messages = await subscription.get(timeout=wsgi.EVENTS_KEEPALIVE)
+        finally:
+            wsgi.broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def queue_depth(request):
+    return JSONResponse(await run(wsgi.queue_status))
+
+
+async def metrics_endpoint(request):
+    body, content_type = await run(metrics.render, wsgi.queue_collector)
+    return Response(body, headers={"Content-Type": content_type})
+
+
+class MetricsMiddleware:
+    """The request metrics app.py records in its before/after_request hooks."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # The router has put the matched endpoint into the scope by now.
+                route = ROUTES.get(scope.get("endpoint"), "unmatched")
+                metrics.REQUEST_LATENCY.labels(
+                    scope["method"], route, message["status"]
+                ).observe(time.perf_counter() - start)
+            await send(message)
+
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    loop = asyncio.get_running_loop()
+    workers = [wsgi.retention_worker] if wsgi.retention_worker else []
+    client = session = None
+
+    if os.environ.get("AZ_ENDPOINT") and os.environ.get("AZ_KEY"):
+        client, session = sentiment.create_async_client()
+
+        def analyze(texts):
+            # Runs on the worker thread; the HTTP calls run on the event loop.
+            return asyncio.run_coroutine_threadsafe(
+                sentiment.analyze_documents_async(client, texts), loop
+            ).result()
+
+        if wsgi.sentiment_queues:
+            workers.append(SentimentWorker(
+                wsgi.sentiment_queues,
+                lambda texts: wsgi.sentiment_cache.analyze(texts, analyze),
+            ))
+    for worker in workers:
+        worker.start()
+
+    yield
+
+    wsgi.broadcaster.close()
+    for worker in workers:
+        await run(worker.stop, 5)
+    if client is not None:
+        await client.close()
+        await session.close()
+    await run(wsgi.storage.close, 5)
+    pool.close_all()
+
+
+app = Starlette(
+    routes=[
+        Route("/", index),
+        Route("/messages", messages),
+        Route("/archive", archive),
+        Route("/search", search),
+        Route("/stats", stats),
+        Route("/sentiment", sentiment_modal),
+        Route("/hello", hello, methods=["POST"]),
+        Route("/events", events),
+        Route("/queue", queue_depth),
+        Route("/metrics", metrics_endpoint),
+        Route("/assets/{path:path}", asset),
+        Mount("/static", StaticFiles(directory="static"), name="static"),
+    ],
+    middleware=[Middleware(MetricsMiddleware), Middleware(ASGICompressionMiddleware)],
+    lifespan=lifespan,
+)
+ROUTES = {getattr(route, "endpoint", None) or route.app: route.path for route in app.routes}
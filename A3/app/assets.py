@@ -0,0 +1,87 @@
+"""
+Fingerprinted static assets, built by build_static.py into static/dist:
+
+    static/dist/manifest.json                   {"bootstrap/css/bootstrap.min.css":
+                                                 "bootstrap/css/bootstrap.min.3f2a9c1d0e4b.css"}
+    static/dist/bootstrap/css/bootstrap.min.3f2a9c1d0e4b.css
+    static/dist/bootstrap/css/bootstrap.min.3f2a9c1d0e4b.css.gz
+    static/dist/bootstrap/css/bootstrap.min.3f2a9c1d0e4b.css.br
+
+Templates link assets with asset_url(), which points at /assets/<hashed
+name> once the manifest exists and at the plain file under /static before
+the first build. A hashed name never changes content, so /assets answers
+with the best precompressed variant the client accepts and lets browsers
+keep it for a year without revalidating.
+"""
+import json
+import mimetypes
+import os
+
+from compression import negotiate
+
+DIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dist")
+MANIFEST = "manifest.json"
+MAX_AGE = 365 * 24 * 60 * 60
+CACHE_CONTROL = f"public, max-age={MAX_AGE}, immutable"
+# Preferred first when the client accepts both equally.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def load_manifest(directory=DIST_DIR):
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class Assets:
+    def __init__(self, directory=DIST_DIR):
+        self.directory = directory
+        self.manifest = load_manifest(directory)
+        self._hashed = set(self.manifest.values())
+
+    def url(self, filename):
+        hashed = self.manifest.get(filename)
+        if hashed is None:
+            return f"/static/{filename}"
+        return f"/assets/{hashed}"
+
+    def resolve(self, filename, accept_encoding):
+        """
+        (path, content type, encoding or None) of the file to send for
+        /assets/<filename>, or None if there is no such asset.
+        """
+        if filename not in self._hashed:
+            return None
+        path = os.path.join(self.directory, filename)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        present = [
+            encoding for encoding, suffix in ENCODINGS if os.path.exists(path + suffix)
+        ]
+        best = negotiate(accept_encoding, present)
+        if best is None:
+            return path, content_type, None
+        return path + dict(ENCODINGS)[best], content_type, best
+
+
+def init_app(app, directory=DIST_DIR):
+    from flask import abort, request, send_file
+
+    assets = Assets(directory)
+    app.jinja_env.globals["asset_url"] = assets.url
+
+    @app.route("/assets/<path:filename>", methods=["GET"])
+    def asset(filename):
+        found = assets.resolve(filename, request.headers.get("Accept-Encoding"))
+        if found is None:
+            abort(404)
+        path, content_type, encoding = found
+        resp = send_file(path, mimetype=content_type, max_age=MAX_AGE, conditional=True)
+        if encoding:
+            resp.headers["Content-Encoding"] = encoding
+        resp.headers["Cache-Control"] = CACHE_CONTROL
+        resp.vary.add("Accept-Encoding")
+        return resp
+
+    return assets
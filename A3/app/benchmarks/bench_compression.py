@@ -0,0 +1,110 @@
+"""
+Bytes on the wire and CPU time per response for gzip and brotli at several
+levels, on message tables and the sentiment modal as the app renders them.
+"stream" rows compress an export chunk by chunk, flushing after each batch
+like compression.py does for streamed responses.
+
+Run from A3/app:
+
+    python -m benchmarks.bench_compression --rows 10 50 500 --stream-rows 5000
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+import app as clco
+import compression
+from init_db import synthetic_rows
+from sentiment import Sentiment
+
+GZIP_LEVELS = [1, 6, 9]
+BROTLI_QUALITIES = [1, 4, 5, 11]
+
+
+def messages(count, rng):
+    rows = next(
+        synthetic_rows(count, datetime(2022, 1, 1), datetime(2023, 1, 1), count, rng=rng)
+    )
+    return [
+        {"id": 1000000 - i, "person": person, "text": text, "created": created}
+        for i, (person, text, created) in enumerate(rows)
+    ]
+
+
+def cpu_per_call(fn, min_time=0.2):
+    """CPU seconds per call of fn(), repeated for at least min_time."""
+    calls = 0
+    start = time.process_time()
+    while True:
+        result = fn()
+        calls += 1
+        elapsed = time.process_time() - start
+        if elapsed >= min_time:
+            return elapsed / calls, result
+
+
+def streamed(chunks, encoding, level):
+    def run():
+        if encoding == "br":
+            encoder = compression.StreamEncoder("br", brotli_quality=level)
+        else:
+            encoder = compression.StreamEncoder("gzip", gzip_level=level)
+        return sum(len(encoder.chunk(chunk)) for chunk in chunks) + len(encoder.finish())
+
+    return run
+
+
+def whole(body, encoding, level):
+    if encoding == "br":
+        return lambda: len(compression.compress(body, "br", brotli_quality=level))
+    return lambda: len(compression.compress(body, "gzip", gzip_level=level))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 50, 500])
+    parser.add_argument("--stream-rows", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    cases = []
+    for count in args.rows:
+        body = str(clco.fragments.rows(messages(count, rng))).encode()
+        cases.append((f"table {count}", [body]))
+    results = [(m["text"], Sentiment("positive", 0.9, 0.05, 0.05)) for m in messages(10, rng)]
+    cases.append(("modal", [str(clco.fragments.sentiment_modal(results)).encode()]))
+    if args.stream_rows:
+        export = messages(args.stream_rows, rng)
+        chunks = [
+            str(clco.fragments.rows(export[start : start + clco.STREAM_BATCH_SIZE])).encode()
+            for start in range(0, len(export), clco.STREAM_BATCH_SIZE)
+        ]
+        cases.append((f"stream {args.stream_rows}", chunks))
+
+    encodings = [("gzip", level) for level in GZIP_LEVELS]
+    if compression.brotli is not None:
+        encodings += [("br", quality) for quality in BROTLI_QUALITIES]
+    else:
+        print("brotli is not installed; gzip only")
+
+    print(f"{'response':<14}{'encoding':<10}{'bytes':>10}{'wire':>10}{'ratio':>8}"
+          f"{'cpu':>11}{'MB/s':>8}")
+    for name, chunks in cases:
+        raw = sum(map(len, chunks))
+        print(f"{name:<14}{'identity':<10}{raw:>10,}{raw:>10,}{1:>8.2f}{'-':>11}{'-':>8}")
+        for encoding, level in encodings:
+            if len(chunks) > 1:
+                fn = streamed(chunks, encoding, level)
+            else:
+                fn = whole(chunks[0], encoding, level)
+            cpu, size = cpu_per_call(fn)
+            print(
+                f"{'':<14}{f'{encoding} {level}':<10}{raw:>10,}{size:>10,}{raw / size:>8.2f}"
+                f"{cpu * 1e6:>9.0f}us{raw / cpu / 1e6:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Requests/sec for /messages and /hello with connect-per-request (before) and
+pooled WAL connections (after).
+
+Run from A3/app:
+
+    python -m benchmarks.bench_db --rows 500 --seconds 3
+"""
+import argparse
+import contextlib
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import mock
+
+from werkzeug.test import Client
+
+import app as clco
+from database import ConnectionPool
+from storage import SQLiteStorage
+
+
+def legacy_connection(path):
+    def get_db_connection():
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    return get_db_connection
+
+
+def make_db(path, rows):
+    conn = sqlite3.connect(path)
+    with open("db/schema.sql") as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+        [(f"person {i}", f"message number {i}", "2023-01-01 12:00:00") for i in range(rows)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def run(client, method, path, seconds, **kwargs):
+    count = 0
+    deadline = time.perf_counter() + seconds
+    # /hello logs every message with print()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        while time.perf_counter() < deadline:
+            resp = client.open(path, method=method, **kwargs)
+            assert resp.status_code == 200, resp.status
+            count += 1
+    return count / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    client = Client(clco.app)
+    form = {"name": "bench", "message": "hello"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for mode in ("before", "after"):
+            path = os.path.join(tmp, f"{mode}.db")
+            make_db(path, args.rows)
+
+            # The routes go through clco.storage, which was bound to the
+            # default pool on import; give each mode its own on the scratch
+            # database so database.db is never written.
+            pool = ConnectionPool(path)
+            if mode == "before":
+                storage = SQLiteStorage(legacy_connection(path))
+            else:
+                storage = SQLiteStorage(pool.get)
+
+            with mock.patch.object(clco, "storage", storage), mock.patch.object(clco, "pool", pool):
+                results[mode] = {
+                    "/messages": run(client, "GET", "/messages", args.seconds),
+                    "/hello": run(client, "POST", "/hello", args.seconds, data=form),
+                }
+            pool.close_all()
+
+    print(f"{'route':<12}{'before':>12}{'after':>12}{'speedup':>10}")
+    for route in ("/messages", "/hello"):
+        before, after = results["before"][route], results["after"][route]
+        print(f"{route:<12}{before:>10.0f}/s{after:>10.0f}/s{after / before:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Render time of the message table and sentiment modal: the str.format code the
+app used before versus the precompiled Jinja macros in templates/fragments.html.
+
+Run from A3/app:
+
+    python -m benchmarks.bench_render --sizes 1000 10000 100000
+"""
+import argparse
+import time
+
+import app as clco
+from sentiment import Sentiment
+
+ROW = """
+    <tr>
+        <td>{}</td>
+        <td>{}</td>
+        <td>{}</td>
+    </tr>
+    """
+
+MODAL = """
+    <div id="modal-backdrop" class="modal-backdrop fade show" style="display:block;"></div>
+    <div id="modal" class="modal fade show" tabindex="-1" style="display:block;">
+        <div class="modal-dialog modal-lg modal-dialog-centered modal-dialog-scrollable">
+        <div class="modal-content">
+            <div class="modal-header">
+                <h5 class="modal-title">Sentiment analysis</h5>
+            </div>
+            <div class="modal-body">
+                <div class="container-fluid">
+                    {}
+                </div>
+            </div>
+            <div class="modal-footer">
+                <button type="button" class="btn btn-secondary" onclick="closeModal()">Close</button>
+            </div>
+        </div>
+        </div>
+    </div>
+    """
+
+
+def legacy_table(messages):
+    body = [ROW.format(m["person"], m["text"], m["created"]) for m in messages]
+    return "".join(body)
+
+
+def legacy_modal(results):
+    sentiments = ""
+    for text, result in results:
+        m = f'<div class="col-md-6"><i>{text}</i></div>'
+        s = f'<div class="col-md-6"><b>{result.label.capitalize()} with {result.score} certainty</b></div>'
+        info = "".join([m, s])
+
+        sentiments = "".join([sentiments, '<div class="row">'])
+        sentiments = "".join([sentiments, info])
+        sentiments = "".join([sentiments, "</div>"])
+    return MODAL.format(sentiments)
+
+
+def timed(fn, arg, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=20000,
+        help="skip the quadratic legacy modal above this many rows",
+    )
+    args = parser.parse_args()
+
+    print(f"{'fragment':<10}{'rows':>8}{'before':>12}{'after':>12}{'speedup':>10}")
+    for size in args.sizes:
+        messages = [
+            {
+                "id": i,
+                "person": f"person {i}",
+                "text": f"message number {i} & <more>",
+                "created": "2023-01-01 12:00:00.000000",
+            }
+            for i in range(size)
+        ]
+        results = [(m["text"], Sentiment("positive", 0.9, 0.05, 0.05)) for m in messages]
+
+        cases = [
+            ("table", legacy_table, clco.fragments.rows, messages, True),
+            ("modal", legacy_modal, clco.fragments.sentiment_modal, results,
+             size <= args.legacy_limit),
+        ]
+        for name, before_fn, after_fn, data, run_before in cases:
+            after = timed(after_fn, data)
+            if run_before:
+                before = timed(before_fn, data)
+                print(
+                    f"{name:<10}{size:>8}{before * 1000:>10.1f}ms{after * 1000:>10.1f}ms"
+                    f"{before / after:>9.1f}x"
+                )
+            else:
+                print(f"{name:<10}{size:>8}{'skipped':>12}{after * 1000:>10.1f}ms{'':>10}")
+
+
+if __name__ == "__main__":
+    main()
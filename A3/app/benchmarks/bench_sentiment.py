@@ -0,0 +1,46 @@
+"""
+Documents/sec through sentiment.analyze_documents() against the local
+TextAnalytics emulator, with simulated service latency, throttling and
+per-document errors.
+
+Run from A3/app:
+
+    python -m benchmarks.bench_sentiment --documents 500 --latency lognormal:80:0.5
+"""
+import argparse
+import os
+import time
+
+import sentiment
+from emulator import Emulator, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--latency", default="lognormal:80:0.5")
+    parser.add_argument("--rate", type=float, help="emulator requests/sec before 429")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    emulator = Emulator(latency=args.latency, rate=args.rate, error_rate=args.error_rate)
+    server = serve(emulator)
+    os.environ["AZ_ENDPOINT"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["AZ_KEY"] = "local"
+
+    texts = [f"message number {i} is good" for i in range(args.documents)]
+    start = time.perf_counter()
+    results = sentiment.analyze_documents(texts)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    failed = sum(result is None for result in results)
+    print(f"{'documents':<12}{'seconds':>10}{'docs/s':>10}{'failed':>8}{'429s':>8}")
+    print(
+        f"{len(texts):<12}{elapsed:>10.2f}{len(texts) / elapsed:>10.0f}{failed:>8}"
+        f"{emulator.stats['throttled']:>8}"
+    )
+
+
+if __name__ == "__main__":
+    main()
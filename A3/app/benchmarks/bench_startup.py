@@ -0,0 +1,124 @@
+"""
+Import time of the app, from `python -X importtime` in fresh interpreters,
+with the slowest modules and any module that should only load on first use.
+
+Run from A3/app:
+
+    python -m benchmarks.bench_startup --output startup.json
+
+Compare against a saved report; the exit status is 1 when the median import
+time got worse by more than --threshold percent, or when one of the LAZY
+packages is imported with the app again:
+
+    python -m benchmarks.bench_startup --baseline startup.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks.loadtest import git_commit
+
+# Loaded on first use (sentiment.py, asgi.py), never by `import app`.
+LAZY = ("azure", "requests", "aiohttp", "starlette", "uvicorn", "httpx")
+TOP = 15
+
+
+def import_times(module):
+    """{module: (self us, cumulative us)} for one import in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def run(module, runs):
+    samples = [import_times(module) for _ in range(runs)]
+    total = [sample[module][1] / 1000 for sample in samples]
+
+    modules = {}
+    for sample in samples:
+        for name, (own, cumulative) in sample.items():
+            modules.setdefault(name, []).append((own, cumulative))
+    slowest = sorted(
+        (
+            {
+                "module": name,
+                "cumulative_ms": round(statistics.median(c for _, c in times) / 1000, 2),
+                "self_ms": round(statistics.median(s for s, _ in times) / 1000, 2),
+            }
+            for name, times in modules.items()
+            if name != module
+        ),
+        key=lambda row: row["cumulative_ms"],
+        reverse=True,
+    )
+
+    return {
+        "commit": git_commit(),
+        "module": module,
+        "runs": runs,
+        "import_ms": {
+            "median": round(statistics.median(total), 1),
+            "min": round(min(total), 1),
+        },
+        "modules": len(samples[0]),
+        "slowest": slowest[:TOP],
+        "eager": sorted(name for name in modules if name.split(".")[0] in LAZY),
+    }
+
+
+def compare(report, baseline, threshold):
+    """Print the change against a saved report; return the regressions."""
+    before, after = baseline["import_ms"]["median"], report["import_ms"]["median"]
+    print(f"import {report['module']}: {before}ms -> {after}ms,"
+          f" {baseline['modules']} -> {report['modules']} modules", file=sys.stderr)
+
+    regressions = []
+    if after > before * (1 + threshold / 100):
+        regressions.append(f"import time {before}ms -> {after}ms")
+    eager = sorted({name.split(".")[0] for name in report["eager"]})
+    if eager:
+        regressions.append(f"imported at startup: {', '.join(eager)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--module", default="app", help="default: app")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="JSON report of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="allowed regression against --baseline, in percent")
+    args = parser.parse_args()
+
+    report = run(args.module, args.runs)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
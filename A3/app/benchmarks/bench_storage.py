@@ -0,0 +1,94 @@
+"""
+Appends per second with several writer processes (like gunicorn workers),
+for the memory backend and SQLite split over 1, 2, 4 ... shards. Every
+append is its own transaction, as with /hello.
+
+Run from A3/app:
+
+    python -m benchmarks.bench_storage --processes 4 --shards 1 2 4 --seconds 3
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from database import PRAGMAS, ConnectionPool
+from storage import MemoryStorage, SQLiteStorage, ShardedStorage, shard_paths
+
+
+def create_shards(directory, count):
+    paths = shard_paths(os.path.join(directory, "database.db"), count)
+    for path in paths:
+        pool = ConnectionPool(path)
+        conn = pool.get()
+        with open("db/schema.sql") as f:
+            conn.executescript(f.read())
+        pool.close_all()
+    return paths
+
+
+def open_shards(paths, synchronous):
+    pools = [ConnectionPool(path, dict(PRAGMAS, synchronous=synchronous)) for path in paths]
+    if len(paths) == 1:
+        return SQLiteStorage(pools[0].get), pools
+    shards = [
+        SQLiteStorage(pool.get, stride=len(paths), offset=i) for i, pool in enumerate(pools)
+    ]
+    return ShardedStorage(shards), pools
+
+
+def writer(paths, synchronous, seconds, start, results):
+    storage, pools = open_shards(paths, synchronous) if paths else (MemoryStorage(), [])
+    start.wait()
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        storage.append(f"person {os.getpid()}", f"message {count}", str(time.time()))
+        count += 1
+    for pool in pools:
+        pool.close_all()
+    results.put(count)
+
+
+def run(paths, processes, seconds, synchronous):
+    start = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=writer, args=(paths, synchronous, seconds, start, results))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.5)
+    start.set()
+    total = sum(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+    return total / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--synchronous", default="normal",
+                        help="PRAGMA synchronous; full syncs on every commit")
+    parser.add_argument("--dir", help="where to create the shards (default: a temp dir)")
+    args = parser.parse_args()
+
+    # The memory backend is per process, so this is the ceiling of the loop itself.
+    rate = run(None, args.processes, args.seconds, args.synchronous)
+    print(f"{'memory':<12}{rate:>12,.0f} appends/s")
+    baseline = None
+    for count in args.shards:
+        with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+            paths = create_shards(directory, count)
+            rate = run(paths, args.processes, args.seconds, args.synchronous)
+        baseline = baseline or rate
+        print(f"{f'sqlite x{count}':<12}{rate:>12,.0f} appends/s{rate / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
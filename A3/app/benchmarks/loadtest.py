@@ -0,0 +1,281 @@
+"""
+HTTP load test against a running instance of the app. Simulated users run
+scenarios in a loop and the run is summarized as JSON: p50/p95/p99 latency,
+requests/sec and error rate, overall and per route.
+
+Start the app on a copy of the database and run from A3/app:
+
+    cp database.db /tmp/load.db
+    DB_PATH=/tmp/load.db gunicorn -b 127.0.0.1:8000 app:app &
+    python -m benchmarks.loadtest --users 20 --duration 30 --output before.json
+
+Compare a later run against a saved one; the exit status is 1 when p95 or
+the error rate got worse by more than --threshold percent:
+
+    python -m benchmarks.loadtest --baseline before.json
+
+Scenarios:
+
+    page_load   GET / with its static assets (fingerprinted ones only on the
+                first visit, like a browser cache), /messages, then the next page
+    post_burst  several /hello posts back to back
+    sentiment   open the sentiment modal, revalidating with If-None-Match
+    mixed       one of the above per iteration, weighted by MIX
+"""
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urljoin
+
+import requests
+
+MIX = {"page_load": 6, "sentiment": 3, "post_burst": 1}
+BURST = 5
+HTMX_HEADERS = {"HX-Request": "true"}
+
+ASSET = re.compile(r'(?:href|src)="(/(static|assets)/[^"]+)"')
+NEXT_PAGE = re.compile(r'hx-get="([^"]+)"')
+
+
+class User:
+    """One simulated browser: a keep-alive session and its ETag cache."""
+
+    def __init__(self, base_url, record, timeout):
+        self.base_url = base_url
+        self.record = record
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.etags = {}
+        self.cached = set()
+
+    def request(self, route, method, path, **kwargs):
+        headers = kwargs.pop("headers", {})
+        etag = self.etags.get(path)
+        if method == "GET" and etag:
+            headers["If-None-Match"] = etag
+
+        start = time.perf_counter()
+        try:
+            resp = self.session.request(
+                method,
+                urljoin(self.base_url, path),
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs,
+            )
+            resp.content
+        except requests.RequestException as e:
+            self.record(route, time.perf_counter() - start, type(e).__name__)
+            return None
+
+        self.record(route, time.perf_counter() - start, resp.status_code)
+        if resp.headers.get("ETag"):
+            self.etags[path] = resp.headers["ETag"]
+        return resp
+
+    def page_load(self):
+        resp = self.request("/", "GET", "/")
+        if resp is None or resp.status_code != 200:
+            return
+        for asset, kind in sorted(set(ASSET.findall(resp.text))):
+            if asset in self.cached:
+                continue
+            fetched = self.request(f"/{kind}", "GET", asset)
+            if fetched is not None and "immutable" in fetched.headers.get("Cache-Control", ""):
+                self.cached.add(asset)
+
+        resp = self.request("/messages", "GET", "/messages", headers=dict(HTMX_HEADERS))
+        if resp is None or resp.status_code != 200:
+            return
+        # Scroll far enough to reveal the second page.
+        next_page = NEXT_PAGE.search(resp.text)
+        if next_page:
+            self.request(
+                "/messages?before", "GET", next_page.group(1), headers=dict(HTMX_HEADERS)
+            )
+
+    def post_burst(self):
+        for i in range(BURST):
+            self.request(
+                "/hello",
+                "POST",
+                "/hello",
+                headers=dict(HTMX_HEADERS),
+                data={"name": "loadtest", "message": f"load test message {i}"},
+            )
+
+    def sentiment(self):
+        self.request("/sentiment", "GET", "/sentiment", headers=dict(HTMX_HEADERS))
+
+    def mixed(self):
+        scenario = random.choices(list(MIX), weights=list(MIX.values()))[0]
+        getattr(self, scenario)()
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, round(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, duration):
+    latencies = sorted(latency for latency, _ in samples)
+    errors = sum(1 for _, status in samples if not isinstance(status, int) or status >= 400)
+    ms = lambda value: None if value is None else round(value * 1000, 2)
+    return {
+        "requests": len(samples),
+        "rps": round(len(samples) / duration, 1),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(latencies[-1] if latencies else None),
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(base_url, scenario, users, duration, warmup, think, timeout):
+    samples = {}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+
+    def record(route, latency, status):
+        if time.perf_counter() - latency < measure_from:
+            return
+        with lock:
+            samples.setdefault(route, []).append((latency, status))
+
+    def loop():
+        user = User(base_url, record, timeout)
+        while time.perf_counter() < deadline:
+            getattr(user, scenario)()
+            if think:
+                time.sleep(random.expovariate(1 / think))
+        user.session.close()
+
+    threads = [threading.Thread(target=loop, daemon=True) for _ in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = min(duration, time.perf_counter() - measure_from)
+    report = {
+        "commit": git_commit(),
+        "url": base_url,
+        "scenario": scenario,
+        "users": users,
+        "duration": round(elapsed, 2),
+        "think": think,
+        **summarize([s for route in samples.values() for s in route], elapsed),
+        "routes": {
+            route: summarize(route_samples, elapsed)
+            for route, route_samples in sorted(samples.items())
+        },
+    }
+    return report
+
+
+def compare(report, baseline, threshold):
+    """Print the change against a saved report; return the regressions."""
+    regressions = []
+    rows = [("all", report, baseline)] + [
+        (route, stats, baseline["routes"][route])
+        for route, stats in report["routes"].items()
+        if route in baseline.get("routes", {})
+    ]
+
+    print(f"{'route':<18}{'p95 before':>12}{'p95 after':>12}{'rps before':>12}"
+          f"{'rps after':>12}{'errors':>10}", file=sys.stderr)
+    def ms(value):
+        # No p95 for a route that got no samples in one of the runs.
+        return f"{'-':>10}  " if value is None else f"{value:>10.1f}ms"
+
+    for route, now, then in rows:
+        before, after = then["latency_ms"]["p95"], now["latency_ms"]["p95"]
+        print(
+            f"{route:<18}{ms(before)}{ms(after)}{then['rps']:>12.1f}"
+            f"{now['rps']:>12.1f}{now['error_rate']:>10.2%}",
+            file=sys.stderr,
+        )
+        if None not in (before, after) and after > before * (1 + threshold / 100):
+            regressions.append(f"{route}: p95 {before}ms -> {after}ms")
+        if now["error_rate"] > then["error_rate"] + threshold / 100:
+            regressions.append(
+                f"{route}: error rate {then['error_rate']:.2%} -> {now['error_rate']:.2%}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--scenario", default="mixed", choices=["mixed", *MIX], help="default: mixed"
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds measured")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds not measured")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="mean pause between iterations per user, in seconds")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, help="fixed scenario order")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="JSON report of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="allowed regression against --baseline, in percent")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    report = run(
+        args.url.rstrip("/") + "/",
+        args.scenario,
+        args.users,
+        args.duration,
+        args.warmup,
+        args.think,
+        args.timeout,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Build the fingerprinted, precompressed copies of the static assets that
+assets.py serves under /assets:
+
+    python build_static.py
+
+Each file in ASSETS is copied to static/dist with a content hash in its
+name, next to .gz and .br variants where those are smaller (the .br files
+need the `brotli` package; without it they are skipped). The mapping from
+plain to hashed names goes to static/dist/manifest.json. Run it again
+after changing an asset; files no longer in the manifest are removed.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from assets import DIST_DIR, MANIFEST
+
+try:
+    import brotli
+except ImportError:  # only needed for the .br variants
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# Everything the templates link to.
+ASSETS = [
+    "bootstrap/css/bootstrap.min.css",
+    "images/logo.svg",
+    "vendor/htmx.min.js",
+    "vendor/ext/sse.js",
+]
+COMPRESSIBLE = (".css", ".js", ".svg", ".json", ".txt", ".html")
+# The maps are not shipped; drop the comment so devtools do not ask for one.
+SOURCE_MAP = re.compile(rb"\n?/[*/]# sourceMappingURL=\S+(?: \*/)?\s*$")
+HASH_LENGTH = 12
+
+
+def fingerprint(filename, content):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def variants(content):
+    """(suffix, bytes) of each compressed variant worth keeping."""
+    # mtime=0 keeps the output byte-for-byte reproducible.
+    found = [(".gz", gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        found.append((".br", brotli.compress(content, quality=11)))
+    return [(suffix, data) for suffix, data in found if len(data) < len(content)]
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def build(source=STATIC_DIR, target=DIST_DIR, assets=ASSETS):
+    """Write every asset and its variants; return the manifest."""
+    manifest = {}
+    written = {os.path.join(target, MANIFEST)}
+    for filename in assets:
+        with open(os.path.join(source, filename), "rb") as f:
+            content = SOURCE_MAP.sub(b"\n", f.read())
+        hashed = fingerprint(filename, content)
+        manifest[filename] = hashed
+
+        path = os.path.join(target, hashed)
+        write(path, content)
+        written.add(path)
+        if filename.endswith(COMPRESSIBLE):
+            for suffix, data in variants(content):
+                write(path + suffix, data)
+                written.add(path + suffix)
+
+    with open(os.path.join(target, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    # Hashed files of earlier builds.
+    for root, dirs, files in os.walk(target, topdown=False):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in written:
+                os.remove(path)
+        if root != target and not os.listdir(root):
+            shutil.rmtree(root)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build fingerprinted static assets.")
+    parser.add_argument("--source", default=STATIC_DIR)
+    parser.add_argument("--target", default=DIST_DIR)
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli is not installed; skipping .br variants")
+    manifest = build(args.source, args.target)
+    for filename, hashed in manifest.items():
+        path = os.path.join(args.target, hashed)
+        sizes = [
+            f"{suffix[1:]} {os.path.getsize(path + suffix):,}"
+            for suffix in (".br", ".gz")
+            if os.path.exists(path + suffix)
+        ]
+        print(f"{hashed}: {os.path.getsize(path):,} bytes" + "".join(f", {s}" for s in sizes))
+
+
+if __name__ == "__main__":
+    main()
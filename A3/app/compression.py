@@ -0,0 +1,293 @@
+"""
+gzip and brotli compression of dynamic responses, as WSGI middleware for
+app.py and ASGI middleware for asgi.py.
+
+The encoding is picked from Accept-Encoding (brotli when the `brotli`
+package is installed and the client takes both). Only text responses of at
+least COMPRESSION_MIN_SIZE bytes are compressed; already encoded responses
+(/assets), /events streams and `Cache-Control: no-transform` pass through.
+Bodies of known length are compressed in one piece. Streamed bodies are
+compressed chunk by chunk and flushed after every chunk, so each batch still
+reaches the client as soon as it is rendered.
+
+GZIP_LEVEL (1-9, default 6) and BROTLI_QUALITY (0-11, default 4) trade CPU
+for bytes; benchmarks/bench_compression.py shows both for this app's pages.
+"""
+import gzip
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+GZIP_LEVEL = int(os.environ.get("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.environ.get("BROTLI_QUALITY", 4))
+# Below about a kilobyte the saving is smaller than a TCP segment.
+MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+
+COMPRESSIBLE = {
+    "text/html",
+    "text/plain",
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+}
+
+
+def accepted(accept_encoding, encoding):
+    """Quality the Accept-Encoding header gives `encoding` (0 if refused)."""
+    quality = 0.0
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if name not in (encoding, "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == encoding:
+            return q
+        quality = q
+    return quality
+
+
+def available_encodings():
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding, encodings):
+    """The encoding in `encodings` the client prefers, earlier ones on ties."""
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = accepted(accept_encoding, encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding, gzip_level=GZIP_LEVEL, brotli_quality=BROTLI_QUALITY):
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class StreamEncoder:
+    """Compresses a body chunk by chunk; every chunk is flushed to the client."""
+
+    def __init__(self, encoding, gzip_level=GZIP_LEVEL, brotli_quality=BROTLI_QUALITY):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+            self._compress = self._compressor.process
+        else:
+            # wbits 31: deflate with a gzip header and trailer.
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+            self._compress = self._compressor.compress
+
+    def chunk(self, data):
+        return self._compress(data) + self._flush()
+
+    def finish(self):
+        return self._finish()
+
+
+def compressible(status, headers, min_size=MIN_SIZE):
+    """Whether a response with this status and (name, value) headers qualifies."""
+    if status < 200 or status in (204, 206, 304):
+        return False
+    values = {name.lower(): value for name, value in headers}
+    content_type = values.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in COMPRESSIBLE or "content-encoding" in values:
+        return False
+    if "no-transform" in values.get("cache-control", ""):
+        return False
+    length = values.get("content-length")
+    return length is None or int(length) >= min_size
+
+
+def encoded_headers(headers, encoding, length=None):
+    """`headers` for the compressed body: new length, encoding, Vary, weak ETag."""
+    result = []
+    vary = None
+    for name, value in headers:
+        lower = name.lower()
+        if lower == "content-length":
+            continue
+        if lower == "vary":
+            vary = value
+            continue
+        if lower == "etag" and not value.startswith("W/"):
+            # The bytes differ from the identity response.
+            value = f"W/{value}"
+        result.append((name, value))
+    if length is not None:
+        result.append(("Content-Length", str(length)))
+    result.append(("Content-Encoding", encoding))
+    if vary is None:
+        result.append(("Vary", "Accept-Encoding"))
+    elif "accept-encoding" not in vary.lower():
+        result.append(("Vary", f"{vary}, Accept-Encoding"))
+    else:
+        result.append(("Vary", vary))
+    return result
+
+
+class CompressionMiddleware:
+    """
+    WSGI middleware. Expects the app to call start_response before returning
+    its body, as Flask does; the write() callable is not supported.
+    """
+
+    def __init__(
+        self,
+        app,
+        min_size=MIN_SIZE,
+        gzip_level=GZIP_LEVEL,
+        brotli_quality=BROTLI_QUALITY,
+        encodings=None,
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = encodings or available_encodings()
+
+    def __call__(self, environ, start_response):
+        encoding = None
+        if environ.get("REQUEST_METHOD") != "HEAD":
+            encoding = negotiate(environ.get("HTTP_ACCEPT_ENCODING"), self.encodings)
+        if encoding is None:
+            return self.app(environ, start_response)
+
+        response = []
+
+        def capture(status, headers, exc_info=None):
+            response[:] = [status, headers]
+
+        body = self.app(environ, capture)
+        status, headers = response
+        if not compressible(int(status[:3]), headers, self.min_size):
+            start_response(status, headers)
+            return body
+        return self._compressed(body, status, headers, start_response, encoding)
+
+    def _compressed(self, body, status, headers, start_response, encoding):
+        try:
+            streamed = not any(name.lower() == "content-length" for name, _ in headers)
+            chunks = iter(body)
+            buffered, size = [], 0
+            for chunk in chunks:
+                buffered.append(chunk)
+                size += len(chunk)
+                if streamed and size >= self.min_size:
+                    break
+            else:
+                # The whole body is here (or a stream ended below min_size).
+                data = b"".join(buffered)
+                if size < self.min_size:
+                    start_response(status, headers)
+                    yield data
+                    return
+                data = compress(data, encoding, self.gzip_level, self.brotli_quality)
+                start_response(status, encoded_headers(headers, encoding, len(data)))
+                yield data
+                return
+
+            start_response(status, encoded_headers(headers, encoding))
+            encoder = StreamEncoder(encoding, self.gzip_level, self.brotli_quality)
+            yield encoder.chunk(b"".join(buffered))
+            for chunk in chunks:
+                if chunk:
+                    yield encoder.chunk(chunk)
+            yield encoder.finish()
+        finally:
+            close = getattr(body, "close", None)
+            if close is not None:
+                close()
+
+
+class ASGICompressionMiddleware:
+    """The same for asgi.py, on http.response.start/body messages."""
+
+    def __init__(
+        self,
+        app,
+        min_size=MIN_SIZE,
+        gzip_level=GZIP_LEVEL,
+        brotli_quality=BROTLI_QUALITY,
+        encodings=None,
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = encodings or available_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            return await self.app(scope, receive, send)
+        headers = {name.lower(): value for name, value in scope["headers"]}
+        encoding = negotiate(
+            headers.get(b"accept-encoding", b"").decode("latin-1"), self.encodings
+        )
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start = None
+        buffered, size = [], 0
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start, size, encoder
+            if message["type"] == "http.response.start":
+                raw = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in message["headers"]]
+                if compressible(message["status"], raw, self.min_size):
+                    start = dict(message, headers=raw)
+                    return
+                start = False
+            if message["type"] != "http.response.body" or not start:
+                return await send(message)
+
+            more = message.get("more_body", False)
+            if encoder is None:
+                buffered.append(message.get("body", b""))
+                size += len(buffered[-1])
+                if more and size < self.min_size:
+                    return
+                data = b"".join(buffered)
+                if not more:
+                    # Complete: one piece, or unchanged if it stayed small.
+                    if size < self.min_size:
+                        headers = start["headers"]
+                    else:
+                        data = compress(data, encoding, self.gzip_level, self.brotli_quality)
+                        headers = encoded_headers(start["headers"], encoding, len(data))
+                    await send(dict(start, headers=_raw(headers)))
+                    return await send({"type": "http.response.body", "body": data})
+
+                encoder = StreamEncoder(encoding, self.gzip_level, self.brotli_quality)
+                await send(dict(start, headers=_raw(encoded_headers(start["headers"], encoding))))
+                message = dict(message, body=data)
+
+            body = encoder.chunk(message.get("body", b""))
+            if not more:
+                body += encoder.finish()
+            await send({"type": "http.response.body", "body": body, "more_body": more})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _raw(headers):
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
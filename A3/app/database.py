@@ -0,0 +1,350 @@
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+
+import metrics
+
+DB_PATH = os.environ.get("DB_PATH", "database.db")
+
+# Applied to every new connection. WAL lets readers run alongside the single
+# writer. synchronous=NORMAL skips the fsync on commit: the database stays
+# consistent, but a power loss can undo the last commits. GroupCommitWriter
+# turns it back to FULL on its own connection.
+PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "busy_timeout": int(os.environ.get("DB_BUSY_TIMEOUT", 5000)),
+    "cache_size": int(os.environ.get("DB_CACHE_SIZE", -16000)),
+    "mmap_size": int(os.environ.get("DB_MMAP_SIZE", 256 * 1024 * 1024)),
+    "temp_store": "memory",
+}
+
+
+# Added to message tables created before these columns existed.
+MESSAGE_COLUMNS = {
+    "sentiment": "TEXT",
+    "positive": "REAL",
+    "neutral": "REAL",
+    "negative": "REAL",
+}
+
+# Rollup buckets, keyed by the leading characters of `created`
+# ("2023-01-31 14" for hours, "2023-01-31" for days), as in the
+# message_rollup triggers of db/schema.sql.
+ROLLUP_PERIODS = {"hour": 13, "day": 10}
+ROLLUP_UPSERT = """
+    ON CONFLICT (period, bucket) DO UPDATE SET
+        messages = messages + excluded.messages,
+        analyzed = analyzed + excluded.analyzed,
+        positive = positive + excluded.positive,
+        neutral = neutral + excluded.neutral,
+        negative = negative + excluded.negative
+"""
+
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db", "schema.sql")
+
+
+def schema_statements(path=SCHEMA_PATH):
+    """The statements of db/schema.sql one by one, trigger bodies kept whole."""
+    statements = []
+    statement = ""
+    with open(path) as f:
+        for line in f:
+            statement += line
+            if sqlite3.complete_statement(statement):
+                statements.append(statement.strip())
+                statement = ""
+    return statements
+
+
+def schema_objects(statements):
+    """{name: "table", "index" or "trigger"} for what `statements` create."""
+    objects = {}
+    for statement in statements:
+        match = re.search(
+            r"CREATE (?:VIRTUAL )?(TABLE|INDEX|TRIGGER) IF NOT EXISTS (\w+)", statement
+        )
+        if match:
+            objects[match.group(2)] = match.group(1).lower()
+    return objects
+
+
+# Idempotent, so migrate() runs them all on an existing database.
+CREATE_STATEMENTS = schema_statements()
+SCHEMA_OBJECTS = schema_objects(CREATE_STATEMENTS)
+# Dropping these drops their indexes and triggers too (see init_db.py).
+SCHEMA_TABLES = [name for name, type_ in SCHEMA_OBJECTS.items() if type_ == "table"]
+
+
+def backfill_rollups(conn, table="message", after_id=0):
+    """Add the rows of `table` with id > after_id to message_rollup."""
+    for period, length in ROLLUP_PERIODS.items():
+        conn.execute(
+            f"""
+            INSERT INTO message_rollup (period, bucket, messages, analyzed, positive, neutral, negative)
+            SELECT '{period}', substr(created, 1, {length}), COUNT(*), COUNT(sentiment),
+                   TOTAL(positive), TOTAL(neutral), TOTAL(negative)
+            FROM {table} WHERE id > ? GROUP BY 2
+            {ROLLUP_UPSERT}
+            """,
+            (after_id,),
+        )
+
+
+def migrate(conn):
+    """Bring an older database up to the current schema."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(message)")}
+    if not columns:
+        return
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    if MESSAGE_COLUMNS.keys() <= columns and SCHEMA_OBJECTS.keys() <= names:
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock; another worker may have won the race.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(message)")}
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        for name, type_ in MESSAGE_COLUMNS.items():
+            if name not in columns:
+                conn.execute(f"ALTER TABLE message ADD COLUMN {name} {type_}")
+        for statement in CREATE_STATEMENTS:
+            conn.execute(statement)
+        if "sentiment" not in columns:
+            # Queue every existing message for analysis.
+            conn.execute(
+                "INSERT INTO sentiment_job (message_id) SELECT id FROM message"
+            )
+        if "message_fts" not in names:
+            # Index the messages written before the index existed.
+            conn.execute("INSERT INTO message_fts (message_fts) VALUES ('rebuild')")
+        if "message_rollup" not in names:
+            backfill_rollups(conn, "message_archive")
+            backfill_rollups(conn)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+class TimedConnection(sqlite3.Connection):
+    """Records how long each statement takes in metrics.QUERY_LATENCY."""
+
+    def _observe(self, sql, start):
+        statement = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else "EMPTY"
+        metrics.QUERY_LATENCY.labels(statement).observe(time.perf_counter() - start)
+
+    def execute(self, sql, *args):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, *args)
+        finally:
+            self._observe(sql, start)
+
+    def executemany(self, sql, *args):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, *args)
+        finally:
+            self._observe(sql, start)
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            return super().commit()
+        finally:
+            metrics.QUERY_LATENCY.labels("COMMIT").observe(time.perf_counter() - start)
+
+
+class ConnectionPool:
+    """
+    Hands out one long-lived SQLite connection per thread.
+
+    Gunicorn forks its workers after the app is imported, so connections are
+    tracked per process id and never shared across a fork.
+    """
+
+    def __init__(self, path, pragmas=None):
+        self.path = path
+        self.pragmas = PRAGMAS if pragmas is None else pragmas
+        self._lock = threading.Lock()
+        self._migrated = False
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._connections = []
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            cached_statements=256,
+            factory=TimedConnection,
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        if not self._migrated:
+            migrate(conn)
+            self._migrated = True
+        return conn
+
+    def get(self):
+        if self._pid != os.getpid():
+            # Inherited from the parent process: drop without closing, the
+            # parent still owns these connections.
+            self._reset()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+            # inc/dec rather than set: every shard has a pool of its own.
+            metrics.CONNECTIONS.inc()
+        return conn
+
+    def release(self):
+        """Roll back whatever the current thread's request left open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and conn.in_transaction:
+            conn.rollback()
+
+    def close_all(self):
+        if self._pid != os.getpid():
+            return
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+        metrics.CONNECTIONS.dec(len(connections))
+        for conn in connections:
+            try:
+                # Refresh planner statistics; closing the last connection
+                # also checkpoints the WAL back into the main file.
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def __len__(self):
+        return len(self._connections)
+
+
+class GroupCommitWriter:
+    """
+    Funnels writes from every request thread through one writer thread that
+    commits them together, so a burst of inserts costs one transaction and
+    one WAL sync instead of one each.
+
+    The writer's connection runs with synchronous=FULL, unlike the NORMAL of
+    the other connections, so every commit is synced: submit() returns once
+    the transaction holding the write is durable.
+    Each write runs in its own savepoint: one failing write is rolled back and
+    re-raised in its caller without affecting the rest of the batch.
+    """
+
+    class _Write:
+        def __init__(self, fn, args):
+            self.fn = fn
+            self.args = args
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self, connect, max_batch=64, max_delay=0.002):
+        self.connect = connect
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _start(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.SimpleQueue()
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit", daemon=True
+                )
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def submit(self, fn, *args):
+        """Run fn(conn, *args) in the next batch and return its result."""
+        self._start()
+        write = self._Write(fn, args)
+        self._queue.put(write)
+        write.done.wait()
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                write = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if write is None:
+                self._queue.put(None)
+                break
+            batch.append(write)
+        return batch
+
+    def _run(self):
+        conn = self.connect()
+        conn.execute("PRAGMA synchronous = FULL")
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+            self._commit(conn, self._collect(first))
+
+    def _commit(self, conn, batch):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for write in batch:
+                conn.execute("SAVEPOINT write")
+                try:
+                    write.result = write.fn(conn, *write.args)
+                except Exception as e:
+                    write.error = e
+                    conn.execute("ROLLBACK TO write")
+                conn.execute("RELEASE write")
+            conn.commit()
+            self.batches += 1
+            self.writes += len(batch)
+            metrics.GROUP_COMMIT_BATCH.observe(len(batch))
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            for write in batch:
+                if write.error is None:
+                    write.error = e
+        finally:
+            for write in batch:
+                write.done.set()
+
+    def close(self, timeout=None):
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._pid = None
+
+
+pool = ConnectionPool(DB_PATH)
+atexit.register(pool.close_all)
@@ -1,8 +1,153 @@
-DROP TABLE IF EXISTS message;
+-- The whole schema. Every statement is idempotent: init_db.py runs it on an
+-- empty database and database.migrate() on an existing one, which only adds
+-- what is missing.
 
-CREATE TABLE message (
+CREATE TABLE IF NOT EXISTS message (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     created TIMESTAMP NOT NULL,
     person TEXT NOT NULL,
-    text TEXT NOT NULL
-)
+    text TEXT NOT NULL,
+    sentiment TEXT,
+    positive REAL,
+    neutral REAL,
+    negative REAL
+);
+
+-- Messages older than the retention window, moved here by retention.py.
+CREATE TABLE IF NOT EXISTS message_archive (
+    id INTEGER PRIMARY KEY,
+    created TIMESTAMP NOT NULL,
+    person TEXT NOT NULL,
+    text TEXT NOT NULL,
+    sentiment TEXT,
+    positive REAL,
+    neutral REAL,
+    negative REAL
+);
+
+CREATE TABLE IF NOT EXISTS sentiment_job (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    claimed_at REAL,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS sentiment_job_state ON sentiment_job (state, not_before);
+
+CREATE TABLE IF NOT EXISTS sentiment_cache (
+    key TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    positive REAL NOT NULL,
+    neutral REAL NOT NULL,
+    negative REAL NOT NULL,
+    created REAL NOT NULL
+);
+
+-- Background jobs that only one process may run at a time (retention.py)
+-- take a lease here and renew it while they keep running.
+CREATE TABLE IF NOT EXISTS lease (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+
+-- Bumped by the triggers below on every change to message; used as the
+-- validator for conditional GET requests.
+CREATE TABLE IF NOT EXISTS version (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO version (name, value) VALUES ('message', 0);
+
+CREATE TRIGGER IF NOT EXISTS message_version_insert AFTER INSERT ON message
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'message';
+END;
+
+CREATE TRIGGER IF NOT EXISTS message_version_update AFTER UPDATE ON message
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'message';
+END;
+
+CREATE TRIGGER IF NOT EXISTS message_version_delete AFTER DELETE ON message
+BEGIN
+    UPDATE version SET value = value + 1 WHERE name = 'message';
+END;
+
+-- Full-text index over message for /search. External content: the text is
+-- read from message, so the triggers below must keep the index in step.
+CREATE VIRTUAL TABLE IF NOT EXISTS message_fts USING fts5(
+    person, text, content='message', content_rowid='id', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS message_fts_insert AFTER INSERT ON message
+BEGIN
+    INSERT INTO message_fts (rowid, person, text) VALUES (new.id, new.person, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS message_fts_delete AFTER DELETE ON message
+BEGIN
+    INSERT INTO message_fts (message_fts, rowid, person, text)
+    VALUES ('delete', old.id, old.person, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS message_fts_update AFTER UPDATE OF person, text ON message
+BEGIN
+    INSERT INTO message_fts (message_fts, rowid, person, text)
+    VALUES ('delete', old.id, old.person, old.text);
+    INSERT INTO message_fts (rowid, person, text) VALUES (new.id, new.person, new.text);
+END;
+
+-- Message counts and sentiment score sums per hour ('2023-01-31 14') and day
+-- ('2023-01-31') for /stats. Kept current by the triggers below; deleting
+-- messages (e.g. archiving them) leaves the history alone.
+CREATE TABLE IF NOT EXISTS message_rollup (
+    period TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0,
+    analyzed INTEGER NOT NULL DEFAULT 0,
+    positive REAL NOT NULL DEFAULT 0,
+    neutral REAL NOT NULL DEFAULT 0,
+    negative REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (period, bucket)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS message_rollup_insert AFTER INSERT ON message
+BEGIN
+    INSERT INTO message_rollup (period, bucket, messages, analyzed, positive, neutral, negative)
+    VALUES ('hour', substr(new.created, 1, 13), 1, new.sentiment IS NOT NULL,
+            coalesce(new.positive, 0), coalesce(new.neutral, 0), coalesce(new.negative, 0)),
+           ('day', substr(new.created, 1, 10), 1, new.sentiment IS NOT NULL,
+            coalesce(new.positive, 0), coalesce(new.neutral, 0), coalesce(new.negative, 0))
+    ON CONFLICT (period, bucket) DO UPDATE SET
+        messages = messages + excluded.messages,
+        analyzed = analyzed + excluded.analyzed,
+        positive = positive + excluded.positive,
+        neutral = neutral + excluded.neutral,
+        negative = negative + excluded.negative;
+END;
+
+CREATE TRIGGER IF NOT EXISTS message_rollup_update AFTER UPDATE OF sentiment, positive, neutral, negative ON message
+BEGIN
+    INSERT INTO message_rollup (period, bucket, messages, analyzed, positive, neutral, negative)
+    VALUES ('hour', substr(new.created, 1, 13), 0,
+            (new.sentiment IS NOT NULL) - (old.sentiment IS NOT NULL),
+            coalesce(new.positive, 0) - coalesce(old.positive, 0),
+            coalesce(new.neutral, 0) - coalesce(old.neutral, 0),
+            coalesce(new.negative, 0) - coalesce(old.negative, 0)),
+           ('day', substr(new.created, 1, 10), 0,
+            (new.sentiment IS NOT NULL) - (old.sentiment IS NOT NULL),
+            coalesce(new.positive, 0) - coalesce(old.positive, 0),
+            coalesce(new.neutral, 0) - coalesce(old.neutral, 0),
+            coalesce(new.negative, 0) - coalesce(old.negative, 0))
+    ON CONFLICT (period, bucket) DO UPDATE SET
+        messages = messages + excluded.messages,
+        analyzed = analyzed + excluded.analyzed,
+        positive = positive + excluded.positive,
+        neutral = neutral + excluded.neutral,
+        negative = negative + excluded.negative;
+END;
@@ -0,0 +1,329 @@
+"""
+Local stand-in for the Azure TextAnalytics sentiment API, for benchmarks and
+tests without an Azure resource:
+
+    python emulator.py --port 5005 --latency lognormal:80:0.5 --rate 20
+    AZ_ENDPOINT=http://127.0.0.1:5005 AZ_KEY=local gunicorn app:app
+
+It answers the sentiment calls TextAnalyticsClient makes
+(POST /language/:analyze-text and, for api_version v3.x, POST
+/text/analytics/<version>/sentiment), scoring each text with a small word
+list. Latency, throttling (429 + Retry-After), per-document errors and the
+10-document limit are configurable. GET /emulator/stats returns counters.
+"""
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+MAX_DOCUMENTS = 10
+MODEL_VERSION = "2022-11-01"
+
+POSITIVE = {"good", "great", "love", "like", "nice", "happy", "awesome", "thanks", "cool"}
+NEGATIVE = {"bad", "hate", "awful", "sad", "terrible", "angry", "broken", "worst", "no"}
+WORD = re.compile(r"[a-z']+")
+
+
+def score(text):
+    """Deterministic (label, positive, neutral, negative) for a text."""
+    words = WORD.findall(text.lower())
+    pos = sum(word in POSITIVE for word in words)
+    neg = sum(word in NEGATIVE for word in words)
+    if pos == neg:
+        return "neutral", 0.1, 0.8, 0.1
+    if pos > neg:
+        return "positive", 0.9, 0.08, 0.02
+    return "negative", 0.02, 0.08, 0.9
+
+
+def parse_latency(spec):
+    """
+    Turn a latency spec into a function returning seconds:
+    `50` or `fixed:50`, `uniform:20:200`, `exp:80` (mean) or
+    `lognormal:80:0.5` (median and sigma). All values in milliseconds.
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    values = [float(v) for v in args.split(":")]
+
+    if kind == "fixed":
+        (ms,) = values
+        return lambda: ms / 1000
+    if kind == "uniform":
+        low, high = values
+        return lambda: random.uniform(low, high) / 1000
+    if kind == "exp":
+        (mean,) = values
+        return lambda: random.expovariate(1 / mean) / 1000 if mean else 0.0
+    if kind == "lognormal":
+        median, sigma = values
+        return lambda: random.lognormvariate(math.log(median), sigma) / 1000
+    raise ValueError(f"unknown latency distribution: {spec}")
+
+
+class TokenBucket:
+    """`rate` requests per second with bursts of up to `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Return 0 if a request may go ahead, else seconds until it may."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class Emulator:
+    def __init__(
+        self,
+        latency="0",
+        rate=None,
+        burst=None,
+        throttle=0.0,
+        retry_after=1,
+        error_rate=0.0,
+        max_documents=MAX_DOCUMENTS,
+        key=None,
+        seed=None,
+    ):
+        self.latency = parse_latency(latency)
+        self.bucket = TokenBucket(rate, burst or rate) if rate else None
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.max_documents = max_documents
+        self.key = key
+        self.random = random.Random(seed)
+        self.stats = dict.fromkeys(
+            ["requests", "documents", "throttled", "document_errors", "rejected"], 0
+        )
+        self._lock = threading.Lock()
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.stats[name] += n
+
+    def check_throttle(self):
+        """Seconds to put in Retry-After, or None to let the request through."""
+        if self.bucket:
+            wait = self.bucket.take()
+            if wait:
+                return max(1, math.ceil(wait))
+        with self._lock:
+            throttled = self.random.random() < self.throttle
+        return self.retry_after if throttled else None
+
+    def analyze(self, documents):
+        """Split documents into (results, errors) in the v3/2023 response shape."""
+        results, errors = [], []
+        for doc in documents:
+            with self._lock:
+                failed = self.random.random() < self.error_rate
+            if failed or not doc.get("text", "").strip():
+                self.count("document_errors")
+                errors.append(
+                    {
+                        "id": doc["id"],
+                        "error": {
+                            "code": "InvalidArgument",
+                            "message": "Invalid document in request.",
+                            "innererror": {
+                                "code": "InvalidDocument",
+                                "message": "Document text is empty or could not be analyzed.",
+                            },
+                        },
+                    }
+                )
+                continue
+
+            label, positive, neutral, negative = score(doc["text"])
+            scores = {"positive": positive, "neutral": neutral, "negative": negative}
+            results.append(
+                {
+                    "id": doc["id"],
+                    "sentiment": label,
+                    "confidenceScores": scores,
+                    "sentences": [
+                        {
+                            "text": doc["text"],
+                            "sentiment": label,
+                            "confidenceScores": scores,
+                            "offset": 0,
+                            "length": len(doc["text"]),
+                        }
+                    ],
+                    "warnings": [],
+                }
+            )
+        return results, errors
+
+
+def error_body(code, message, inner=None):
+    error = {"code": code, "message": message}
+    if inner:
+        error["innererror"] = {"code": inner, "message": message}
+    return {"error": error}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    emulator = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_HEAD(self):
+        # sentiment.warm_up() opens its connection with a HEAD request.
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if urlsplit(self.path).path == "/emulator/stats":
+            with self.emulator._lock:
+                stats = dict(self.emulator.stats)
+            self.send_json(200, stats)
+        else:
+            self.send_json(404, error_body("NotFound", "Resource not found."))
+
+    def do_POST(self):
+        emulator = self.emulator
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        path = urlsplit(self.path).path
+
+        language_api = path == "/language/:analyze-text"
+        if not (language_api or re.fullmatch(r"/text/analytics/v3\.[01]/sentiment", path)):
+            self.send_json(404, error_body("NotFound", "Resource not found."))
+            return
+
+        key = self.headers.get("Ocp-Apim-Subscription-Key")
+        if not key or (emulator.key and key != emulator.key):
+            self.send_json(
+                401,
+                error_body("401", "Access denied due to invalid subscription key."),
+            )
+            return
+
+        emulator.count("requests")
+        retry_after = emulator.check_throttle()
+        if retry_after is not None:
+            emulator.count("throttled")
+            self.send_json(
+                429,
+                error_body(
+                    "429", f"Rate limit is exceeded. Try again in {retry_after} seconds."
+                ),
+                {"Retry-After": retry_after},
+            )
+            return
+
+        try:
+            payload = json.loads(body)
+            documents = (
+                payload["analysisInput"]["documents"] if language_api else payload["documents"]
+            )
+        except (ValueError, KeyError, TypeError):
+            emulator.count("rejected")
+            self.send_json(
+                400,
+                error_body("InvalidRequest", "Invalid request body.", "InvalidRequestBodyFormat"),
+            )
+            return
+        if len(documents) > emulator.max_documents:
+            emulator.count("rejected")
+            self.send_json(
+                400,
+                error_body(
+                    "InvalidArgument",
+                    f"Batch request contains too many records. Max {emulator.max_documents}"
+                    " records are permitted.",
+                    "InvalidDocumentBatch",
+                ),
+            )
+            return
+
+        time.sleep(emulator.latency())
+        emulator.count("documents", len(documents))
+        results, errors = emulator.analyze(documents)
+        results = {"documents": results, "errors": errors, "modelVersion": MODEL_VERSION}
+        if language_api:
+            results = {"kind": "SentimentAnalysisResults", "results": results}
+        self.send_json(200, results)
+
+
+def serve(emulator, host="127.0.0.1", port=0):
+    """Start serving on a background thread; port 0 picks a free port."""
+    handler = type("EmulatorHandler", (Handler,), {"emulator": emulator})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="emulator", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5005)
+    parser.add_argument("--latency", default="0",
+                        help="fixed:MS, uniform:LO:HI, exp:MEAN or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--rate", type=float, help="requests/sec before answering 429")
+    parser.add_argument("--burst", type=float, help="bucket size for --rate (default: rate)")
+    parser.add_argument("--throttle", type=float, default=0.0,
+                        help="probability of answering 429 regardless of --rate")
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After seconds sent with --throttle")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="probability of a per-document error")
+    parser.add_argument("--max-documents", type=int, default=MAX_DOCUMENTS)
+    parser.add_argument("--key", help="require this subscription key")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    emulator = Emulator(
+        latency=args.latency,
+        rate=args.rate,
+        burst=args.burst,
+        throttle=args.throttle,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        max_documents=args.max_documents,
+        key=args.key,
+        seed=args.seed,
+    )
+    server = serve(emulator, args.host, args.port)
+    print(f"TextAnalytics emulator on http://{args.host}:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import queue
+import threading
+
+import metrics
+
+POLL_INTERVAL = float(os.environ.get("EVENTS_POLL_INTERVAL", 1.0))
+KEEPALIVE = float(os.environ.get("EVENTS_KEEPALIVE", 15.0))
+# Subscribers that fall this many polls behind are disconnected; the browser
+# reconnects with Last-Event-ID and catches up from the database.
+MAX_BACKLOG = 100
+MAX_ROWS = 500
+
+
+def format_event(message_id, html, event="message"):
+    data = "".join(f"data: {line}\n" for line in html.splitlines() if line.strip())
+    return f"id: {message_id}\nevent: {event}\n{data}\n"
+
+
+class Subscription:
+    def __init__(self):
+        self.queue = queue.Queue(MAX_BACKLOG)
+        self.closed = False
+
+    def put(self, messages):
+        """Called from the broadcaster thread; raises queue.Full if behind."""
+        self.queue.put_nowait(messages)
+
+    def get(self, timeout=None):
+        """Next list of (id, html) pairs, [] on timeout, or None once closed."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None if self.closed else []
+
+
+class AsyncSubscription:
+    """A Subscription read from an asyncio event loop (see asgi.py)."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(MAX_BACKLOG)
+        self.closed = False
+
+    def put(self, messages):
+        if self.queue.full():
+            raise queue.Full
+        self.loop.call_soon_threadsafe(self._put, messages)
+
+    def _put(self, messages):
+        try:
+            self.queue.put_nowait(messages)
+        except asyncio.QueueFull:
+            self.closed = True
+
+    async def get(self, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None if self.closed else []
+
+
+class Broadcaster:
+    """
+    A single thread per worker polls for new messages and hands each batch,
+    rendered once, to every subscriber. The database sees one query per poll
+    interval no matter how many clients are connected.
+    """
+
+    def __init__(self, storage, render, poll_interval=POLL_INTERVAL, batch_size=MAX_ROWS):
+        self.storage = storage
+        self.render = render
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pid = None
+        self._last_id = None
+        self._closed = False
+
+    def _start(self):
+        if self._pid != os.getpid():
+            self._subscribers = set()
+            self._last_id = None
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run, name="events", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def subscribe(self, subscription=None):
+        if subscription is None:
+            subscription = Subscription()
+        with self._lock:
+            self._start()
+            if self._last_id is None:
+                # Everything after this point is broadcast; callers catch up
+                # on anything older themselves.
+                self._last_id = self.last_id()
+            self._subscribers.add(subscription)
+            metrics.SSE_SUBSCRIBERS.set(len(self._subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+            metrics.SSE_SUBSCRIBERS.set(len(self._subscribers))
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def notify(self):
+        """Poll right away instead of at the next interval."""
+        self._wake.set()
+
+    def last_id(self):
+        return self.storage.last_id()
+
+    def since(self, last_id):
+        """Up to batch_size (id, html) pairs newer than `last_id`."""
+        rows = self.storage.since(last_id, self.batch_size)
+        return [(row["id"], self.render(row)) for row in rows]
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            with self._lock:
+                if not self._subscribers:
+                    # Nobody listening: skip the query and resync on subscribe.
+                    self._last_id = None
+                    continue
+                last_id = self._last_id
+
+            try:
+                messages = self.since(last_id)
+            except Exception as e:
+                print(f"events poll failed: {e}")
+                continue
+            if not messages:
+                continue
+
+            with self._lock:
+                self._last_id = messages[-1][0]
+                subscribers = list(self._subscribers)
+            for subscription in subscribers:
+                try:
+                    subscription.put(messages)
+                except queue.Full:
+                    subscription.closed = True
+                    self.unsubscribe(subscription)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for subscription in self._subscribers:
+                subscription.closed = True
+            self._subscribers = set()
+            metrics.SSE_SUBSCRIBERS.set(0)
+        self._wake.set()
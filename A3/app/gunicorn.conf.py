@@ -0,0 +1,92 @@
+# Picked up automatically by gunicorn from the working directory; bind address
+# and worker count stay on the command line in Pulumi.yaml.
+import glob
+import os
+import shutil
+import tempfile
+
+# Workers write their metrics to files in this directory and /metrics merges
+# them. It has to be set before any worker imports prometheus_client.
+if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="clco-metrics-")
+    metrics_dir_owned = True
+else:
+    metrics_dir_owned = False
+
+# Threaded workers, so a slow client or an /events stream does not hold a
+# whole worker or trip the worker timeout. The index page polls rather than
+# keeping a stream open here (see index.html); asgi.py serves the streams.
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Import the app once in the master and fork workers from it, instead of
+# every worker importing it on its own. Code changes then need a restart
+# rather than `kill -HUP`; GUNICORN_PRELOAD=0 turns this off.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+
+def is_asgi(worker):
+    # asgi.py starts and stops its own background work in its lifespan.
+    return "uvicorn" in worker.cfg.worker_class_str.lower()
+
+
+def on_starting(server):
+    # Samples left over from an earlier run would be added to this one's.
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, "*.db")):
+        os.remove(path)
+
+    if server.cfg.preload_app and os.environ.get("AZ_ENDPOINT"):
+        # sentiment.py imports the SDK on first use. Load it once here so
+        # that workers inherit it instead of each importing it after the fork.
+        import azure.ai.textanalytics
+        import requests
+
+
+def on_exit(server):
+    if metrics_dir_owned:
+        shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+
+
+def child_exit(server, worker):
+    # Drops the live gauges (in-flight requests, connections) of a dead worker.
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # Database connections and sockets do not survive a fork, so they are
+    # opened here, in the worker, before it accepts its first request.
+    if is_asgi(worker):
+        return
+
+    import app
+
+    try:
+        app.warm_up()
+    except Exception as e:
+        print(f"warm-up failed: {e}")
+
+
+def post_worker_init(worker):
+    import app
+
+    if not is_asgi(worker):
+        app.start_sentiment_worker()
+        app.start_retention_worker()
+
+
+def worker_exit(server, worker):
+    if is_asgi(worker):
+        return
+
+    import app
+    from database import pool
+
+    app.broadcaster.close()
+    app.sentiment_worker.stop(timeout=5)
+    if app.retention_worker:
+        app.retention_worker.stop(timeout=5)
+    app.storage.close(timeout=5)
+    pool.close_all()
@@ -1,7 +1,38 @@
+"""
+Create the database from db/schema.sql and seed it.
+
+    python init_db.py                      # the four example messages
+    python init_db.py --rows 1000000       # plus a million synthetic ones
+    python init_db.py --rows 1000000 --append --db /tmp/big.db
+    python init_db.py --shards 4           # plus empty database-1.db ... database-3.db
+"""
+import argparse
+import os
+import random
 import sqlite3
+import time
 from random import randrange
 from datetime import timedelta, datetime
 
+from database import SCHEMA_PATH, SCHEMA_TABLES, backfill_rollups
+from storage import shard_paths
+
+FIRST_NAMES = [
+    "Tom", "Peter", "Max", "Robert", "Anna", "Lisa", "Julia", "Paul", "Lukas", "Sarah",
+    "Laura", "David", "Felix", "Lena", "Jonas", "Marie", "Elias", "Sophie", "Jakob", "Emma",
+    "Leon", "Hannah", "Daniel", "Clara", "Simon", "Nina", "Florian", "Eva", "Stefan", "Mia",
+]
+# Roughly by frequency in short chat messages; sampled with Zipf weights.
+WORDS = (
+    "the I you to a and is it this of in that for on my me not so just what"
+    " with be have are was do at like can all we but no your good really how"
+    " get one love great about up out now today think know time new thanks"
+    " hello world pizza coffee cloud azure deploy server app works again why"
+    " bad nice happy sad broken awesome terrible fun lol ok yes maybe tomorrow"
+    " week weekend exam lecture course homework friday monday code bug fixed"
+).split()
+PUNCTUATION = ["", "", "", ".", "!", "?", "!!", " :)", " :("]
+
 
 def random_date(start, end):
     """
@@ -17,30 +48,180 @@ def random_date(start, end):
 d1 = datetime.strptime("1/1/2022 1:30 PM", "%m/%d/%Y %I:%M %p")
 d2 = datetime.strptime("1/1/2023 4:50 AM", "%m/%d/%Y %I:%M %p")
 
-timestamp1 = random_date(d1, d2)
-timestamp2 = random_date(d1, d2)
-timestamp3 = random_date(d1, d2)
-timestamp4 = random_date(d1, d2)
-
-connection = sqlite3.connect("database.db")
-
-with open("db/schema.sql") as f:
-    connection.executescript(f.read())
-
-cur = connection.cursor()
-
-cur.execute(
-    f"INSERT INTO message (person, text, created) VALUES ('Tom', 'Hello, world!', '{timestamp1}')"
-)
-cur.execute(
-    f"INSERT INTO message (person, text, created) VALUES ('Peter', 'I like Pizza', '{timestamp2}')"
-)
-cur.execute(
-    f"INSERT INTO message (person, text, created) VALUES ('Max', 'carpe diem', '{timestamp3}')"
-)
-cur.execute(
-    f"INSERT INTO message (person, text, created) VALUES ('Robert', 'woof', '{timestamp4}')"
-)
-
-connection.commit()
-connection.close()
+
+def seed_examples(conn):
+    timestamps = [random_date(d1, d2) for _ in range(4)]
+    conn.executemany(
+        "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+        [
+            ("Tom", "Hello, world!", str(timestamps[0])),
+            ("Peter", "I like Pizza", str(timestamps[1])),
+            ("Max", "carpe diem", str(timestamps[2])),
+            ("Robert", "woof", str(timestamps[3])),
+        ],
+    )
+
+
+def zipf_weights(n, s=1.1):
+    """Cumulative weights for ranks 1..n, ready for random.choices()."""
+    total, weights = 0.0, []
+    for rank in range(1, n + 1):
+        total += 1 / rank**s
+        weights.append(total)
+    return weights
+
+
+def synthetic_rows(count, start, end, batch_size, people=2000, rng=random):
+    """
+    Yield lists of (person, text, created) with timestamps increasing over
+    [start, end), so ids and creation times sort the same way as in real data.
+    A few people write most of the messages; lengths vary from one word to
+    a few sentences.
+    """
+    names = [
+        FIRST_NAMES[i % len(FIRST_NAMES)] + ("" if i < len(FIRST_NAMES) else f" {i}")
+        for i in range(people)
+    ]
+    name_weights = zipf_weights(len(names))
+    word_weights = zipf_weights(len(WORDS))
+    span = (end - start).total_seconds()
+    start_ts = start.timestamp()
+
+    for offset in range(0, count, batch_size):
+        n = min(batch_size, count - offset)
+        persons = rng.choices(names, cum_weights=name_weights, k=n)
+        low = start_ts + span * offset / count
+        high = start_ts + span * (offset + n) / count
+        created = sorted(rng.uniform(low, high) for _ in range(n))
+
+        rows = []
+        for person, ts in zip(persons, created):
+            length = min(60, max(1, int(rng.lognormvariate(1.8, 0.7))))
+            words = rng.choices(WORDS, cum_weights=word_weights, k=length)
+            text = " ".join(words)
+            text = text[0].upper() + text[1:] + rng.choice(PUNCTUATION)
+            rows.append((person, text, str(datetime.fromtimestamp(ts))))
+        yield rows
+
+
+def bulk_load(conn, batches, queue_jobs=False):
+    """
+    Insert every batch of (person, text, created) rows with executemany,
+    trading durability for speed until the load is done. Returns
+    (rows, total seconds, seconds spent inserting).
+    """
+    conn.execute("PRAGMA journal_mode = memory")
+    conn.execute("PRAGMA synchronous = off")
+    conn.execute("PRAGMA cache_size = -262144")
+    conn.execute("PRAGMA temp_store = memory")
+
+    # Row-level triggers on message cost a statement per insert; drop them
+    # for the load and catch up once at the end.
+    triggers = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'message'"
+    ).fetchall()
+    for name, _ in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+
+    first_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM message").fetchone()[0]
+    total = 0
+    inserting = 0.0
+    start = time.perf_counter()
+    for rows in batches:
+        batch_start = time.perf_counter()
+        with conn:
+            conn.executemany(
+                "INSERT INTO message (person, text, created) VALUES (?, ?, ?)", rows
+            )
+        inserting += time.perf_counter() - batch_start
+        total += len(rows)
+
+    with conn:
+        for _, sql in triggers:
+            conn.execute(sql)
+        conn.execute("UPDATE version SET value = value + 1 WHERE name = 'message'")
+        if "message_fts_insert" in dict(triggers):
+            # Index the new rows in one pass and merge the index segments.
+            conn.execute(
+                "INSERT INTO message_fts (rowid, person, text)"
+                " SELECT id, person, text FROM message WHERE id > ?",
+                (first_id,),
+            )
+            conn.execute("INSERT INTO message_fts (message_fts) VALUES ('optimize')")
+        if "message_rollup_insert" in dict(triggers):
+            backfill_rollups(conn, after_id=first_id)
+        if queue_jobs:
+            conn.execute(
+                "INSERT INTO sentiment_job (message_id) SELECT id FROM message WHERE id > ?",
+                (first_id,),
+            )
+    elapsed = time.perf_counter() - start
+
+    conn.execute("PRAGMA synchronous = normal")
+    conn.execute("PRAGMA journal_mode = wal")
+    conn.execute("ANALYZE")
+    return total, elapsed, inserting
+
+
+def create_schema(conn):
+    """Drop whatever is there and create the schema from db/schema.sql."""
+    for name in SCHEMA_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS {name}")
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create and seed the message database.")
+    parser.add_argument("--db", default=os.environ.get("DB_PATH", "database.db"))
+    parser.add_argument("--rows", type=int, default=0, help="synthetic messages to add")
+    parser.add_argument("--append", action="store_true",
+                        help="keep the existing schema and data")
+    parser.add_argument("--start", default="2022-01-01", help="first timestamp (ISO date)")
+    parser.add_argument("--end", default="2023-01-01", help="last timestamp (ISO date)")
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50000, help="rows per transaction")
+    parser.add_argument("--queue-jobs", action="store_true",
+                        help="queue synthetic messages for sentiment analysis")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--shards", type=int, default=1,
+                        help="also create the other files of STORAGE=sharded:N")
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(args.db)
+
+    if not args.append:
+        create_schema(connection)
+        seed_examples(connection)
+        # Queue the seed messages for the sentiment worker
+        connection.execute("INSERT INTO sentiment_job (message_id) SELECT id FROM message")
+        connection.commit()
+
+    if args.rows:
+        rng = random.Random(args.seed)
+        batches = synthetic_rows(
+            args.rows,
+            datetime.fromisoformat(args.start),
+            datetime.fromisoformat(args.end),
+            args.batch,
+            args.people,
+            rng,
+        )
+        rows, elapsed, inserting = bulk_load(connection, batches, args.queue_jobs)
+        print(
+            f"inserted {rows} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s,"
+            f" {rows / inserting:,.0f} rows/s excluding generation)"
+        )
+
+    connection.close()
+
+    for path in shard_paths(args.db, args.shards)[1:]:
+        if args.append and os.path.exists(path):
+            continue
+        shard = sqlite3.connect(path)
+        create_schema(shard)
+        shard.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import os
+import threading
+import time
+
+from resilience import CircuitOpen
+from sentiment import MAX_DOCUMENTS
+
+MAX_ATTEMPTS = int(os.environ.get("SENTIMENT_JOB_ATTEMPTS", 5))
+# A running job whose worker has not reported back within this many seconds
+# is assumed lost (crashed or killed worker) and handed out again.
+LEASE = float(os.environ.get("SENTIMENT_JOB_LEASE", 60))
+POLL_INTERVAL = float(os.environ.get("SENTIMENT_JOB_POLL", 1.0))
+MAX_BACKOFF = 300
+
+STATES = ("pending", "running", "failed")
+
+
+def enqueue(conn, message_id):
+    """Queue a message for analysis as part of the caller's transaction."""
+    conn.execute("INSERT INTO sentiment_job (message_id) VALUES (?)", (message_id,))
+
+
+class SentimentQueue:
+    """Durable queue of messages waiting for sentiment, stored in `sentiment_job`."""
+
+    def __init__(self, connect, max_attempts=MAX_ATTEMPTS, lease=LEASE):
+        self.connect = connect
+        self.max_attempts = max_attempts
+        self.lease = lease
+
+    def claim(self, limit=MAX_DOCUMENTS):
+        conn = self.connect()
+        now = time.time()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE sentiment_job SET state = 'pending'"
+                " WHERE state = 'running' AND claimed_at < ?",
+                (now - self.lease,),
+            )
+            jobs = conn.execute(
+                "SELECT j.id, j.message_id, j.attempts, m.text"
+                " FROM sentiment_job j LEFT JOIN message m ON m.id = j.message_id"
+                " WHERE j.state = 'pending' AND j.not_before <= ?"
+                " ORDER BY j.id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE sentiment_job SET state = 'running', claimed_at = ? WHERE id = ?",
+                [(now, job["id"]) for job in jobs],
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return jobs
+
+    def complete(self, jobs, results):
+        """Store each job's Sentiment on its message and drop the jobs."""
+        conn = self.connect()
+        with conn:
+            conn.executemany(
+                "UPDATE message SET sentiment = ?, positive = ?, neutral = ?, negative = ?"
+                " WHERE id = ?",
+                [(*result, job["message_id"]) for job, result in zip(jobs, results)],
+            )
+            conn.executemany(
+                "DELETE FROM sentiment_job WHERE id = ?", [(job["id"],) for job in jobs]
+            )
+
+    def discard(self, jobs):
+        conn = self.connect()
+        with conn:
+            conn.executemany(
+                "DELETE FROM sentiment_job WHERE id = ?", [(job["id"],) for job in jobs]
+            )
+
+    def fail(self, jobs, error):
+        """Retry with exponential backoff, or give up after max_attempts."""
+        conn = self.connect()
+        now = time.time()
+        with conn:
+            conn.executemany(
+                "UPDATE sentiment_job SET state = ?, attempts = ?, not_before = ?,"
+                " claimed_at = NULL, error = ? WHERE id = ?",
+                [
+                    (
+                        "failed" if job["attempts"] + 1 >= self.max_attempts else "pending",
+                        job["attempts"] + 1,
+                        now + min(2 ** job["attempts"], MAX_BACKOFF),
+                        str(error),
+                        job["id"],
+                    )
+                    for job in jobs
+                ],
+            )
+
+    def postpone(self, jobs, delay):
+        """Hand jobs back after `delay` seconds without counting an attempt."""
+        conn = self.connect()
+        with conn:
+            conn.executemany(
+                "UPDATE sentiment_job SET state = 'pending', not_before = ?,"
+                " claimed_at = NULL WHERE id = ?",
+                [(time.time() + delay, job["id"]) for job in jobs],
+            )
+
+    def depth(self):
+        """Number of jobs per state."""
+        conn = self.connect()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(
+            conn.execute(
+                "SELECT state, COUNT(*) FROM sentiment_job GROUP BY state"
+            ).fetchall()
+        )
+        return counts
+
+
+def total_depth(queues):
+    """depth() summed over several queues, one per database."""
+    counts = dict.fromkeys(STATES, 0)
+    for queue in queues:
+        for state, count in queue.depth().items():
+            counts[state] += count
+    return counts
+
+
+class SentimentWorker(threading.Thread):
+    """
+    Background thread that drains the queues (one per database file) in
+    batches of MAX_DOCUMENTS, taking one batch from each in turn.
+    `analyze` takes a list of texts and returns one Sentiment or None each.
+    """
+
+    def __init__(self, queues, analyze, poll_interval=POLL_INTERVAL):
+        super().__init__(name="sentiment-worker", daemon=True)
+        self.queues = queues
+        self.analyze = analyze
+        self.poll_interval = poll_interval
+        self._stopping = threading.Event()
+
+    def run_once(self):
+        return sum(self.process(queue) for queue in self.queues)
+
+    def process(self, queue):
+        jobs = queue.claim()
+        if not jobs:
+            return 0
+
+        # Messages deleted since they were queued have nothing to analyze.
+        orphans = [job for job in jobs if job["text"] is None]
+        jobs = [job for job in jobs if job["text"] is not None]
+        if orphans:
+            queue.discard(orphans)
+
+        try:
+            results = self.analyze([job["text"] for job in jobs]) if jobs else []
+        except CircuitOpen as e:
+            # The service was not called; wait for the breaker's next trial.
+            queue.postpone(jobs, e.retry_after)
+            return len(jobs) + len(orphans)
+        except Exception as e:
+            print(f"sentiment analysis failed: {e}")
+            queue.fail(jobs, e)
+            return len(jobs) + len(orphans)
+
+        done = [(job, r) for job, r in zip(jobs, results) if r is not None]
+        failed = [job for job, r in zip(jobs, results) if r is None]
+        if done:
+            queue.complete(*zip(*done))
+        if failed:
+            queue.fail(failed, "document error")
+        return len(jobs) + len(orphans)
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                print(f"sentiment worker error: {e}")
+                processed = 0
+            if not processed:
+                self._stopping.wait(self.poll_interval)
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        if self.is_alive():
+            self.join(timeout)
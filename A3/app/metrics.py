@@ -0,0 +1,128 @@
+"""
+Prometheus metrics, served as text by /metrics.
+
+Under gunicorn every worker writes its samples to files in
+PROMETHEUS_MULTIPROC_DIR (set up by gunicorn.conf.py) and /metrics merges the
+files of all workers, so whichever worker answers a scrape reports the totals
+of the whole server. Without that variable, metrics are kept in memory for
+the current process only.
+"""
+import contextlib
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram
+from prometheus_client import generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily
+
+QUERY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response headers are sent, by route.",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being handled; open /events streams are in sse_subscribers.",
+    multiprocess_mode="livesum",
+)
+QUERY_LATENCY = Histogram(
+    "sqlite_query_duration_seconds",
+    "Time spent in execute(), executemany() and commit(), by statement type.",
+    ["statement"],
+    buckets=QUERY_BUCKETS,
+)
+CONNECTIONS = Gauge(
+    "sqlite_connections",
+    "Open pooled SQLite connections.",
+    multiprocess_mode="livesum",
+)
+GROUP_COMMIT_BATCH = Histogram(
+    "sqlite_group_commit_batch_size",
+    "Writes per group commit.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+TEXTANALYTICS_LATENCY = Histogram(
+    "textanalytics_request_duration_seconds",
+    "Duration of analyze_sentiment calls, retries and waits included.",
+    ["outcome"],
+)
+TEXTANALYTICS_BATCH = Histogram(
+    "textanalytics_batch_size",
+    "Documents per analyze_sentiment call.",
+    buckets=(1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+)
+TEXTANALYTICS_DOCUMENT_ERRORS = Counter(
+    "textanalytics_document_errors",
+    "Documents the service returned an error for.",
+)
+TEXTANALYTICS_RETRIES = Counter(
+    "textanalytics_retries",
+    "analyze_sentiment attempts after the first, within the retry budget.",
+)
+TEXTANALYTICS_REJECTED = Counter(
+    "textanalytics_rejected",
+    "Calls failed fast because the circuit breaker was open.",
+)
+TEXTANALYTICS_CIRCUIT = Gauge(
+    "textanalytics_circuit_state",
+    "Circuit breaker state, worst of the workers: 0 closed, 1 half open, 2 open.",
+    multiprocess_mode="livemax",
+)
+ARCHIVED_MESSAGES = Counter(
+    "archived_messages",
+    "Messages moved to message_archive by retention.",
+)
+SSE_SUBSCRIBERS = Gauge(
+    "sse_subscribers",
+    "Open /events streams.",
+    multiprocess_mode="livesum",
+)
+
+
+@contextlib.contextmanager
+def textanalytics_call(documents):
+    TEXTANALYTICS_BATCH.observe(documents)
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        TEXTANALYTICS_LATENCY.labels(outcome).observe(time.perf_counter() - start)
+
+
+class QueueCollector:
+    """Sentiment job counts, read from the database at scrape time."""
+
+    def __init__(self, depth):
+        # Returns {state: jobs}, e.g. jobs.total_depth over the app's queues.
+        self.depth = depth
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "sentiment_jobs", "Sentiment jobs by state.", labels=["state"]
+        )
+        for state, count in self.depth().items():
+            family.add_metric([state], count)
+        yield family
+
+
+class _Collectors:
+    def __init__(self, collectors):
+        self.collectors = collectors
+
+    def collect(self):
+        for collector in self.collectors:
+            yield from collector.collect()
+
+
+def render(*collectors, path=None):
+    """Return (body, content type) for a scrape, plus any extra collectors."""
+    path = path or os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        base = multiprocess.MultiProcessCollector(None, path)
+    else:
+        base = REGISTRY
+    return generate_latest(_Collectors([base, *collectors])), CONTENT_TYPE_LATEST
@@ -0,0 +1,148 @@
+"""
+Opt-in profiling of single requests. A sampling profiler and tracemalloc run
+for the duration of a request and leave two files in PROFILE_DIR:
+
+    <id>.folded      sampled stacks, one "frame;frame;... count" per line, the
+                     input format of flamegraph.pl and speedscope
+    <id>.alloc.txt   the top allocation sites of the request
+
+Requests are profiled when PROFILE_ALL=1, or when they carry an
+`X-Profile: <PROFILE_SECRET>` header. With neither variable set, init_app()
+registers nothing and requests run exactly as before.
+"""
+import hmac
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from flask import g, request
+
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+PROFILE_SECRET = os.environ.get("PROFILE_SECRET")
+PROFILE_ALL = os.environ.get("PROFILE_ALL", "0") == "1"
+# Sampling faster than the interpreter's switch interval (5ms) adds overhead
+# without adding samples.
+INTERVAL = float(os.environ.get("PROFILE_INTERVAL", 0.005))
+TOP_ALLOCATIONS = 25
+HEADER = "X-Profile"
+
+
+def frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler(threading.Thread):
+    """Records the stack of one thread every `interval` seconds."""
+
+    def __init__(self, thread_id, interval=INTERVAL):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopping = threading.Event()
+
+    def run(self):
+        while not self._stopping.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stopping.set()
+        self.join()
+        return self.stacks
+
+
+class RequestProfile:
+    # tracemalloc is process-wide, so only one request is profiled at a time.
+    _lock = threading.Lock()
+
+    def __init__(self, name, directory=PROFILE_DIR, interval=INTERVAL):
+        self.name = name
+        self.directory = directory
+        self.interval = interval
+
+    def start(self):
+        if not self._lock.acquire(blocking=False):
+            return False
+        self.started = time.perf_counter()
+        # Leave tracing alone if it was already on (PYTHONTRACEMALLOC).
+        self.tracing = tracemalloc.is_tracing()
+        if not self.tracing:
+            tracemalloc.start()
+        self.sampler = Sampler(threading.get_ident(), self.interval)
+        self.sampler.start()
+        return True
+
+    def stop(self):
+        """Write the profile files and return their common path prefix."""
+        try:
+            stacks = self.sampler.stop()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if not self.tracing:
+                tracemalloc.stop()
+        finally:
+            self._lock.release()
+        elapsed = time.perf_counter() - self.started
+
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = os.path.join(self.directory, self.name)
+        with open(f"{prefix}.folded", "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        )
+        with open(f"{prefix}.alloc.txt", "w") as f:
+            f.write(
+                f"{self.name}: {elapsed * 1000:.1f}ms, {sum(stacks.values())} samples,"
+                f" {current / 1024:.1f} KiB still allocated, {peak / 1024:.1f} KiB peak\n\n"
+            )
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+        return prefix
+
+
+def init_app(app, secret=PROFILE_SECRET, always=PROFILE_ALL, directory=PROFILE_DIR):
+    if not (secret or always):
+        return
+
+    def wanted():
+        if always:
+            return True
+        token = request.headers.get(HEADER)
+        return token is not None and hmac.compare_digest(token.encode(), secret.encode())
+
+    @app.before_request
+    def start_profile():
+        if not wanted():
+            return
+        endpoint = request.endpoint or "unmatched"
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{endpoint}-{time.monotonic_ns()}"
+        profile = RequestProfile(name, directory)
+        if profile.start():
+            g.profile = profile
+
+    @app.after_request
+    def stop_profile(resp):
+        profile = g.pop("profile", None)
+        if profile is not None:
+            resp.headers["X-Profile-Id"] = os.path.basename(profile.stop())
+        return resp
+
+    @app.teardown_request
+    def discard_profile(exception):
+        # Still set only if after_request never ran, e.g. another hook raised.
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profile.stop()
@@ -0,0 +1,183 @@
+"""
+Deadline, retry budget and circuit breaker for calls to a remote service
+(TextAnalytics, in sentiment.py).
+
+A call gets DEADLINE seconds in total, retries and waits included. A failed
+attempt is retried when the service says it may be (`retry_after` returns a
+delay), waiting as long as its Retry-After asks, but only while the deadline
+leaves room for it and the process-wide RetryBudget has a token: retries
+are capped at a fraction of the calls made, so a struggling service does not
+get a multiple of the normal load.
+
+After BREAKER_THRESHOLD calls in a row have failed the breaker opens and
+calls fail at once with CircuitOpen for BREAKER_RESET seconds (or longer, if
+the service asked for it). Then one trial call is let through; its outcome
+closes the breaker or opens it again.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+
+DEADLINE = float(os.environ.get("SENTIMENT_DEADLINE", 10))
+MAX_ATTEMPTS = int(os.environ.get("SENTIMENT_MAX_ATTEMPTS", 3))
+RETRY_RATIO = float(os.environ.get("SENTIMENT_RETRY_RATIO", 0.2))
+BREAKER_THRESHOLD = int(os.environ.get("BREAKER_THRESHOLD", 5))
+BREAKER_RESET = float(os.environ.get("BREAKER_RESET", 30))
+# Delay before the first retry when the service gives no Retry-After.
+BACKOFF = 0.5
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the service while the breaker is open."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"circuit open, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class RetryBudget:
+    """
+    Every call adds `ratio` of a token (up to `max_tokens`), every retry
+    takes a whole one, so retries stay below `ratio` times the calls.
+    """
+
+    def __init__(self, ratio=RETRY_RATIO, max_tokens=10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_retry(self):
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        threshold=BREAKER_THRESHOLD,
+        reset=BREAKER_RESET,
+        on_change=None,
+        clock=time.monotonic,
+    ):
+        self.threshold = threshold
+        self.reset = reset
+        self.on_change = on_change
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def _set(self, state):
+        if state != self.state:
+            self.state = state
+            if self.on_change is not None:
+                self.on_change(state)
+
+    def before_call(self):
+        """Raise CircuitOpen unless a call may go ahead now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = self.clock()
+            if self.state == OPEN and now >= self.opened_until:
+                self._set(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._trial:
+                self._trial = True
+                return
+            raise CircuitOpen(max(self.opened_until - now, 0.0) or self.reset)
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self._trial = False
+            self._set(CLOSED)
+
+    def failure(self, retry_after=None):
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                self.opened_until = self.clock() + max(self.reset, retry_after or 0)
+                self._set(OPEN)
+
+    def retry_after(self):
+        """Seconds until the next trial call, 0 unless the breaker is open."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(self.opened_until - self.clock(), 0.0)
+
+
+def _delay(error, attempt, deadline, budget, retry_after, max_attempts):
+    """Seconds to wait before the next attempt, or None to give up."""
+    if attempt >= max_attempts:
+        return None
+    wait = retry_after(error)
+    if wait is None:
+        return None
+    if not wait:
+        wait = BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+    if time.monotonic() + wait >= deadline or not budget.try_retry():
+        return None
+    return wait
+
+
+def call(fn, deadline, budget, retry_after, max_attempts=MAX_ATTEMPTS):
+    """
+    fn(timeout) until it succeeds, retrying where `retry_after(error)` gives
+    a delay (0 for the default backoff; None means the error is final).
+    `timeout` is what is left of the deadline, for the socket timeouts.
+    """
+    budget.record_call()
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline exceeded")
+        attempt += 1
+        try:
+            return fn(remaining)
+        except Exception as e:
+            wait = _delay(e, attempt, deadline, budget, retry_after, max_attempts)
+            if wait is None:
+                raise
+        time.sleep(wait)
+
+
+async def call_async(fn, deadline, budget, retry_after, max_attempts=MAX_ATTEMPTS):
+    """call() for a coroutine function; the deadline also cancels the attempt."""
+    budget.record_call()
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline exceeded")
+        attempt += 1
+        try:
+            return await asyncio.wait_for(fn(remaining), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("deadline exceeded") from None
+        except Exception as e:
+            wait = _delay(e, attempt, deadline, budget, retry_after, max_attempts)
+            if wait is None:
+                raise
+        await asyncio.sleep(wait)
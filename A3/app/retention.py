@@ -0,0 +1,171 @@
+"""
+Hot/cold tiering for messages. Rows older than RETENTION_DAYS move from
+`message` to `message_archive` in small transactions, oldest first, so the
+hot table and its indexes stay small. Archived rows stay readable through
+/archive.
+
+With RETENTION_DAYS set every worker has a background thread for it, but
+only the one holding the `retention` lease in the database does the work;
+the others take over if it stops renewing it. Or run it once from the
+command line:
+
+    python retention.py --days 30
+"""
+import argparse
+import datetime
+import json
+import os
+import socket
+import threading
+import time
+
+import metrics
+
+RETENTION_DAYS = os.environ.get("RETENTION_DAYS")
+# Rows per transaction: a batch of 500 holds the write lock for about 10ms
+# (longer when its commit triggers a WAL checkpoint), and writers queued
+# behind it get a turn between batches.
+BATCH_SIZE = int(os.environ.get("RETENTION_BATCH", 500))
+PAUSE = float(os.environ.get("RETENTION_PAUSE", 0.05))
+INTERVAL = float(os.environ.get("RETENTION_INTERVAL", 600))
+
+# Listed explicitly so the copy does not depend on column order.
+COLUMNS = "id, created, person, text, sentiment, positive, neutral, negative"
+
+
+class Retention:
+    def __init__(self, connect, days, batch_size=BATCH_SIZE, pause=PAUSE):
+        self.connect = connect
+        self.days = float(days)
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def cutoff(self):
+        return str(datetime.datetime.now() - datetime.timedelta(days=self.days))
+
+    def archive_batch(self, cutoff=None):
+        """Move expired messages among the batch_size oldest; return how many."""
+        cutoff = cutoff or self.cutoff()
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Ids grow with `created`, so expired rows sit at the start of the
+            # table in id order. Looking only at the first batch_size rows
+            # keeps each batch short and needs no index on `created`.
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT id FROM (SELECT id, created FROM message ORDER BY id LIMIT ?)"
+                    " WHERE created < ?",
+                    (self.batch_size, cutoff),
+                )
+            ]
+            if ids:
+                batch = json.dumps(ids)
+                conn.execute(
+                    f"INSERT INTO message_archive ({COLUMNS}) SELECT {COLUMNS} FROM message"
+                    " WHERE id IN (SELECT value FROM json_each(?))",
+                    (batch,),
+                )
+                conn.execute(
+                    "DELETE FROM message WHERE id IN (SELECT value FROM json_each(?))", (batch,)
+                )
+                conn.execute(
+                    "DELETE FROM sentiment_job WHERE message_id IN"
+                    " (SELECT value FROM json_each(?))",
+                    (batch,),
+                )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        if ids:
+            metrics.ARCHIVED_MESSAGES.inc(len(ids))
+        return len(ids)
+
+    def acquire(self, holder, ttl):
+        """Take or renew the lease for `ttl` seconds; False while another holder has it."""
+        now = time.time()
+        conn = self.connect()
+        cursor = conn.execute(
+            "INSERT INTO lease (name, holder, expires) VALUES ('retention', ?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, expires = excluded.expires"
+            " WHERE lease.holder = excluded.holder OR lease.expires < ?",
+            (holder, now + ttl, now),
+        )
+        conn.commit()
+        return cursor.rowcount == 1
+
+    def release(self, holder):
+        conn = self.connect()
+        conn.execute("DELETE FROM lease WHERE name = 'retention' AND holder = ?", (holder,))
+        conn.commit()
+
+    def run_once(self, max_batches=None, stopping=None):
+        """Archive batch after batch until nothing is left to move."""
+        cutoff = self.cutoff()
+        total = batches = 0
+        while max_batches is None or batches < max_batches:
+            if stopping is not None and stopping.is_set():
+                break
+            moved = self.archive_batch(cutoff)
+            total += moved
+            batches += 1
+            if not moved:
+                break
+            time.sleep(self.pause)
+        return total
+
+
+class RetentionWorker(threading.Thread):
+    """One thread for all database files; each has a lease of its own."""
+
+    def __init__(self, retentions, interval=INTERVAL):
+        super().__init__(name="retention", daemon=True)
+        self.retentions = retentions
+        self.interval = interval
+        self._stopping = threading.Event()
+
+    def run(self):
+        # Started after the fork, so the pid tells the workers apart.
+        holder = f"{socket.gethostname()}:{os.getpid()}"
+        while not self._stopping.is_set():
+            for retention in self.retentions:
+                try:
+                    # Renewed every interval; outlives one missed turn.
+                    if retention.acquire(holder, 2 * self.interval):
+                        retention.run_once(stopping=self._stopping)
+                except Exception as e:
+                    print(f"retention error: {e}")
+            self._stopping.wait(self.interval)
+        for retention in self.retentions:
+            try:
+                # Let another worker take over right away.
+                retention.release(holder)
+            except Exception as e:
+                print(f"retention error: {e}")
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+def main():
+    from database import pool
+
+    parser = argparse.ArgumentParser(description="Move expired messages to the archive.")
+    parser.add_argument(
+        "--days", type=float, default=RETENTION_DAYS, required=not RETENTION_DAYS
+    )
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=PAUSE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    moved = Retention(pool.get, args.days, args.batch, args.pause).run_once()
+    print(f"archived {moved} messages in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
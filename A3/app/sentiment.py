@@ -0,0 +1,466 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import metrics
+import resilience
+from resilience import CircuitBreaker, CircuitOpen, DeadlineExceeded, RetryBudget
+
+# The service accepts at most this many documents per analyze_sentiment call.
+MAX_DOCUMENTS = 10
+WORKERS = int(os.environ.get("SENTIMENT_WORKERS", 4))
+
+# Per attempt; the rest of the call's deadline bounds the read.
+CONNECT_TIMEOUT = float(os.environ.get("SENTIMENT_CONNECT_TIMEOUT", 3))
+# Worth another attempt when the service allows it.
+RETRY_STATUS = (408, 429, 500, 502, 503, 504)
+
+CACHE_SIZE = int(os.environ.get("SENTIMENT_CACHE_SIZE", 1024))
+CACHE_TTL = float(os.environ.get("SENTIMENT_CACHE_TTL", 7 * 24 * 60 * 60))
+
+
+class Sentiment(namedtuple("Sentiment", ["label", "positive", "neutral", "negative"])):
+    __slots__ = ()
+
+    @classmethod
+    def from_document(cls, doc):
+        scores = doc.confidence_scores
+        return cls(doc.sentiment, scores.positive, scores.neutral, scores.negative)
+
+    @property
+    def score(self):
+        return max(self.positive, self.neutral, self.negative)
+
+
+def _circuit_changed(state):
+    print(f"TextAnalytics circuit breaker {state}")
+    metrics.TEXTANALYTICS_CIRCUIT.set(resilience.STATES.index(state))
+
+
+# Shared by every call in this process (sync and async).
+breaker = CircuitBreaker(on_change=_circuit_changed)
+retry_budget = RetryBudget()
+metrics.TEXTANALYTICS_CIRCUIT.set(0)
+
+_client = None
+_session = None
+_executor = None
+_pid = None
+_lock = threading.Lock()
+
+
+def _create_client():
+    # The azure SDK and requests take about a third of a second to import and
+    # only the sentiment worker needs them, so they load on first use (or in
+    # warm_up() after the fork) rather than with the app.
+    import requests
+    from azure.ai.textanalytics import TextAnalyticsClient
+    from azure.core.credentials import AzureKeyCredential
+    from azure.core.pipeline.transport import RequestsTransport
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Retries are made by resilience.call() within the call's deadline, so
+    # neither the adapter nor the azure-core pipeline retries on its own; the
+    # adapter only pools connections, one per concurrent chunk.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=WORKERS,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    client = TextAnalyticsClient(
+        endpoint=os.environ["AZ_ENDPOINT"],
+        credential=AzureKeyCredential(os.environ["AZ_KEY"]),
+        transport=RequestsTransport(session=session, session_owner=False),
+        retry_total=0,
+    )
+    return client, session
+
+
+def _process_state():
+    global _client, _session, _executor, _pid
+    with _lock:
+        if _pid != os.getpid():
+            # Neither sockets nor threads survive a fork.
+            _client, _session = _create_client()
+            _executor = ThreadPoolExecutor(WORKERS, thread_name_prefix="sentiment")
+            _pid = os.getpid()
+        return _client, _executor
+
+
+def get_client():
+    """Return the TextAnalytics client shared by every request in this process."""
+    return _process_state()[0]
+
+
+def warm_up():
+    """
+    Build the client and open a connection to the endpoint before the first
+    request needs it. Failures are ignored; the first request just pays for
+    the handshake instead.
+    """
+    if not (os.environ.get("AZ_ENDPOINT") and os.environ.get("AZ_KEY")):
+        return
+
+    get_client()
+    try:
+        _session.head(os.environ["AZ_ENDPOINT"], timeout=5)
+    except Exception:
+        # With retries disabled on the adapter, urllib3 errors such as a
+        # refused connection come through unwrapped.
+        pass
+
+
+def _results(docs):
+    errors = sum(doc.is_error for doc in docs)
+    if errors:
+        metrics.TEXTANALYTICS_DOCUMENT_ERRORS.inc(errors)
+    return [None if doc.is_error else Sentiment.from_document(doc) for doc in docs]
+
+
+def retry_after(error):
+    """
+    Seconds the service asked us to wait before retrying after `error`, 0 if
+    it may be retried right away (after the usual backoff), None if not.
+    """
+    from azure.core.exceptions import (
+        HttpResponseError,
+        ServiceRequestError,
+        ServiceResponseError,
+    )
+
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        # Connection failed or timed out.
+        return 0
+    if not isinstance(error, HttpResponseError) or error.status_code not in RETRY_STATUS:
+        return None
+    headers = error.response.headers if error.response is not None else {}
+    for name, scale in (("retry-after-ms", 0.001), ("Retry-After", 1)):
+        try:
+            return float(headers.get(name)) * scale
+        except (TypeError, ValueError):
+            # Missing, or an HTTP date.
+            pass
+    return 0
+
+
+def _before_call():
+    try:
+        breaker.before_call()
+    except CircuitOpen:
+        metrics.TEXTANALYTICS_REJECTED.inc()
+        raise
+
+
+def _call_failed(error):
+    breaker.failure(None if isinstance(error, DeadlineExceeded) else retry_after(error))
+
+
+def _timeouts(remaining):
+    return {"connection_timeout": min(remaining, CONNECT_TIMEOUT), "read_timeout": remaining}
+
+
+def _analyze_chunk(client, texts, deadline):
+    attempts = []
+
+    def attempt(remaining):
+        if attempts:
+            metrics.TEXTANALYTICS_RETRIES.inc()
+        attempts.append(remaining)
+        return client.analyze_sentiment(texts, **_timeouts(remaining))
+
+    with metrics.textanalytics_call(len(texts)):
+        result = resilience.call(attempt, deadline, retry_budget, retry_after)
+    return _results(result)
+
+
+def analyze_documents(texts):
+    """
+    Analyze any number of texts in chunks of MAX_DOCUMENTS that run
+    concurrently, returning one Sentiment (or None) per text in order.
+
+    Raises CircuitOpen without calling the service while the breaker is
+    open, and DeadlineExceeded when the chunks take longer than DEADLINE.
+    """
+    client, executor = _process_state()
+    chunks = [
+        texts[start : start + MAX_DOCUMENTS]
+        for start in range(0, len(texts), MAX_DOCUMENTS)
+    ]
+    if not chunks:
+        return []
+
+    _before_call()
+    deadline = time.monotonic() + resilience.DEADLINE
+    # Even a single chunk runs on the pool, so the caller can stop waiting at
+    # the deadline; the abandoned request ends with its read timeout.
+    futures = [executor.submit(_analyze_chunk, client, chunk, deadline) for chunk in chunks]
+    try:
+        _, pending = wait(futures, timeout=deadline - time.monotonic())
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise DeadlineExceeded("deadline exceeded")
+        results = [future.result() for future in futures]
+    except Exception as e:
+        _call_failed(e)
+        raise
+    breaker.success()
+    return [r for chunk in results for r in chunk]
+
+
+def create_async_client():
+    """
+    Async TextAnalytics client for the ASGI app, on an aiohttp session that
+    keeps up to WORKERS connections open. Returns (client, session); the
+    caller closes both.
+    """
+    # aiohttp is only needed when serving through asgi.py.
+    import aiohttp
+    from azure.ai.textanalytics.aio import TextAnalyticsClient as AsyncClient
+    from azure.core.credentials import AzureKeyCredential
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=WORKERS))
+    client = AsyncClient(
+        endpoint=os.environ["AZ_ENDPOINT"],
+        credential=AzureKeyCredential(os.environ["AZ_KEY"]),
+        transport=AioHttpTransport(session=session, session_owner=False),
+        retry_total=0,
+    )
+    return client, session
+
+
+async def analyze_documents_async(client, texts):
+    """analyze_documents() on the event loop, up to WORKERS chunks in flight."""
+    chunks = [
+        texts[start : start + MAX_DOCUMENTS]
+        for start in range(0, len(texts), MAX_DOCUMENTS)
+    ]
+    if not chunks:
+        return []
+
+    _before_call()
+    deadline = time.monotonic() + resilience.DEADLINE
+    semaphore = asyncio.Semaphore(WORKERS)
+
+    async def analyze_chunk(chunk):
+        attempts = []
+
+        def attempt(remaining):
+            if attempts:
+                metrics.TEXTANALYTICS_RETRIES.inc()
+            attempts.append(remaining)
+            return client.analyze_sentiment(chunk, **_timeouts(remaining))
+
+        async with semaphore:
+            with metrics.textanalytics_call(len(chunk)):
+                result = await resilience.call_async(
+                    attempt, deadline, retry_budget, retry_after
+                )
+        return _results(result)
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks)),
+            deadline - time.monotonic(),
+        )
+    except asyncio.TimeoutError:
+        _call_failed(DeadlineExceeded())
+        raise DeadlineExceeded("deadline exceeded") from None
+    except Exception as e:
+        _call_failed(e)
+        raise
+    breaker.success()
+    return [r for chunk in results for r in chunk]
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that evicts the least recently used entry once it
+    holds `maxsize` items, and treats entries older than `ttl` seconds as
+    missing.
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE, ttl=CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl=None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Callers arriving while a call
+    for their key is in flight wait for it and share its result.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class SentimentCache:
+    """
+    Sentiment results keyed on a hash of the message text, held in an
+    in-process LRU and persisted in the `sentiment_cache` table so that
+    other workers and restarts reuse them.
+    """
+
+    def __init__(self, connect, maxsize=CACHE_SIZE, ttl=CACHE_TTL):
+        self.connect = connect
+        self.ttl = ttl
+        self.memory = LRUCache(maxsize, ttl)
+        self.flight = SingleFlight()
+
+    def _load(self, keys, stale=False):
+        """Stored results for `keys`; with `stale`, also those past their TTL."""
+        conn = self.connect()
+        found = {}
+        now = time.time()
+        oldest = 0 if stale else now - self.ttl
+        # Stay well below SQLite's limit on bound parameters.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT key, label, positive, neutral, negative, created"
+                f" FROM sentiment_cache WHERE key IN ({placeholders}) AND created > ?",
+                (*chunk, oldest),
+            ).fetchall()
+
+            for row in rows:
+                value = Sentiment(row[1], row[2], row[3], row[4])
+                if row[5] + self.ttl > now:
+                    self.memory.put(row[0], value, ttl=row[5] + self.ttl - now)
+                found[row[0]] = value
+        return found
+
+    def _store(self, results):
+        conn = self.connect()
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO sentiment_cache"
+            " (key, label, positive, neutral, negative, created)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [(key, *value, now) for key, value in results.items()],
+        )
+        conn.commit()
+        for key, value in results.items():
+            self.memory.put(key, value)
+
+    def _fetch(self, missing, analyze):
+        results = analyze(list(missing.values()))
+        fetched = {
+            key: value for key, value in zip(missing, results) if value is not None
+        }
+        if fetched:
+            self._store(fetched)
+        return fetched
+
+    def analyze(self, texts, analyze):
+        """
+        Return a Sentiment (or None on a per-document error) for every text.
+
+        Only texts found neither in memory nor in SQLite are passed to
+        `analyze`, which must return one Sentiment or None per input text.
+        While the circuit breaker is open, expired results are served for
+        those texts instead; CircuitOpen is raised if any have none.
+        """
+        keys = [text_key(text) for text in texts]
+        found = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            value = self.memory.get(key)
+            if value is not None:
+                found[key] = value
+            else:
+                missing[key] = text
+
+        if missing:
+            stored = self._load(list(missing))
+            found.update(stored)
+            for key in stored:
+                del missing[key]
+
+        if missing:
+            try:
+                fetched = self.flight.do(
+                    tuple(sorted(missing)), lambda: self._fetch(missing, analyze)
+                )
+            except CircuitOpen:
+                fetched = self._load(list(missing), stale=True)
+                if len(fetched) < len(missing):
+                    raise
+            found.update(fetched)
+
+        return [found.get(key) for key in keys]
@@ -0,0 +1,652 @@
+"""
+Where messages are kept, behind one small interface so the routes do not
+depend on a single database file:
+
+    append(person, text, created)   store a message (and queue its sentiment), return its id
+    page(before, limit, table)      up to `limit` rows older than `before`, newest first,
+                                    and whether more follow
+    scan(before, batch_size)        lists of rows older than `before`, newest first
+    recent(limit)                   the newest `limit` rows
+    since(after, limit)             rows newer than `after`, oldest first
+    fetch(ids)                      the rows with these ids that still exist, in any order
+    last_id()                       the newest id, 0 if there is none
+    version()                       grows with every change to the messages, for ETags
+    databases                       connect functions of the SQLite files behind it,
+                                    for search, /stats, the sentiment queue and retention
+
+STORAGE picks the backend:
+
+    sqlite      the single file at DB_PATH (the default)
+    memory      a list in this process, for tests and benchmarks; no search,
+                rollups or sentiment
+    sharded:N   N SQLite files, DB_PATH and database-1.db ... database-<N-1>.db
+                next to it (`python init_db.py --shards N` creates them)
+
+Sharding gives every file its own write lock, so writers in different
+processes no longer queue behind each other. Messages go to a shard by a
+hash of the row; reads ask every shard and merge by id. Ids stay unique and
+roughly time-ordered across shards: shard i hands out ids congruent to i
+modulo N, from the current time in microseconds or one past its newest id.
+A row committed a moment after a newer id on another shard can be missed by
+open /events streams; it shows up on the next page load.
+
+With RECENT_CACHE_SIZE set, the SQLite backends are wrapped in a
+CachedStorage that answers reads of the newest messages from memory.
+"""
+import atexit
+import bisect
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+import zlib
+
+from database import DB_PATH, ConnectionPool, GroupCommitWriter
+from jobs import enqueue
+
+
+def _id(row):
+    return row["id"]
+
+
+def insert_message(conn, person, text, created, stride=1, offset=0):
+    """Insert a message and queue it for sentiment, in the caller's transaction."""
+    if stride == 1:
+        cursor = conn.execute(
+            "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+            (person, text, created),
+        )
+    else:
+        cursor = conn.execute(
+            "INSERT INTO message (id, person, text, created)"
+            " SELECT max(?, coalesce(MAX(id), 0) / ? + 1) * ? + ?, ?, ?, ? FROM message",
+            (time.time_ns() // 1000, stride, stride, offset, person, text, created),
+        )
+    enqueue(conn, cursor.lastrowid)
+    return cursor.lastrowid
+
+
+class SQLiteStorage:
+    """
+    Messages in one SQLite database. With a GroupCommitWriter, appends share
+    transactions; `stride` and `offset` are set when it is one of several
+    shards.
+    """
+
+    def __init__(self, connect, writer=None, stride=1, offset=0):
+        self.connect = connect
+        self.writer = writer
+        self.stride = stride
+        self.offset = offset
+
+    @property
+    def databases(self):
+        return [self.connect]
+
+    def append(self, person, text, created):
+        args = (person, text, created, self.stride, self.offset)
+        if self.writer is not None:
+            return self.writer.submit(insert_message, *args)
+        conn = self.connect()
+        message_id = insert_message(conn, *args)
+        conn.commit()
+        return message_id
+
+    def page(self, before=None, limit=50, table="message"):
+        conn = self.connect()
+        if before is None:
+            rows = conn.execute(
+                f"SELECT * FROM {table} ORDER BY id DESC LIMIT ?", (limit + 1,)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                f"SELECT * FROM {table} WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (before, limit + 1),
+            ).fetchall()
+        return rows[:limit], len(rows) > limit
+
+    def scan(self, before=None, batch_size=500):
+        # One cursor walked with fetchmany(), so memory stays flat however
+        # many rows there are.
+        conn = self.connect()
+        if before is None:
+            cursor = conn.execute("SELECT * FROM message ORDER BY id DESC")
+        else:
+            cursor = conn.execute(
+                "SELECT * FROM message WHERE id < ? ORDER BY id DESC", (before,)
+            )
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def recent(self, limit):
+        return self.connect().execute(
+            "SELECT * FROM message ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def since(self, after, limit):
+        return self.connect().execute(
+            "SELECT * FROM message WHERE id > ? ORDER BY id LIMIT ?", (after, limit)
+        ).fetchall()
+
+    def fetch(self, ids):
+        return self.connect().execute(
+            "SELECT * FROM message WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(ids)),),
+        ).fetchall()
+
+    def last_id(self):
+        row = self.connect().execute("SELECT MAX(id) FROM message").fetchone()
+        return row[0] or 0
+
+    def version(self):
+        row = self.connect().execute(
+            "SELECT value FROM version WHERE name = 'message'"
+        ).fetchone()
+        return row[0]
+
+    def close(self, timeout=None):
+        if self.writer is not None:
+            self.writer.close(timeout)
+
+
+class MemoryStorage:
+    """Messages in a list, for tests and benchmarks. Nothing is analyzed."""
+
+    databases = ()
+
+    def __init__(self):
+        self._rows = []
+        self._ids = []
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def append(self, person, text, created):
+        with self._lock:
+            message_id = self._ids[-1] + 1 if self._ids else 1
+            self._rows.append(
+                {
+                    "id": message_id,
+                    "created": created,
+                    "person": person,
+                    "text": text,
+                    "sentiment": None,
+                    "positive": None,
+                    "neutral": None,
+                    "negative": None,
+                }
+            )
+            self._ids.append(message_id)
+            self._version += 1
+        return message_id
+
+    def page(self, before=None, limit=50, table="message"):
+        if table != "message":
+            return [], False
+        with self._lock:
+            end = len(self._ids) if before is None else bisect.bisect_left(self._ids, before)
+            rows = self._rows[max(0, end - limit - 1) : end][::-1]
+        return rows[:limit], len(rows) > limit
+
+    def scan(self, before=None, batch_size=500):
+        while True:
+            rows, has_more = self.page(before, batch_size)
+            if rows:
+                yield rows
+            if not has_more:
+                break
+            before = rows[-1]["id"]
+
+    def recent(self, limit):
+        return self.page(None, limit)[0]
+
+    def since(self, after, limit):
+        with self._lock:
+            start = bisect.bisect_right(self._ids, after)
+            return self._rows[start : start + limit]
+
+    def fetch(self, ids):
+        rows = []
+        with self._lock:
+            for message_id in ids:
+                i = bisect.bisect_left(self._ids, message_id)
+                if i < len(self._ids) and self._ids[i] == message_id:
+                    rows.append(self._rows[i])
+        return rows
+
+    def last_id(self):
+        return self._ids[-1] if self._ids else 0
+
+    def version(self):
+        return self._version
+
+    def close(self, timeout=None):
+        pass
+
+
+COLUMNS = ("id", "created", "person", "text", "sentiment", "positive", "neutral", "negative")
+
+
+class Record:
+    """A cached message row, read like sqlite3.Row: record["text"]."""
+
+    __slots__ = COLUMNS
+
+    def __init__(self, *values):
+        for name, value in zip(COLUMNS, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*(row[name] for name in COLUMNS))
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def keys(self):
+        return list(COLUMNS)
+
+
+class _Slots:
+    """`count` slots of a circular list from `start` on, as a sequence for bisect."""
+
+    def __init__(self, slots, start, count):
+        self.slots = slots
+        self.start = start
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return self.slots[(self.start + i) % len(self.slots)]
+
+
+class RecentMessages:
+    """
+    The newest `size` messages in a fixed ring of slots: adding to a full
+    ring overwrites the oldest. Records must be added in id order.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.clear()
+
+    def clear(self):
+        self._records = [None] * self.size
+        self._ids = [0] * self.size
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, record):
+        if self._count < self.size:
+            slot = (self._start + self._count) % self.size
+            self._count += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.size
+        self._records[slot] = record
+        self._ids[slot] = record.id
+
+    def replace(self, record):
+        """Put `record` in place of the one with its id, if that is still here."""
+        ids = _Slots(self._ids, self._start, self._count)
+        i = bisect.bisect_left(ids, record.id)
+        if i < self._count and ids[i] == record.id:
+            self._records[(self._start + i) % self.size] = record
+
+    def oldest_id(self):
+        return self._ids[self._start] if self._count else None
+
+    def newest_id(self):
+        return self._ids[(self._start + self._count - 1) % self.size] if self._count else None
+
+    def before(self, before, limit):
+        """Up to `limit` records older than `before` (None for the newest), newest first."""
+        end = self._count
+        if before is not None:
+            end = bisect.bisect_left(_Slots(self._ids, self._start, self._count), before)
+        records = _Slots(self._records, self._start, self._count)
+        return [records[i] for i in range(end - 1, max(end - limit, 0) - 1, -1)]
+
+    def after(self, after, limit):
+        """Up to `limit` records newer than `after`, oldest first."""
+        start = bisect.bisect_right(_Slots(self._ids, self._start, self._count), after)
+        records = _Slots(self._records, self._start, self._count)
+        return [records[i] for i in range(start, min(start + limit, self._count))]
+
+
+class CachedStorage:
+    """
+    A SQLite backed storage with its newest `size` messages kept in this
+    process (RECENT_CACHE_SIZE), so /sentiment, the first pages of /messages,
+    the ETags and the /events poll are answered without a query.
+
+    Appends made here are written through to the ring. Other writers (other
+    workers, the group commit writer, the sentiment and retention threads)
+    are noticed with PRAGMA data_version, which changes when another
+    connection has committed to the file and needs no read from it. Only
+    then is the version row read. If it moved, the ring is brought up to
+    date: rows newer than its newest are added, and its rows still waiting
+    for sentiment are read again. The triggers bump the version once per
+    changed row, so when those account for the whole move nothing else
+    changed; anything else (a deletion, an edit) refills the ring.
+    """
+
+    def __init__(self, inner, size):
+        self.inner = inner
+        self.ring = RecentMessages(size)
+        # The ring holds every message: the table is no longer than it.
+        self.complete = False
+        self._version = None
+        # Set when this process wrote without updating the ring. Its own
+        # commits do not change this connection's data_version.
+        self._stale = False
+        # Bumped on every change of the ring, so a refill that raced with
+        # one is dropped.
+        self._generation = 0
+        self._seen = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def databases(self):
+        return self.inner.databases
+
+    def _unchanged(self):
+        """True while the ring matches the database."""
+        conns = [connect() for connect in self.inner.databases]
+        versions = [conn.execute("PRAGMA data_version").fetchone()[0] for conn in conns]
+        seen = getattr(self._seen, "state", None)
+        self._seen.state = (conns, versions)
+        if self._version is None:
+            return False
+        if seen is None or seen[0] != conns:
+            # A new connection (a new thread, or after a fork) has nothing to
+            # compare with.
+            self._invalidate()
+            return False
+        return seen[1] == versions and not self._stale
+
+    def _invalidate(self):
+        with self._lock:
+            self.ring.clear()
+            self.complete = False
+            self._version = None
+            self._generation += 1
+
+    def _recheck(self):
+        """Make this thread's next read look at the database again."""
+        conns, _ = self._seen.state
+        self._seen.state = (conns, None)
+
+    def _mark_stale(self):
+        with self._lock:
+            self._stale = True
+            self._generation += 1
+
+    def _refresh(self):
+        """Catch the ring up with the database, or refill it."""
+        with self._lock:
+            generation = self._generation
+            known = self._version
+            newest = self.ring.newest_id() or 0
+            pending = [r.id for r in self.ring.before(None, self.ring.size) if r.sentiment is None]
+        if known is None:
+            return self._refill()
+        version = self.inner.version()
+        if version == known:
+            with self._lock:
+                if generation == self._generation:
+                    self._stale = False
+            return
+
+        rows = self.inner.since(newest, self.ring.size)
+        # An insert, and an update if it was analyzed since.
+        explained = sum(1 if row["sentiment"] is None else 2 for row in rows)
+        analyzed = []
+        if version - known > explained and pending:
+            analyzed = [row for row in self.inner.fetch(pending) if row["sentiment"] is not None]
+            explained += len(analyzed)
+        if (
+            len(rows) == self.ring.size
+            or version - known != explained
+            # Written to while we read: the rows may not match `version`.
+            or self.inner.version() != version
+        ):
+            return self._refill()
+
+        with self._lock:
+            if generation != self._generation:
+                # Raced with another change; look again on the next read.
+                self._recheck()
+                return
+            for row in analyzed:
+                self.ring.replace(Record.from_row(row))
+            for row in rows:
+                if len(self.ring) == self.ring.size:
+                    self.complete = False
+                self.ring.add(Record.from_row(row))
+            self._version = version
+            self._stale = False
+            self._generation += 1
+
+    def _refill(self):
+        with self._lock:
+            generation = self._generation
+        # The version first: if a write lands in between, it is older than
+        # the rows and the next check refills again.
+        version = self.inner.version()
+        rows = self.inner.recent(self.ring.size)
+        with self._lock:
+            if generation != self._generation:
+                self._recheck()
+                return
+            self.ring.clear()
+            for row in reversed(rows):
+                self.ring.add(Record.from_row(row))
+            self.complete = len(rows) < self.ring.size
+            self._version = version
+            self._stale = False
+            self._generation += 1
+
+    def _read(self, fn):
+        """fn(ring) on an up-to-date ring; None when it cannot answer."""
+        if not self._unchanged():
+            self._refresh()
+        with self._lock:
+            if self._version is None:
+                return None
+            return fn(self.ring)
+
+    def append(self, person, text, created):
+        message_id = self.inner.append(person, text, created)
+        version = self.inner.version()
+        with self._lock:
+            newest = self.ring.newest_id()
+            # Written through only if this insert is the one change since
+            # the ring was filled and it sorts last.
+            if (
+                self._version is not None
+                and version == self._version + 1
+                and (newest is None or message_id > newest)
+            ):
+                if len(self.ring) == self.ring.size:
+                    self.complete = False
+                self.ring.add(Record(message_id, created, person, text, None, None, None, None))
+                self._version = version
+                self._generation += 1
+                return message_id
+        # Other rows were committed with it (group commit) or since; the
+        # next read catches up.
+        self._mark_stale()
+        return message_id
+
+    def page(self, before=None, limit=50, table="message"):
+        if table == "message":
+
+            def from_ring(ring):
+                rows = ring.before(before, limit + 1)
+                if len(rows) > limit or self.complete:
+                    return rows[:limit], len(rows) > limit
+                return None
+
+            result = self._read(from_ring)
+            if result is not None:
+                return result
+        return self.inner.page(before, limit, table)
+
+    def scan(self, before=None, batch_size=500):
+        return self.inner.scan(before, batch_size)
+
+    def recent(self, limit):
+        def from_ring(ring):
+            rows = ring.before(None, limit)
+            return rows if len(rows) == limit or self.complete else None
+
+        rows = self._read(from_ring)
+        return self.inner.recent(limit) if rows is None else rows
+
+    def since(self, after, limit):
+        def from_ring(ring):
+            oldest = ring.oldest_id()
+            if self.complete or (oldest is not None and after >= oldest):
+                return ring.after(after, limit)
+            return None
+
+        rows = self._read(from_ring)
+        return self.inner.since(after, limit) if rows is None else rows
+
+    def fetch(self, ids):
+        return self.inner.fetch(ids)
+
+    def last_id(self):
+        def from_ring(ring):
+            if self.complete:
+                return ring.newest_id() or 0
+            return ring.newest_id()
+
+        message_id = self._read(from_ring)
+        return self.inner.last_id() if message_id is None else message_id
+
+    def version(self):
+        version = self._read(lambda ring: self._version)
+        return self.inner.version() if version is None else version
+
+    def close(self, timeout=None):
+        self.inner.close(timeout)
+
+
+class ShardedStorage:
+    """SQLiteStorage shards (see the module docstring), read as one."""
+
+    def __init__(self, shards):
+        self.shards = shards
+
+    @property
+    def databases(self):
+        return [connect for shard in self.shards for connect in shard.databases]
+
+    def shard_for(self, person, created):
+        return self.shards[zlib.crc32(f"{person}\0{created}".encode()) % len(self.shards)]
+
+    def append(self, person, text, created):
+        return self.shard_for(person, created).append(person, text, created)
+
+    def page(self, before=None, limit=50, table="message"):
+        pages = [shard.page(before, limit, table) for shard in self.shards]
+        rows = list(
+            itertools.islice(
+                heapq.merge(*(rows for rows, _ in pages), key=_id, reverse=True), limit + 1
+            )
+        )
+        return rows[:limit], len(rows) > limit or any(more for _, more in pages)
+
+    def scan(self, before=None, batch_size=500):
+        scans = [shard.scan(before, batch_size) for shard in self.shards]
+        try:
+            rows = heapq.merge(
+                *(itertools.chain.from_iterable(scan) for scan in scans),
+                key=_id,
+                reverse=True,
+            )
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                yield batch
+        finally:
+            for scan in scans:
+                scan.close()
+
+    def recent(self, limit):
+        rows = heapq.merge(*(shard.recent(limit) for shard in self.shards), key=_id, reverse=True)
+        return list(itertools.islice(rows, limit))
+
+    def since(self, after, limit):
+        rows = heapq.merge(*(shard.since(after, limit) for shard in self.shards), key=_id)
+        return list(itertools.islice(rows, limit))
+
+    def fetch(self, ids):
+        return [row for shard in self.shards for row in shard.fetch(ids)]
+
+    def last_id(self):
+        return max(shard.last_id() for shard in self.shards)
+
+    def version(self):
+        # Every shard's version only grows, so the sum changes with any of them.
+        return sum(shard.version() for shard in self.shards)
+
+    def close(self, timeout=None):
+        for shard in self.shards:
+            shard.close(timeout)
+
+
+def shard_paths(path, count):
+    """DB_PATH for the first shard, then database-1.db and so on next to it."""
+    stem, ext = os.path.splitext(path)
+    return [path] + [f"{stem}-{i}{ext}" for i in range(1, count)]
+
+
+def open_storage(spec, primary, path=DB_PATH):
+    """
+    The backend named by `spec` (the STORAGE setting). `primary` is the
+    SQLiteStorage on `path`, which is also the first shard of a sharded
+    backend.
+    """
+    name, _, count = spec.partition(":")
+    if spec == "sqlite":
+        return primary
+    if spec == "memory":
+        return MemoryStorage()
+    if name != "sharded" or not count.isdigit() or int(count) < 1:
+        raise ValueError(f"STORAGE must be one of sqlite, memory, sharded:N; got {spec!r}")
+
+    count = int(count)
+    paths = shard_paths(path, count)
+    missing = [p for p in paths[1:] if not os.path.exists(p)]
+    if missing:
+        raise FileNotFoundError(
+            f"missing shards {', '.join(missing)}; create them with"
+            f" python init_db.py --shards {count}"
+        )
+    shards = [SQLiteStorage(primary.connect, primary.writer, count, 0)]
+    for offset, shard_path in enumerate(paths[1:], 1):
+        pool = ConnectionPool(shard_path)
+        atexit.register(pool.close_all)
+        writer = None
+        if primary.writer is not None:
+            writer = GroupCommitWriter(
+                pool.get, primary.writer.max_batch, primary.writer.max_delay
+            )
+        shards.append(SQLiteStorage(pool.get, writer, count, offset))
+    return ShardedStorage(shards)
@@ -0,0 +1,166 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from werkzeug.test import Client
+
+import app as clco
+from database import ConnectionPool, GroupCommitWriter
+from storage import insert_message
+
+
+class AppTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "database.db")
+
+        conn = sqlite3.connect(self.path)
+        with open("db/schema.sql") as f:
+            conn.executescript(f.read())
+        conn.executemany(
+            "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+            [
+                ("Tom", "Hello, world!", "2022-06-07 20:31:17"),
+                ("Peter", "I like Pizza", "2022-08-01 10:00:00"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        self.pool = ConnectionPool(self.path)
+        self._pool, clco.pool = clco.pool, self.pool
+        self.client = Client(clco.app)
+
+    def tearDown(self):
+        clco.pool = self._pool
+        self.pool.close_all()
+        self.tmp.cleanup()
+
+
+class TestConnectionPool(AppTestCase):
+    def test_reuses_connection_per_thread(self):
+        self.assertIs(self.pool.get(), self.pool.get())
+        self.assertEqual(len(self.pool), 1)
+
+    def test_pragmas(self):
+        conn = self.pool.get()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+
+    def test_close_all(self):
+        self.pool.get()
+        self.pool.close_all()
+        self.assertEqual(len(self.pool), 0)
+
+
+class TestGroupCommitWriter(AppTestCase):
+    def test_batches_concurrent_writes(self):
+        writer = GroupCommitWriter(self.pool.get, max_batch=64, max_delay=0.05)
+
+        def insert(i):
+            writer.submit(insert_message, f"p{i}", f"m{i}", "2023-01-01")
+
+        threads = [threading.Thread(target=insert, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+
+        count = self.pool.get().execute("SELECT COUNT(*) FROM message").fetchone()[0]
+        self.assertEqual(count, 22)
+        self.assertEqual(writer.writes, 20)
+        self.assertLess(writer.batches, 20)
+
+    def test_writer_syncs_every_batch(self):
+        writer = GroupCommitWriter(self.pool.get)
+        level = writer.submit(lambda conn: conn.execute("PRAGMA synchronous").fetchone()[0])
+        writer.close()
+        self.assertEqual(level, 2)  # FULL
+        self.assertEqual(self.pool.get().execute("PRAGMA synchronous").fetchone()[0], 1)
+
+    def test_failed_write_is_isolated(self):
+        writer = GroupCommitWriter(self.pool.get)
+        with self.assertRaises(sqlite3.IntegrityError):
+            writer.submit(insert_message, None, "m", "2023-01-01")
+        writer.submit(insert_message, "p", "m", "2023-01-01")
+        writer.close()
+
+        count = self.pool.get().execute("SELECT COUNT(*) FROM message").fetchone()[0]
+        self.assertEqual(count, 3)
+
+
+class TestRoutes(AppTestCase):
+    def test_messages(self):
+        resp = self.client.get("/messages")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn(b"I like Pizza", resp.get_data())
+
+    def test_messages_newest_first(self):
+        body = self.client.get("/messages").get_data()
+        self.assertLess(body.index(b"I like Pizza"), body.index(b"Hello, world!"))
+
+    def test_messages_pagination(self):
+        first = self.client.get("/messages?limit=1").get_data()
+        self.assertIn(b"I like Pizza", first)
+        self.assertNotIn(b"Hello, world!", first)
+        self.assertIn(b'hx-trigger="revealed"', first)
+
+        second = self.client.get("/messages?limit=1&before=2").get_data()
+        self.assertIn(b"Hello, world!", second)
+        self.assertNotIn(b"revealed", second)
+
+    def test_messages_after(self):
+        self.client.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        body = self.client.get("/messages?after=1").get_data()
+        self.assertLess(body.index(b"carpe diem"), body.index(b"I like Pizza"))
+        self.assertNotIn(b"Hello, world!", body)
+        self.assertNotIn(b"revealed", body)
+        self.assertNotIn(b"<tr", self.client.get("/messages?after=3").get_data())
+
+    def test_index_polls_under_wsgi(self):
+        body = self.client.get("/").get_data()
+        self.assertIn(b'hx-trigger="every 5s [newestId]"', body)
+        self.assertNotIn(b"sse-connect", body)
+
+    def test_messages_stream(self):
+        resp = self.client.get("/messages?stream=1&limit=1")
+        self.assertNotIn("Content-Length", resp.headers)
+        body = resp.get_data()
+        self.assertIn(b"I like Pizza", body)
+        self.assertIn(b"Hello, world!", body)
+        self.assertNotIn(b"revealed", body)
+
+    def test_hello(self):
+        resp = self.client.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn(b"carpe diem", self.client.get("/messages").get_data())
+
+    def test_conditional_get(self):
+        for path in ("/messages", "/sentiment"):
+            first = self.client.get(path)
+            etag = first.headers["ETag"]
+            self.assertEqual(first.headers["Cache-Control"], "no-cache")
+
+            again = self.client.get(path, headers={"If-None-Match": etag})
+            self.assertEqual(again.status_code, 304)
+            self.assertEqual(again.get_data(), b"")
+
+        self.client.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        changed = self.client.get("/messages", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+
+    def test_hello_quotes(self):
+        self.client.post("/hello", data={"name": "O'Brien", "message": "it's fine"})
+        self.assertIn(b"it&#39;s fine", self.client.get("/messages").get_data())
+
+    def test_escapes_html(self):
+        resp = self.client.post("/hello", data={"name": "<b>x</b>", "message": "<script>"})
+        self.assertIn(b"&lt;script&gt;", resp.get_data())
+        self.assertNotIn(b"<script>", self.client.get("/messages").get_data())
+
+
+if __name__ == "__main__":
+    unittest.main()
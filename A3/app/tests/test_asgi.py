@@ -0,0 +1,69 @@
+import unittest
+
+try:
+    from starlette.testclient import TestClient
+except (ImportError, RuntimeError):  # starlette or httpx not installed
+    TestClient = None
+
+from tests.test_app import AppTestCase
+
+
+@unittest.skipIf(TestClient is None, "requires starlette and httpx")
+class TestAsgiRoutes(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        import asgi
+
+        self.asgi = TestClient(asgi.app)
+
+    def test_messages(self):
+        resp = self.asgi.get("/messages?limit=1")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("I like Pizza", resp.text)
+        self.assertIn('hx-trigger="revealed"', resp.text)
+
+        again = self.asgi.get("/messages?limit=1", headers={"If-None-Match": resp.headers["ETag"]})
+        self.assertEqual(again.status_code, 304)
+
+    def test_index_follows_events(self):
+        body = self.asgi.get("/").text
+        self.assertIn('sse-connect="/events"', body)
+        self.assertIn("/assets/vendor/ext/sse.", body)
+        self.assertNotIn("every 5s", body)
+
+        self.asgi.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        resp = self.asgi.get("/messages?after=2")
+        self.assertEqual(resp.text.count("<tr"), 1)
+        self.assertIn("carpe diem", resp.text)
+
+    def test_stream(self):
+        resp = self.asgi.get("/messages?stream=1&limit=1")
+        self.assertEqual(resp.text.count("<tr"), 2)
+        for off in ("0", "no"):
+            resp = self.asgi.get(f"/messages?stream={off}&limit=1")
+            self.assertEqual(resp.text.count("<tr"), 1)
+            wsgi = self.client.get(f"/messages?stream={off}&limit=1")
+            self.assertEqual(resp.text, wsgi.get_data(as_text=True))
+
+    def test_search_offset(self):
+        self.assertIn("I like Pizza", self.asgi.get("/search?q=pizza").text)
+        resp = self.asgi.get("/search?q=pizza&offset=99999999999999999999999")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_hello_and_sentiment(self):
+        resp = self.asgi.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        self.assertIn("carpe diem", resp.text)
+        self.assertIn("Pending analysis", self.asgi.get("/sentiment").text)
+
+    def test_stats(self):
+        resp = self.asgi.get("/stats?period=day&limit=1&end=2022-08-01")
+        self.assertEqual(resp.json()["buckets"][0]["messages"], 1)
+        resp = self.asgi.get("/stats?period=day&end=2022-08-01", headers={"HX-Request": "true"})
+        self.assertIn("<td>2022-08-01</td>", resp.text)
+        self.assertIn("HX-Request", resp.headers["Vary"])
+        resp = self.asgi.get("/stats?period=day&end=0001-01-05&limit=30")
+        self.assertEqual(resp.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
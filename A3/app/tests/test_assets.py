@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import assets
+import build_static
+
+from tests.test_app import AppTestCase
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, "static")
+        self.target = os.path.join(self.source, "dist")
+        os.makedirs(os.path.join(self.source, "css"))
+        with open(os.path.join(self.source, "css", "site.css"), "w") as f:
+            f.write("body { color: red; }\n" * 50 + "/*# sourceMappingURL=site.css.map */\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fingerprints_and_compresses(self):
+        manifest = build_static.build(self.source, self.target, ["css/site.css"])
+        hashed = manifest["css/site.css"]
+        self.assertRegex(hashed, r"^css/site\.[0-9a-f]{12}\.css$")
+        self.assertEqual(assets.load_manifest(self.target), manifest)
+
+        path = os.path.join(self.target, hashed)
+        with open(path) as f:
+            self.assertNotIn("sourceMappingURL", f.read())
+        self.assertTrue(os.path.exists(path + ".gz"))
+
+        # A changed file gets a new name; the old one is removed.
+        with open(os.path.join(self.source, "css", "site.css"), "a") as f:
+            f.write("p { margin: 0; }\n")
+        rebuilt = build_static.build(self.source, self.target, ["css/site.css"])
+        self.assertNotEqual(rebuilt["css/site.css"], hashed)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(path + ".gz"))
+
+    def test_shipped_build_is_current(self):
+        # static/dist is committed; rebuild it after changing an asset.
+        manifest = build_static.build(
+            build_static.STATIC_DIR, self.target, build_static.ASSETS
+        )
+        self.assertEqual(assets.load_manifest(), manifest)
+
+
+class TestServing(AppTestCase):
+    def test_index_links_hashed_assets(self):
+        body = self.client.get("/").get_data(as_text=True)
+        self.assertIn("/assets/vendor/htmx.min.", body)
+        self.assertNotIn("unpkg.com", body)
+
+    def test_negotiates_encoding(self):
+        url = assets.Assets().url("bootstrap/css/bootstrap.min.css")
+        plain = self.client.get(url, headers={"Accept-Encoding": "identity"})
+        self.assertIsNone(plain.headers.get("Content-Encoding"))
+        self.assertEqual(plain.headers["Cache-Control"], assets.CACHE_CONTROL)
+        self.assertIn("Accept-Encoding", plain.headers["Vary"])
+
+        gzipped = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(gzipped.headers["Content-Encoding"], "gzip")
+        self.assertTrue(gzipped.headers["Content-Type"].startswith("text/css"))
+        self.assertLess(len(gzipped.get_data()), len(plain.get_data()) / 4)
+
+    def test_unknown_assets(self):
+        self.assertEqual(self.client.get("/assets/manifest.json").status_code, 404)
+        self.assertEqual(self.client.get("/assets/../app.py").status_code, 404)
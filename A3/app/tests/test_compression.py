@@ -0,0 +1,122 @@
+import gzip
+import unittest
+import zlib
+from unittest import mock
+
+import compression
+
+from tests.test_app import AppTestCase
+
+try:
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse, StreamingResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+except (ImportError, RuntimeError):  # starlette or httpx not installed
+    TestClient = None
+
+
+class TestNegotiation(unittest.TestCase):
+    def test_quality(self):
+        self.assertEqual(compression.accepted("gzip, deflate, br", "br"), 1.0)
+        self.assertEqual(compression.accepted("gzip;q=0.8, br;q=0", "br"), 0.0)
+        self.assertEqual(compression.accepted("gzip;q=0.8", "gzip"), 0.8)
+        self.assertEqual(compression.accepted("*;q=0.5", "br"), 0.5)
+        self.assertEqual(compression.accepted(None, "gzip"), 0.0)
+
+    def test_prefers_earlier_encoding_on_ties(self):
+        self.assertEqual(compression.negotiate("gzip, br", ("br", "gzip")), "br")
+        self.assertEqual(compression.negotiate("gzip, br;q=0.5", ("br", "gzip")), "gzip")
+        self.assertIsNone(compression.negotiate("identity", ("br", "gzip")))
+
+    def test_compressible(self):
+        html = [("Content-Type", "text/html; charset=utf-8")]
+        self.assertTrue(compression.compressible(200, html))
+        self.assertFalse(compression.compressible(200, html + [("Content-Length", "10")]))
+        self.assertFalse(compression.compressible(304, html))
+        self.assertFalse(compression.compressible(200, [("Content-Type", "text/event-stream")]))
+        self.assertFalse(compression.compressible(200, html + [("Content-Encoding", "br")]))
+
+
+class TestWsgi(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        conn = self.pool.get()
+        with conn:
+            conn.executemany(
+                "INSERT INTO message (person, text, created) VALUES ('Eve', ?, '2023-01-01')",
+                [(f"message number {i}",) for i in range(100)],
+            )
+
+    def get(self, url, encoding, **kwargs):
+        return self.client.get(url, headers={"Accept-Encoding": encoding}, **kwargs)
+
+    def test_compresses_fragments(self):
+        plain = self.get("/messages", "identity")
+        self.assertNotIn("Content-Encoding", plain.headers)
+
+        resp = self.get("/messages", "gzip")
+        self.assertEqual(resp.headers["Content-Encoding"], "gzip")
+        self.assertEqual(resp.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(int(resp.headers["Content-Length"]), len(resp.get_data()))
+        self.assertEqual(gzip.decompress(resp.get_data()), plain.get_data())
+
+        # Weak ETags still validate the compressed response.
+        again = self.client.get(
+            "/messages",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]},
+        )
+        self.assertEqual(again.status_code, 304)
+
+    def test_skips_small_bodies(self):
+        resp = self.get("/messages?limit=1", "gzip")
+        self.assertNotIn("Content-Encoding", resp.headers)
+
+    def test_streams_chunk_by_chunk(self):
+        plain = self.get("/messages?stream=1", "identity").get_data()
+        with mock.patch("app.STREAM_BATCH_SIZE", 20):
+            resp = self.get("/messages?stream=1", "gzip", buffered=False)
+            chunks = list(resp.response)
+        self.assertNotIn("Content-Length", resp.headers)
+        self.assertGreater(len(chunks), 3)
+
+        # Every chunk decodes on arrival.
+        decoder = zlib.decompressobj(31)
+        body = b""
+        for chunk in chunks:
+            body += decoder.decompress(chunk)
+        self.assertEqual(body, plain)
+
+
+@unittest.skipIf(TestClient is None, "requires starlette and httpx")
+class TestAsgi(unittest.TestCase):
+    def setUp(self):
+        async def small(request):
+            return PlainTextResponse("hello")
+
+        async def large(request):
+            return PlainTextResponse("hello world " * 200)
+
+        async def stream(request):
+            async def chunks():
+                for i in range(5):
+                    yield f"chunk {i} ".encode() * 100
+
+            return StreamingResponse(chunks(), media_type="text/html")
+
+        app = Starlette(routes=[Route("/small", small), Route("/large", large),
+                                Route("/stream", stream)])
+        self.client = TestClient(compression.ASGICompressionMiddleware(app, encodings=("gzip",)))
+
+    def test_responses(self):
+        headers = {"Accept-Encoding": "gzip"}
+        self.assertNotIn("content-encoding", self.client.get("/small", headers=headers).headers)
+
+        resp = self.client.get("/large", headers=headers)
+        self.assertEqual(resp.headers["content-encoding"], "gzip")
+        self.assertEqual(resp.text, "hello world " * 200)
+
+        resp = self.client.get("/stream", headers=headers)
+        self.assertEqual(resp.headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", resp.headers)
+        self.assertEqual(resp.text, "".join(f"chunk {i} " * 100 for i in range(5)))
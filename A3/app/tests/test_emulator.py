@@ -0,0 +1,94 @@
+import os
+import unittest
+from unittest import mock
+
+import requests
+from azure.ai.textanalytics import TextAnalyticsClient
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError
+
+import sentiment
+from emulator import Emulator, parse_latency, serve
+
+
+class EmulatorTestCase(unittest.TestCase):
+    emulator_options = {}
+
+    def setUp(self):
+        self.emulator = Emulator(seed=0, **self.emulator_options)
+        self.server = serve(self.emulator)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, **kwargs):
+        return TextAnalyticsClient(
+            endpoint=self.endpoint, credential=AzureKeyCredential("local"), **kwargs
+        )
+
+
+class TestEmulator(EmulatorTestCase):
+    def test_scores_documents(self):
+        for api_version in ("2023-04-01", "v3.1"):
+            result = self.client(api_version=api_version).analyze_sentiment(
+                ["I love this", "this is awful", "it is Tuesday"]
+            )
+            self.assertEqual(
+                [doc.sentiment for doc in result], ["positive", "negative", "neutral"]
+            )
+
+    def test_rejects_more_than_ten_documents(self):
+        with self.assertRaises(HttpResponseError) as cm:
+            self.client().analyze_sentiment(["hello"] * 11)
+        self.assertEqual(cm.exception.status_code, 400)
+        self.assertEqual(self.emulator.stats["rejected"], 1)
+
+    def test_requires_a_key(self):
+        resp = requests.post(f"{self.endpoint}/language/:analyze-text", json={})
+        self.assertEqual(resp.status_code, 401)
+
+    def test_latency_specs(self):
+        self.assertEqual(parse_latency("50")(), 0.05)
+        self.assertTrue(0.02 <= parse_latency("uniform:20:30")() <= 0.03)
+        with self.assertRaises(ValueError):
+            parse_latency("gamma:1")
+
+
+class TestEmulatorFailures(EmulatorTestCase):
+    emulator_options = {"error_rate": 0.5}
+
+    def test_partial_errors(self):
+        result = self.client().analyze_sentiment([f"good {i}" for i in range(10)])
+        errors = [doc for doc in result if doc.is_error]
+        self.assertTrue(0 < len(errors) < 10)
+        self.assertEqual(self.emulator.stats["document_errors"], len(errors))
+
+    def test_throttles_with_retry_after(self):
+        self.emulator.throttle = 1.0
+        self.emulator.retry_after = 7
+        resp = requests.post(
+            f"{self.endpoint}/language/:analyze-text",
+            headers={"Ocp-Apim-Subscription-Key": "local"},
+            json={"kind": "SentimentAnalysis", "analysisInput": {"documents": []}},
+        )
+        self.assertEqual(resp.status_code, 429)
+        self.assertEqual(resp.headers["Retry-After"], "7")
+
+    def test_rate_limit(self):
+        emulator = Emulator(rate=1, burst=2)
+        self.assertIsNone(emulator.check_throttle())
+        self.assertIsNone(emulator.check_throttle())
+        self.assertEqual(emulator.check_throttle(), 1)
+
+
+class TestAnalyzeDocumentsAgainstEmulator(EmulatorTestCase):
+    def test_analyze_documents(self):
+        env = {"AZ_ENDPOINT": self.endpoint, "AZ_KEY": "local"}
+        state = dict.fromkeys(["_pid", "_client", "_session", "_executor"])
+        with mock.patch.dict(os.environ, env), mock.patch.multiple(sentiment, **state):
+            results = sentiment.analyze_documents([f"good {i}" for i in range(25)] + ["bad"])
+        self.assertEqual(len(results), 26)
+        self.assertEqual(results[-1].label, "negative")
+        self.assertEqual(self.emulator.stats["requests"], 3)
@@ -0,0 +1,82 @@
+import unittest
+
+import app as clco
+from events import Broadcaster, format_event
+from storage import SQLiteStorage, insert_message
+
+from tests.test_app import AppTestCase
+
+
+class TestFormatEvent(unittest.TestCase):
+    def test_multiline_data(self):
+        event = format_event(3, "<tr>\n  <td>a</td>\n</tr>\n")
+        self.assertEqual(
+            event, "id: 3\nevent: message\ndata: <tr>\ndata:   <td>a</td>\ndata: </tr>\n\n"
+        )
+
+
+class TestBroadcaster(AppTestCase):
+    def test_fans_out_new_rows(self):
+        broadcaster = Broadcaster(
+            SQLiteStorage(self.pool.get), clco.fragments.row, poll_interval=0.01
+        )
+        first = broadcaster.subscribe()
+        second = broadcaster.subscribe()
+        try:
+            insert_message(self.pool.get(), "Max", "carpe diem", "2023-01-01")
+            self.pool.get().commit()
+            broadcaster.notify()
+
+            for subscription in (first, second):
+                messages = subscription.get(timeout=5)
+                self.assertEqual([m[0] for m in messages], [3])
+                self.assertIn("carpe diem", messages[0][1])
+        finally:
+            broadcaster.close()
+
+        self.assertIsNone(first.get(timeout=0))
+
+
+class TestEventsRoute(AppTestCase):
+    def test_replays_since_last_event_id(self):
+        broadcaster, clco.broadcaster = clco.broadcaster, Broadcaster(
+            SQLiteStorage(self.pool.get), clco.fragments.row
+        )
+        resp = self.client.get("/events", headers={"Last-Event-ID": "1"})
+        try:
+            self.assertEqual(resp.mimetype, "text/event-stream")
+            chunk = next(iter(resp.response))
+            self.assertIn(b"id: 2\n", chunk)
+            self.assertIn(b"I like Pizza", chunk)
+            self.assertNotIn(b"Hello, world!", chunk)
+        finally:
+            resp.close()
+            clco.broadcaster.close()
+            clco.broadcaster = broadcaster
+
+    def test_catches_up_more_than_one_batch(self):
+        conn = self.pool.get()
+        for i in range(25):
+            insert_message(conn, "Max", f"m{i}", "2023-01-01")
+        conn.commit()
+        broadcaster, clco.broadcaster = clco.broadcaster, Broadcaster(
+            SQLiteStorage(self.pool.get), clco.fragments.row, batch_size=10
+        )
+        resp = self.client.get("/events?after=0")
+        try:
+            ids = []
+            for chunk in resp.response:
+                if chunk.startswith(b": keep-alive"):
+                    break
+                ids.append(int(chunk.split(b"\n", 1)[0][4:]))
+                if len(ids) == 27:
+                    break
+            self.assertEqual(ids, list(range(1, 28)))
+        finally:
+            resp.close()
+            clco.broadcaster.close()
+            clco.broadcaster = broadcaster
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+
+from init_db import bulk_load, synthetic_rows
+
+
+class TestBulkLoad(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.tmp.name, "database.db"))
+        with open("db/schema.sql") as f:
+            self.conn.executescript(f.read())
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def test_loads_ordered_rows_and_restores_triggers(self):
+        start, end = datetime(2022, 1, 1), datetime(2022, 2, 1)
+        batches = synthetic_rows(2500, start, end, 1000, people=50, rng=random.Random(0))
+        rows, _, _ = bulk_load(self.conn, batches)
+
+        self.assertEqual(rows, 2500)
+        created = [r[0] for r in self.conn.execute("SELECT created FROM message ORDER BY id")]
+        self.assertEqual(len(created), 2500)
+        self.assertEqual(created, sorted(created))
+        self.assertTrue(str(start) <= created[0] and created[-1] < str(end))
+
+        # One version bump for the whole load, and the triggers are back.
+        self.assertEqual(
+            self.conn.execute("SELECT value FROM version WHERE name = 'message'").fetchone()[0],
+            1,
+        )
+        self.conn.execute("INSERT INTO message (person, text, created) VALUES ('a', 'b', 'c')")
+        self.assertEqual(
+            self.conn.execute("SELECT value FROM version WHERE name = 'message'").fetchone()[0],
+            2,
+        )
+        # One row per indexed message.
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM message_fts_docsize").fetchone()[0], 2501
+        )
+        self.assertEqual(
+            self.conn.execute(
+                "SELECT SUM(messages) FROM message_rollup WHERE period = 'day'"
+            ).fetchone()[0],
+            2501,
+        )
+        self.assertEqual(self.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM sentiment_job").fetchone()[0], 0)
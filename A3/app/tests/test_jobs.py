@@ -0,0 +1,125 @@
+import sqlite3
+import time
+import unittest
+
+from database import ConnectionPool
+from jobs import SentimentQueue, SentimentWorker, enqueue
+from sentiment import Sentiment
+
+from tests.test_app import AppTestCase
+
+
+class TestSentimentQueue(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.queue = SentimentQueue(self.pool.get, max_attempts=2, lease=60)
+        conn = self.pool.get()
+        for message_id in (1, 2):
+            enqueue(conn, message_id)
+        conn.commit()
+        self.calls = []
+
+    def analyze(self, texts):
+        self.calls.append(texts)
+        return [Sentiment("positive", 0.8, 0.1, 0.1) for _ in texts]
+
+    def test_worker_stores_sentiment(self):
+        worker = SentimentWorker([self.queue], self.analyze)
+        self.assertEqual(worker.run_once(), 2)
+        self.assertEqual(worker.run_once(), 0)
+
+        rows = self.pool.get().execute("SELECT sentiment, positive FROM message").fetchall()
+        self.assertEqual([tuple(r) for r in rows], [("positive", 0.8)] * 2)
+        self.assertEqual(self.queue.depth(), {"pending": 0, "running": 0, "failed": 0})
+
+    def test_sentiment_route_is_local(self):
+        SentimentWorker([self.queue], self.analyze).run_once()
+        body = self.client.get("/sentiment").get_data()
+        self.assertIn(b"Positive with 0.8 certainty", body)
+
+    def test_hello_enqueues(self):
+        self.client.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        self.assertEqual(self.client.get("/queue").json["pending"], 3)
+        self.assertIn(b"Pending analysis", self.client.get("/sentiment").get_data())
+
+    def test_expired_lease_is_reclaimed(self):
+        self.assertEqual(len(self.queue.claim()), 2)
+        self.assertEqual(self.queue.claim(), [])
+
+        self.queue.lease = 0
+        time.sleep(0.01)
+        self.assertEqual(len(self.queue.claim()), 2)
+
+    def test_retries_then_fails(self):
+        def broken(texts):
+            raise RuntimeError("throttled")
+
+        worker = SentimentWorker([self.queue], broken)
+        worker.run_once()
+        self.assertEqual(self.queue.depth()["pending"], 2)
+
+        self.pool.get().execute("UPDATE sentiment_job SET not_before = 0")
+        self.pool.get().commit()
+        worker.run_once()
+        self.assertEqual(self.queue.depth()["failed"], 2)
+
+
+class TestMigration(AppTestCase):
+    def test_migrates_old_schema(self):
+        path = self.path + ".old"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE message (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " created TIMESTAMP NOT NULL, person TEXT NOT NULL, text TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO message (person, text, created) VALUES ('a', 'b', 'c')")
+        conn.commit()
+        conn.close()
+
+        pool = ConnectionPool(path)
+        try:
+            queue = SentimentQueue(pool.get)
+            self.assertEqual(queue.depth()["pending"], 1)
+            row = pool.get().execute("SELECT sentiment FROM message").fetchone()
+            self.assertIsNone(row["sentiment"])
+            version = pool.get().execute("SELECT value FROM version").fetchone()
+            self.assertEqual(version[0], 0)
+            hits = pool.get().execute(
+                "SELECT rowid FROM message_fts WHERE message_fts MATCH 'b'"
+            ).fetchall()
+            self.assertEqual(len(hits), 1)
+        finally:
+            pool.close_all()
+
+    def test_migrated_schema_matches_schema_sql(self):
+        path = self.path + ".old"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE message (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " created TIMESTAMP NOT NULL, person TEXT NOT NULL, text TEXT NOT NULL)"
+        )
+        conn.close()
+        pool = ConnectionPool(path)
+        try:
+            migrated = pool.get()
+            fresh = sqlite3.connect(self.path)
+            self.addCleanup(fresh.close)
+
+            def schema(conn):
+                # message itself differs only in how its columns were added.
+                return conn.execute(
+                    "SELECT type, name, tbl_name, sql FROM sqlite_master"
+                    " WHERE name != 'message' ORDER BY name"
+                ).fetchall()
+
+            def columns(conn):
+                return [tuple(row)[1:] for row in conn.execute("PRAGMA table_info(message)")]
+
+            self.assertEqual([tuple(r) for r in schema(migrated)], schema(fresh))
+            self.assertEqual(columns(migrated), columns(fresh))
+        finally:
+            pool.close_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
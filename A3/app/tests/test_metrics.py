@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from prometheus_client import REGISTRY
+
+import metrics
+from database import ConnectionPool
+
+from tests.test_app import AppTestCase
+
+WORKER = """
+import metrics
+metrics.REQUEST_LATENCY.labels("GET", "/messages", 200).observe(0.01)
+metrics.CONNECTIONS.set(2)
+"""
+
+
+class TestMetricsRoute(AppTestCase):
+    def test_exports_request_and_query_metrics(self):
+        self.client.get("/messages")
+        resp = self.client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["Content-Type"].startswith("text/plain"))
+
+        body = resp.get_data(as_text=True)
+        self.assertIn(
+            'http_request_duration_seconds_count{method="GET",route="/messages",status="200"}',
+            body,
+        )
+        self.assertIn('sqlite_query_duration_seconds_count{statement="SELECT"}', body)
+        self.assertIn('sentiment_jobs{state="pending"} 0.0', body)
+        self.assertIn("http_requests_in_flight", body)
+
+    def test_unknown_paths_share_one_label(self):
+        self.client.get("/nope/1")
+        self.client.get("/nope/2")
+        body = self.client.get("/metrics").get_data(as_text=True)
+        self.assertIn('route="unmatched",status="404"', body)
+        self.assertNotIn("/nope", body)
+
+
+class TestConnectionGauge(unittest.TestCase):
+    def test_counts_every_pool(self):
+        def value():
+            return REGISTRY.get_sample_value("sqlite_connections")
+
+        start = value()
+        with tempfile.TemporaryDirectory() as path:
+            pools = [ConnectionPool(os.path.join(path, f"{i}.db")) for i in range(2)]
+            for pool in pools:
+                pool.get()
+            self.assertEqual(value(), start + 2)
+            pools[0].close_all()
+            self.assertEqual(value(), start + 1)
+            pools[1].close_all()
+        self.assertEqual(value(), start)
+
+
+class TestMultiProcess(unittest.TestCase):
+    def test_merges_worker_processes(self):
+        with tempfile.TemporaryDirectory() as path:
+            env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=path)
+            for _ in range(2):
+                subprocess.run([sys.executable, "-c", WORKER], env=env, check=True)
+
+            body = metrics.render(path=path)[0].decode()
+
+        self.assertIn(
+            'http_request_duration_seconds_count{method="GET",route="/messages",status="200"} 2.0',
+            body,
+        )
+        # Both workers have exited, but neither was marked dead.
+        self.assertIn("sqlite_connections 4.0", body)
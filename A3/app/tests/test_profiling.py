@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from flask import Flask
+from werkzeug.test import Client
+
+import profiling
+
+
+def make_app(**kwargs):
+    app = Flask(__name__)
+
+    @app.route("/work")
+    def work():
+        data = [str(i) * 10 for i in range(200000)]
+        return str(len(data))
+
+    profiling.init_app(app, **kwargs)
+    return app
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_off_registers_nothing(self):
+        app = make_app(secret=None, always=False, directory=self.tmp.name)
+        self.assertEqual(app.before_request_funcs, {})
+        self.assertEqual(app.after_request_funcs, {})
+
+    def test_secret_header(self):
+        client = Client(make_app(secret="s3cret", directory=self.tmp.name))
+
+        self.assertNotIn("X-Profile-Id", client.get("/work").headers)
+        self.assertNotIn("X-Profile-Id", client.get("/work", headers={"X-Profile": "x"}).headers)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+        resp = client.get("/work", headers={"X-Profile": "s3cret"})
+        self.assertEqual(resp.status_code, 200)
+        prefix = os.path.join(self.tmp.name, resp.headers["X-Profile-Id"])
+
+        with open(f"{prefix}.folded") as f:
+            folded = f.read()
+        self.assertIn("work (test_profiling.py:", folded)
+        with open(f"{prefix}.alloc.txt") as f:
+            self.assertIn("test_profiling.py", f.read())
+
+    def test_profile_all(self):
+        client = Client(make_app(always=True, directory=self.tmp.name))
+        client.get("/work")
+        client.get("/work")
+        self.assertEqual(len(os.listdir(self.tmp.name)), 4)
@@ -0,0 +1,213 @@
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import resilience
+import sentiment
+from jobs import SentimentQueue, SentimentWorker, enqueue
+from resilience import CircuitBreaker, CircuitOpen, DeadlineExceeded, RetryBudget
+from sentiment import Sentiment, SentimentCache
+
+from tests.test_app import AppTestCase
+from tests.test_emulator import EmulatorTestCase
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.changes = []
+        self.breaker = CircuitBreaker(
+            threshold=2, reset=10, on_change=self.changes.append, clock=self.clock
+        )
+
+    def test_opens_after_threshold(self):
+        self.breaker.failure()
+        self.breaker.before_call()
+        self.breaker.failure()
+        with self.assertRaises(CircuitOpen) as cm:
+            self.breaker.before_call()
+        self.assertEqual(cm.exception.retry_after, 10)
+        self.assertEqual(self.changes, ["open"])
+
+    def test_success_resets_count(self):
+        self.breaker.failure()
+        self.breaker.success()
+        self.breaker.failure()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_single_trial_after_reset(self):
+        self.breaker.failure()
+        self.breaker.failure()
+        self.clock.now = 10
+        self.breaker.before_call()
+        with self.assertRaises(CircuitOpen):
+            self.breaker.before_call()
+        self.breaker.success()
+        self.breaker.before_call()
+        self.assertEqual(self.changes, ["open", "half_open", "closed"])
+
+    def test_failed_trial_reopens_for_retry_after(self):
+        self.breaker.failure()
+        self.breaker.failure()
+        self.clock.now = 10
+        self.breaker.before_call()
+        self.breaker.failure(retry_after=60)
+        self.assertEqual(self.breaker.retry_after(), 60)
+
+
+class TestCall(unittest.TestCase):
+    def flaky(self, failures, error=RuntimeError("throttled")):
+        calls = []
+
+        def fn(remaining):
+            calls.append(remaining)
+            if len(calls) <= failures:
+                raise error
+            return "ok"
+
+        return fn, calls
+
+    def test_honors_retry_after(self):
+        fn, calls = self.flaky(1)
+        start = time.monotonic()
+        result = resilience.call(fn, start + 5, RetryBudget(), lambda e: 0.05)
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(calls), 2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_gives_up_when_retry_after_passes_deadline(self):
+        fn, calls = self.flaky(1)
+        with self.assertRaises(RuntimeError):
+            resilience.call(fn, time.monotonic() + 1, RetryBudget(), lambda e: 30)
+        self.assertEqual(len(calls), 1)
+
+    def test_final_errors_are_not_retried(self):
+        fn, calls = self.flaky(1)
+        with self.assertRaises(RuntimeError):
+            resilience.call(fn, time.monotonic() + 1, RetryBudget(), lambda e: None)
+        self.assertEqual(len(calls), 1)
+
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(ratio=0.1, max_tokens=1)
+        fn, calls = self.flaky(10)
+        for _ in range(3):
+            with self.assertRaises(RuntimeError):
+                resilience.call(fn, time.monotonic() + 1, budget, lambda e: 0.001)
+        # One token to start with, a tenth more per call.
+        self.assertEqual(len(calls), 4)
+
+
+class TestAnalyzeDocuments(EmulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        env = {"AZ_ENDPOINT": self.endpoint, "AZ_KEY": "local"}
+        with mock.patch.dict(os.environ, env):
+            client, self.session = sentiment._create_client()
+        self.executor = ThreadPoolExecutor(4)
+        self.breaker = CircuitBreaker(threshold=2, reset=60)
+        self.patches = [
+            mock.patch.object(sentiment, "_process_state", lambda: (client, self.executor)),
+            mock.patch.object(sentiment, "breaker", self.breaker),
+            mock.patch.object(sentiment, "retry_budget", RetryBudget()),
+            mock.patch.object(resilience, "DEADLINE", 2),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.executor.shutdown()
+        self.session.close()
+        super().tearDown()
+
+    def test_sdk_does_not_retry(self):
+        self.emulator.throttle = 1.0
+        self.emulator.retry_after = 30
+        start = time.monotonic()
+        with self.assertRaises(Exception):
+            sentiment.analyze_documents(["hello"])
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.emulator.stats["throttled"], 1)
+
+    def test_retries_after_throttling(self):
+        # Throttled once, with a Retry-After of 50ms.
+        with mock.patch.object(self.emulator, "check_throttle", side_effect=["0.05", None]):
+            start = time.monotonic()
+            results = sentiment.analyze_documents(["I love this"])
+        self.assertEqual(results[0].label, "positive")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(self.emulator.stats["throttled"], 1)
+
+    def test_deadline(self):
+        self.emulator.latency = lambda: 1.0
+        with mock.patch.object(resilience, "DEADLINE", 0.2):
+            start = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                sentiment.analyze_documents(["hello"])
+            self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(self.breaker.failures, 1)
+
+    def test_breaker_fails_fast(self):
+        self.emulator.throttle = 1.0
+        self.emulator.retry_after = 30
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                sentiment.analyze_documents(["hello"])
+        self.assertEqual(self.breaker.state, "open")
+        # Opened for as long as the service asked.
+        self.assertGreater(self.breaker.retry_after(), 59)
+
+        with self.assertRaises(CircuitOpen):
+            sentiment.analyze_documents(["hello"])
+        self.assertEqual(self.emulator.stats["requests"], 2)
+
+
+class TestOpenCircuit(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.open = True
+
+    def analyze(self, texts):
+        if self.open:
+            raise CircuitOpen(30)
+        return [Sentiment("positive", 0.9, 0.05, 0.05) for _ in texts]
+
+    def test_serves_expired_results(self):
+        cache = SentimentCache(self.pool.get, ttl=0)
+        self.open = False
+        cache.analyze(["a"], self.analyze)
+        self.open = True
+        self.assertEqual(cache.analyze(["a"], self.analyze)[0].label, "positive")
+        with self.assertRaises(CircuitOpen):
+            cache.analyze(["a", "b"], self.analyze)
+
+    def test_worker_postpones_without_an_attempt(self):
+        queue = SentimentQueue(self.pool.get, max_attempts=1)
+        conn = self.pool.get()
+        enqueue(conn, 1)
+        conn.commit()
+        worker = SentimentWorker([queue], self.analyze)
+        self.assertEqual(worker.run_once(), 1)
+        self.assertEqual(queue.claim(), [])
+
+        job = conn.execute("SELECT state, attempts, not_before FROM sentiment_job").fetchone()
+        self.assertEqual((job["state"], job["attempts"]), ("pending", 0))
+        self.assertGreater(job["not_before"], time.time() + 20)
+
+    def test_queue_reports_circuit(self):
+        self.assertEqual(self.client.get("/queue").json["circuit"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import time
+import unittest
+
+from retention import Retention, RetentionWorker
+
+from tests.test_app import AppTestCase
+
+
+class TestRetention(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.retention = Retention(self.pool.get, days=30, batch_size=2, pause=0)
+        conn = self.pool.get()
+        with conn:
+            # Tom and Peter are from 2022; add five recent messages.
+            conn.executemany(
+                "INSERT INTO message (person, text, created) VALUES ('Eve', ?, datetime('now'))",
+                [(f"recent {i}",) for i in range(5)],
+            )
+            conn.execute("INSERT INTO sentiment_job (message_id) VALUES (1)")
+
+    def count(self, table):
+        return self.pool.get().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_moves_expired_rows_in_batches(self):
+        self.retention.batch_size = 1
+        self.assertEqual(self.retention.archive_batch(), 1)
+        self.assertEqual(self.count("message_archive"), 1)
+
+        self.assertEqual(self.retention.run_once(), 1)
+        self.assertEqual(self.count("message"), 5)
+        self.assertEqual(self.count("message_archive"), 2)
+        self.assertEqual(self.count("sentiment_job"), 0)
+        self.assertEqual(self.retention.run_once(), 0)
+
+        hits = self.pool.get().execute(
+            "SELECT rowid FROM message_fts WHERE message_fts MATCH 'pizza'"
+        ).fetchall()
+        self.assertEqual(hits, [])
+
+    def test_messages_continue_into_archive(self):
+        self.retention.run_once()
+
+        body = self.client.get("/messages?limit=6").get_data(as_text=True)
+        self.assertIn("recent 0", body)
+        self.assertIn("I like Pizza", body)
+        self.assertIn("/archive?before=2", body)
+
+        body = self.client.get("/archive?before=2").get_data(as_text=True)
+        self.assertIn("Hello, world!", body)
+        self.assertNotIn("revealed", body)
+
+    def test_only_archive_left(self):
+        conn = self.pool.get()
+        with conn:
+            conn.execute("DELETE FROM message WHERE person = 'Eve'")
+        self.retention.run_once()
+        body = self.client.get("/messages").get_data(as_text=True)
+        self.assertIn("I like Pizza", body)
+        self.assertIn("Hello, world!", body)
+
+    def test_one_lease_holder_at_a_time(self):
+        self.assertTrue(self.retention.acquire("a", ttl=60))
+        self.assertTrue(self.retention.acquire("a", ttl=60))
+        self.assertFalse(self.retention.acquire("b", ttl=60))
+        self.retention.release("a")
+        self.assertTrue(self.retention.acquire("b", ttl=60))
+
+    def test_expired_lease_is_taken_over(self):
+        self.assertTrue(self.retention.acquire("a", ttl=-1))
+        self.assertTrue(self.retention.acquire("b", ttl=60))
+        self.assertFalse(self.retention.acquire("a", ttl=60))
+
+    def test_worker_without_lease_does_not_archive(self):
+        self.retention.acquire("other", ttl=60)
+        worker = RetentionWorker([self.retention], interval=0.01)
+        worker.start()
+        time.sleep(0.05)
+        worker.stop()
+        self.assertEqual(self.count("message_archive"), 0)
+
+        self.retention.release("other")
+        worker = RetentionWorker([self.retention], interval=0.01)
+        worker.start()
+        time.sleep(0.05)
+        worker.stop()
+        self.assertEqual(self.count("message_archive"), 2)
+        self.assertEqual(self.count("lease"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
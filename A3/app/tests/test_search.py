@@ -0,0 +1,99 @@
+import re
+import unittest
+from unittest import mock
+
+import app as clco
+
+from tests.test_app import AppTestCase
+
+
+class TestSearchTerms(unittest.TestCase):
+    def test_quotes_words(self):
+        self.assertEqual(
+            clco.search_terms('pizza OR "x" NEAR('), ['"pizza"', '"OR"', '"x"', '"NEAR"*']
+        )
+
+    def test_prefixes(self):
+        self.assertEqual(clco.search_terms("piz* hello wor"), ['"piz"*', '"hello"', '"wor"*'])
+        # Shorter than the smallest indexed prefix: match the word itself.
+        self.assertEqual(clco.search_terms("a b*"), ['"a"', '"b"'])
+
+
+class TestSearch(AppTestCase):
+    def search(self, q, **args):
+        return self.client.get("/search", query_string={"q": q, **args}).get_data(as_text=True)
+
+    def test_finds_messages(self):
+        body = self.search("pizza")
+        self.assertIn("I like Pizza", body)
+        self.assertNotIn("Hello, world!", body)
+        self.assertIn('id="search-2"', body)
+
+    def test_prefix_and_person(self):
+        self.assertIn("Hello, world!", self.search("wor"))
+        self.assertIn("I like Pizza", self.search("pete"))
+
+    def test_empty_query(self):
+        self.assertNotIn("<tr", self.search(""))
+        self.assertNotIn("<tr", self.search("(*)"))
+
+    def test_rejects_huge_offset(self):
+        resp = self.client.get("/search?q=hello&offset=99999999999999999999999")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(self.client.get("/search?q=hello&offset=100000").status_code, 200)
+
+    def test_index_follows_writes(self):
+        self.client.post("/hello", data={"name": "Max", "message": "carpe diem"})
+        self.assertIn("carpe diem", self.search("carpe"))
+
+        conn = self.pool.get()
+        with conn:
+            conn.execute("UPDATE message SET text = 'seize the day' WHERE person = 'Max'")
+        self.assertNotIn("carpe diem", self.search("carpe"))
+        self.assertIn("seize the day", self.search("seize"))
+
+        with conn:
+            conn.execute("DELETE FROM message WHERE person = 'Max'")
+        self.assertNotIn("<tr", self.search("seize"))
+
+    def test_ranking_and_pagination(self):
+        conn = self.pool.get()
+        with conn:
+            conn.executemany(
+                "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+                [
+                    ("Anna", "pizza pizza pizza", "2023-01-01"),
+                    ("Bob", "pizza and a long message about many other things", "2023-01-02"),
+                ],
+            )
+        body = self.search("pizza", limit=2)
+        self.assertLess(body.index("pizza pizza pizza"), body.index("I like Pizza"))
+        self.assertIn("offset=2", body)
+        self.assertIn("many other things", self.search("pizza", limit=2, offset=2))
+
+        # Too common to rank: newest first instead.
+        with mock.patch.object(clco, "SEARCH_RANK_LIMIT", 1):
+            body = self.search("pizza")
+        self.assertLess(body.index("many other things"), body.index("pizza pizza pizza"))
+
+    def test_pages_past_the_ranked_window(self):
+        conn = self.pool.get()
+        with conn:
+            conn.executemany(
+                "INSERT INTO message (person, text, created) VALUES (?, ?, ?)",
+                [("Anna", f"pizza {i}", "2023-01-01") for i in range(5)],
+            )
+        texts = []
+        with mock.patch.object(clco, "SEARCH_WINDOW", 2):
+            for offset in range(0, 10, 2):
+                body = self.search("pizza", limit=2, offset=offset)
+                texts += re.findall(r"<td>(I like Pizza|pizza \d)</td>", body)
+                if "hx-trigger" not in body:
+                    break
+        self.assertEqual(sorted(texts[:2]), ["pizza 3", "pizza 4"])
+        self.assertEqual(texts[2:], ["pizza 2", "pizza 1", "pizza 0", "I like Pizza"])
+
+    def test_conditional_get(self):
+        resp = self.client.get("/search?q=pizza")
+        cached = self.client.get("/search?q=pizza", headers={"If-None-Match": resp.headers["ETag"]})
+        self.assertEqual(cached.status_code, 304)
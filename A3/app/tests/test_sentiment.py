@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+import sentiment
+from sentiment import LRUCache, Sentiment, SentimentCache, SingleFlight
+
+from tests.test_app import AppTestCase
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_expires(self):
+        cache = LRUCache(maxsize=2, ttl=0)
+        cache.put("a", 1)
+        time.sleep(0.001)
+        self.assertIsNone(cache.get("a"))
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_coalesces_concurrent_calls(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "done"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ["done", "done"])
+
+
+class TestSentimentCache(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+    def analyze(self, texts):
+        self.calls.append(list(texts))
+        return [None if t == "bad" else Sentiment("positive", 0.9, 0.05, 0.05) for t in texts]
+
+    def test_second_lookup_is_free(self):
+        cache = SentimentCache(self.pool.get)
+        first = cache.analyze(["a", "b", "a"], self.analyze)
+        second = cache.analyze(["a", "b"], self.analyze)
+
+        self.assertEqual(self.calls, [["a", "b"]])
+        self.assertEqual(first[0], first[2])
+        self.assertEqual(second, first[:2])
+        self.assertEqual(second[0].score, 0.9)
+
+    def test_persisted_across_instances(self):
+        SentimentCache(self.pool.get).analyze(["a"], self.analyze)
+        SentimentCache(self.pool.get).analyze(["a"], self.analyze)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_errors_are_not_cached(self):
+        cache = SentimentCache(self.pool.get)
+        self.assertEqual(cache.analyze(["bad"], self.analyze), [None])
+        cache.analyze(["bad"], self.analyze)
+        self.assertEqual(len(self.calls), 2)
+
+
+class FakeClient:
+    def __init__(self):
+        self.batches = []
+
+    def analyze_sentiment(self, texts, **kwargs):
+        self.batches.append(len(texts))
+        scores = SimpleNamespace(positive=0.7, neutral=0.2, negative=0.1)
+        return [
+            SimpleNamespace(is_error=t == "bad", sentiment=t, confidence_scores=scores)
+            for t in texts
+        ]
+
+
+class TestAnalyzeDocuments(unittest.TestCase):
+    def test_chunks_and_keeps_order(self):
+        client = FakeClient()
+        texts = [str(i) for i in range(25)] + ["bad"]
+        with ThreadPoolExecutor(4) as executor, mock.patch.object(
+            sentiment, "_process_state", return_value=(client, executor)
+        ):
+            results = sentiment.analyze_documents(texts)
+
+        self.assertEqual(sorted(client.batches), [6, 10, 10])
+        self.assertEqual([r.label for r in results[:-1]], texts[:-1])
+        self.assertIsNone(results[-1])
+
+
+class FakeAsyncClient(FakeClient):
+    async def analyze_sentiment(self, texts, **kwargs):
+        await asyncio.sleep(0)
+        return FakeClient.analyze_sentiment(self, texts)
+
+
+class TestAnalyzeDocumentsAsync(unittest.TestCase):
+    def test_chunks_and_keeps_order(self):
+        client = FakeAsyncClient()
+        texts = [str(i) for i in range(25)]
+        results = asyncio.run(sentiment.analyze_documents_async(client, texts))
+
+        self.assertEqual(sorted(client.batches), [5, 10, 10])
+        self.assertEqual([r.label for r in results], texts)
+
+
+if __name__ == "__main__":
+    unittest.main()
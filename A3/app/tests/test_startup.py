@@ -0,0 +1,20 @@
+import unittest
+
+import app as clco
+from benchmarks.bench_startup import LAZY, import_times
+
+from tests.test_app import AppTestCase
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_app_import_skips_lazy_packages(self):
+        eager = [name for name in import_times("app") if name.split(".")[0] in LAZY]
+        self.assertEqual(eager, [])
+
+
+class TestWarmUp(AppTestCase):
+    def test_opens_database_and_compiles_templates(self):
+        clco.warm_up()
+        self.assertEqual(len(self.pool), 1)
+        cached = [name for _, name in clco.app.jinja_env.cache.keys()]
+        self.assertIn("index.html", cached)
@@ -0,0 +1,114 @@
+import sqlite3
+import unittest
+
+import database
+
+from tests.test_app import AppTestCase
+
+
+class TestStats(AppTestCase):
+    def stats(self, **args):
+        return self.client.get("/stats", query_string=args)
+
+    def rollup(self, period, bucket):
+        return self.pool.get().execute(
+            "SELECT messages, analyzed, positive, neutral, negative FROM message_rollup"
+            " WHERE period = ? AND bucket = ?",
+            (period, bucket),
+        ).fetchone()
+
+    def test_counts_follow_inserts_and_sentiment(self):
+        conn = self.pool.get()
+        with conn:
+            conn.execute(
+                "INSERT INTO message (person, text, created)"
+                " VALUES ('Anna', 'pizza again', '2022-08-01 10:45:00')"
+            )
+        self.assertEqual(tuple(self.rollup("hour", "2022-08-01 10")), (2, 0, 0, 0, 0))
+
+        with conn:
+            conn.execute(
+                "UPDATE message SET sentiment = 'positive', positive = 0.8, neutral = 0.2,"
+                " negative = 0 WHERE person = 'Peter'"
+            )
+            conn.execute(
+                "UPDATE message SET sentiment = 'negative', positive = 0.1, neutral = 0.1,"
+                " negative = 0.8 WHERE person = 'Anna'"
+            )
+        messages, analyzed, positive, neutral, negative = self.rollup("day", "2022-08-01")
+        self.assertEqual((messages, analyzed), (2, 2))
+        self.assertAlmostEqual(positive, 0.9)
+        self.assertAlmostEqual(negative, 0.8)
+
+        # Archiving or deleting messages keeps their history.
+        with conn:
+            conn.execute("DELETE FROM message")
+        self.assertEqual(self.rollup("day", "2022-08-01")[0], 2)
+
+    def test_json_fills_empty_buckets(self):
+        conn = self.pool.get()
+        with conn:
+            conn.execute(
+                "UPDATE message SET sentiment = 'positive', positive = 0.8, neutral = 0.2,"
+                " negative = 0 WHERE person = 'Peter'"
+            )
+        resp = self.stats(period="hour", limit=3, end="2022-08-01T11:30")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json
+        self.assertEqual(data["period"], "hour")
+        self.assertEqual(
+            [b["bucket"] for b in data["buckets"]],
+            ["2022-08-01 09", "2022-08-01 10", "2022-08-01 11"],
+        )
+        self.assertEqual([b["messages"] for b in data["buckets"]], [0, 1, 0])
+        self.assertEqual(data["buckets"][1]["positive"], 0.8)
+        self.assertIsNone(data["buckets"][0]["positive"])
+
+        days = self.stats(period="day", limit=60, end="2022-08-01").json["buckets"]
+        self.assertEqual(len(days), 60)
+        self.assertEqual(sum(b["messages"] for b in days), 2)
+
+    def test_fragment_and_validation(self):
+        resp = self.client.get(
+            "/stats?period=day&limit=2&end=2022-06-07", headers={"HX-Request": "true"}
+        )
+        body = resp.get_data(as_text=True)
+        self.assertIn("<td>2022-06-07</td>", body)
+        self.assertIn("width: 100.0%", body)
+
+        etag = resp.headers["ETag"]
+        cached = self.client.get(
+            "/stats?period=day&limit=2&end=2022-06-07",
+            headers={"HX-Request": "true", "If-None-Match": etag},
+        )
+        self.assertEqual(cached.status_code, 304)
+        for r in (resp, cached, self.stats(period="day")):
+            self.assertIn("HX-Request", r.headers["Vary"])
+
+        self.assertEqual(self.stats(period="week").status_code, 400)
+        resp = self.stats(period="day", end="0001-01-05", limit=30)
+        self.assertEqual(resp.status_code, 400)
+
+
+class TestRollupMigration(unittest.TestCase):
+    def test_backfills_existing_messages(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        conn.execute(
+            "CREATE TABLE message (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " created TIMESTAMP NOT NULL, person TEXT NOT NULL, text TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO message (person, text, created) VALUES ('Tom', 'hi', ?)",
+            [("2022-06-07 20:31:17",), ("2022-06-07 21:00:00",)],
+        )
+        conn.commit()
+        database.migrate(conn)
+
+        rows = conn.execute(
+            "SELECT period, bucket, messages FROM message_rollup ORDER BY period, bucket"
+        ).fetchall()
+        self.assertEqual(
+            [tuple(r) for r in rows],
+            [("day", "2022-06-07", 2), ("hour", "2022-06-07 20", 1), ("hour", "2022-06-07 21", 1)],
+        )
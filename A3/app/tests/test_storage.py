@@ -0,0 +1,290 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import app as clco
+from database import ConnectionPool, GroupCommitWriter
+from jobs import SentimentQueue, SentimentWorker
+from sentiment import Sentiment
+from storage import (
+    CachedStorage,
+    MemoryStorage,
+    RecentMessages,
+    Record,
+    SQLiteStorage,
+    ShardedStorage,
+    open_storage,
+    shard_paths,
+)
+
+from tests.test_app import AppTestCase
+
+
+def create_database(path):
+    conn = sqlite3.connect(path)
+    with open("db/schema.sql") as f:
+        conn.executescript(f.read())
+    conn.close()
+
+
+class StorageContract:
+    """The behaviour every backend shares; subclasses set self.storage."""
+
+    def append(self, count):
+        """Ids of `count` new messages, in id order (not always write order when sharded)."""
+        return sorted(
+            self.storage.append(f"p{i}", f"message {i}", f"2023-01-01 00:00:{i:02}")
+            for i in range(count)
+        )
+
+    def test_pages_newest_first(self):
+        ids = self.append(7)
+        rows, has_more = self.storage.page(None, 3)
+        self.assertEqual([r["id"] for r in rows], ids[:-4:-1])
+        self.assertTrue(has_more)
+
+        rows, has_more = self.storage.page(ids[1], 3)
+        self.assertEqual([r["id"] for r in rows], [ids[0]])
+        self.assertFalse(has_more)
+
+    def test_scan_recent_and_since(self):
+        ids = self.append(7)
+        batches = list(self.storage.scan(ids[-1], batch_size=4))
+        self.assertEqual([len(b) for b in batches], [4, 2])
+        self.assertEqual([r["id"] for b in batches for r in b], ids[-2::-1])
+        self.assertEqual([r["id"] for r in self.storage.recent(2)], ids[:-3:-1])
+        self.assertEqual([r["id"] for r in self.storage.since(ids[4], 10)], ids[5:])
+        self.assertEqual(self.storage.last_id(), ids[-1])
+
+    def test_version_changes_with_writes(self):
+        before = self.storage.version()
+        self.append(1)
+        self.assertGreater(self.storage.version(), before)
+
+    def test_fetch_by_id(self):
+        ids = self.append(4)
+        rows = self.storage.fetch([ids[2], ids[0], ids[-1] + 1000])
+        self.assertEqual(sorted(r["id"] for r in rows), [ids[0], ids[2]])
+
+
+class TestMemoryStorage(StorageContract, unittest.TestCase):
+    def setUp(self):
+        self.storage = MemoryStorage()
+
+
+class SQLiteTestCase(unittest.TestCase):
+    shards = 1
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pools = []
+        for path in shard_paths(os.path.join(self.tmp.name, "database.db"), self.shards):
+            create_database(path)
+            self.pools.append(ConnectionPool(path))
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.close_all()
+        self.tmp.cleanup()
+
+
+class TestSQLiteStorage(StorageContract, SQLiteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.storage = SQLiteStorage(self.pools[0].get)
+
+    def test_queues_sentiment(self):
+        message_id = self.append(1)[0]
+        job = self.pools[0].get().execute("SELECT message_id FROM sentiment_job").fetchone()
+        self.assertEqual(job[0], message_id)
+
+
+class TestShardedStorage(StorageContract, SQLiteTestCase):
+    shards = 3
+
+    def setUp(self):
+        super().setUp()
+        self.storage = ShardedStorage(
+            [SQLiteStorage(pool.get, stride=3, offset=i) for i, pool in enumerate(self.pools)]
+        )
+
+    def test_spreads_writes(self):
+        ids = self.append(30)
+        counts = [
+            pool.get().execute("SELECT COUNT(*) FROM message").fetchone()[0]
+            for pool in self.pools
+        ]
+        self.assertEqual(sum(counts), 30)
+        self.assertTrue(all(counts))
+        for i, pool in enumerate(self.pools):
+            stored = [row[0] for row in pool.get().execute("SELECT id FROM message")]
+            self.assertTrue(all(message_id % 3 == i for message_id in stored))
+        self.assertEqual(len(set(ids)), 30)
+
+    def test_one_worker_drains_every_shard(self):
+        self.append(6)
+        queues = [SentimentQueue(pool.get) for pool in self.pools]
+        worker = SentimentWorker(
+            queues, lambda texts: [Sentiment("neutral", 0.1, 0.8, 0.1) for _ in texts]
+        )
+        self.assertEqual(worker.run_once(), 6)
+        for pool in self.pools:
+            pending = pool.get().execute(
+                "SELECT COUNT(*) FROM message WHERE sentiment IS NULL"
+            ).fetchone()[0]
+            self.assertEqual(pending, 0)
+
+    def test_open_requires_shard_files(self):
+        path = os.path.join(self.tmp.name, "other.db")
+        with self.assertRaises(FileNotFoundError):
+            open_storage("sharded:2", SQLiteStorage(self.pools[0].get), path)
+        with self.assertRaises(ValueError):
+            open_storage("sharded", SQLiteStorage(self.pools[0].get), path)
+
+
+class TestRecentMessages(unittest.TestCase):
+    def test_overwrites_oldest(self):
+        ring = RecentMessages(3)
+        for message_id in range(1, 6):
+            ring.add(Record(message_id, "", "", "", None, None, None, None))
+        self.assertEqual([r["id"] for r in ring.before(None, 10)], [5, 4, 3])
+        self.assertEqual([r["id"] for r in ring.before(5, 1)], [4])
+        self.assertEqual([r["id"] for r in ring.after(3, 10)], [4, 5])
+        self.assertEqual((ring.oldest_id(), ring.newest_id()), (3, 5))
+
+    def test_replace_keeps_order(self):
+        ring = RecentMessages(3)
+        for message_id in range(1, 5):
+            ring.add(Record(message_id, "", "", "", None, None, None, None))
+        ring.replace(Record(3, "", "", "", "positive", 0.9, 0.05, 0.05))
+        ring.replace(Record(1, "", "", "", "positive", 0.9, 0.05, 0.05))
+        self.assertEqual([r["sentiment"] for r in ring.before(None, 10)], [None, "positive", None])
+
+
+class TestCachedStorage(StorageContract, SQLiteTestCase):
+    def setUp(self):
+        super().setUp()
+        # Smaller than some of the contract's reads, which then fall through.
+        self.storage = CachedStorage(SQLiteStorage(self.pools[0].get), 4)
+
+    def trace(self):
+        statements = []
+        self.pools[0].get().set_trace_callback(statements.append)
+        return statements
+
+    def test_hot_reads_skip_the_database(self):
+        ids = self.append(3)
+        self.storage.recent(2)
+        new_id = self.storage.append("p", "written through", "2023-01-01 00:01:00")
+
+        statements = self.trace()
+        self.assertEqual([r["id"] for r in self.storage.recent(4)], [new_id] + ids[::-1])
+        rows, has_more = self.storage.page(ids[-1], 10)
+        self.assertEqual(([r["id"] for r in rows], has_more), (ids[-2::-1], False))
+        self.assertEqual(self.storage.last_id(), new_id)
+        self.storage.version()
+        self.assertEqual(set(statements), {"PRAGMA data_version"})
+
+    def test_sees_other_writers(self):
+        self.append(2)
+        self.storage.recent(2)
+        other = ConnectionPool(self.pools[0].path)
+        self.addCleanup(other.close_all)
+        conn = other.get()
+        conn.execute("UPDATE message SET sentiment = 'positive'")
+        conn.commit()
+        self.assertEqual([r["sentiment"] for r in self.storage.recent(2)], ["positive"] * 2)
+
+        other_id = SQLiteStorage(other.get).append("q", "from another worker", "x")
+        self.assertEqual(self.storage.recent(1)[0]["id"], other_id)
+        self.assertEqual(self.storage.since(other_id - 1, 10)[0]["text"], "from another worker")
+
+    def other_connection(self):
+        other = ConnectionPool(self.pools[0].path)
+        self.addCleanup(other.close_all)
+        return other
+
+    def refills(self, statements):
+        return [s for s in statements if "ORDER BY id DESC" in s]
+
+    def test_catches_up_without_refill(self):
+        ids = self.append(3)
+        self.storage.recent(3)
+        other = self.other_connection()
+        conn = other.get()
+        conn.execute("UPDATE message SET sentiment = 'positive' WHERE id = ?", (ids[1],))
+        conn.commit()
+        # Two rows in one transaction, as a group commit writes them; one
+        # is analyzed before this worker looks again.
+        new_ids = [SQLiteStorage(other.get).append("q", f"other {i}", "x") for i in range(2)]
+        conn.execute("UPDATE message SET sentiment = 'neutral' WHERE id = ?", (new_ids[0],))
+        conn.commit()
+
+        statements = self.trace()
+        rows = self.storage.recent(4)
+        self.assertEqual([r["id"] for r in rows], new_ids[::-1] + ids[:0:-1])
+        self.assertEqual(
+            [r["sentiment"] for r in rows], [None, "neutral", None, "positive"]
+        )
+        self.assertEqual(self.refills(statements), [])
+
+    def test_unaccounted_change_refills(self):
+        ids = self.append(3)
+        self.storage.recent(3)
+        conn = self.other_connection().get()
+        conn.execute("DELETE FROM message WHERE id = ?", (ids[1],))
+        conn.commit()
+
+        statements = self.trace()
+        self.assertEqual([r["id"] for r in self.storage.recent(3)], [ids[2], ids[0]])
+        self.assertNotEqual(self.refills(statements), [])
+
+    def test_group_commit_append_catches_up(self):
+        writer = GroupCommitWriter(self.pools[0].get, max_batch=8, max_delay=0.05)
+        self.addCleanup(writer.close)
+        self.storage = CachedStorage(SQLiteStorage(self.pools[0].get, writer), 8)
+        self.append(1)
+        self.storage.recent(1)
+        with ThreadPoolExecutor(4) as pool:
+            new_ids = sorted(pool.map(lambda i: self.storage.append("g", str(i), "x"), range(4)))
+
+        statements = self.trace()
+        self.assertEqual([r["id"] for r in self.storage.recent(4)], new_ids[::-1])
+        self.assertEqual(self.refills(statements), [])
+
+
+class TestShardedRoutes(AppTestCase):
+    def setUp(self):
+        super().setUp()
+        path = os.path.join(self.tmp.name, "database-1.db")
+        create_database(path)
+        self.shard = ConnectionPool(path)
+        storage = ShardedStorage(
+            [
+                SQLiteStorage(clco.get_db_connection, stride=2),
+                SQLiteStorage(self.shard.get, stride=2, offset=1),
+            ]
+        )
+        self.patch = mock.patch.object(clco, "storage", storage)
+        self.patch.start()
+        for i in range(6):
+            storage.append(f"p{i}", f"pizza {i}", f"2022-08-0{i + 2} 10:00:00")
+
+    def tearDown(self):
+        self.patch.stop()
+        self.shard.close_all()
+        super().tearDown()
+
+    def test_search_and_stats_cover_every_shard(self):
+        body = self.client.get("/search?q=pizza&limit=20").get_data(as_text=True)
+        self.assertEqual(sum(f"pizza {i}<" in body for i in range(6)), 6)
+
+        stats = self.client.get("/stats?period=day&end=2022-08-07&limit=7").json["buckets"]
+        self.assertEqual([b["messages"] for b in stats], [1, 1, 1, 1, 1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()